@@ -0,0 +1,26 @@
+"""add copyright job stage states
+
+Revision ID: 2b7e9c4d5a1f
+Revises: 8d2e4a6c1f3b
+Create Date: 2026-10-16 23:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2b7e9c4d5a1f"
+down_revision: Union[str, Sequence[str], None] = "8d2e4a6c1f3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("copyright_jobs", sa.Column("stage_states", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("copyright_jobs", "stage_states")
@@ -0,0 +1,54 @@
+"""add copyright job queue fields
+
+Revision ID: 5e1a7f3c9b2d
+Revises: 2b7e9c4d5a1f
+Create Date: 2026-10-17 00:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1a7f3c9b2d"
+down_revision: Union[str, Sequence[str], None] = "2b7e9c4d5a1f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "copyright_jobs",
+        sa.Column("use_cache", sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.add_column(
+        "copyright_jobs",
+        sa.Column("resume", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.add_column(
+        "copyright_jobs",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("copyright_jobs", sa.Column("worker_id", sa.String(length=100), nullable=True))
+    op.add_column("copyright_jobs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+    op.add_column("copyright_jobs", sa.Column("started_at", sa.DateTime(), nullable=True))
+    op.add_column("copyright_jobs", sa.Column("finished_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_copyright_jobs_status_created_at",
+        "copyright_jobs",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_copyright_jobs_status_created_at", table_name="copyright_jobs")
+    op.drop_column("copyright_jobs", "finished_at")
+    op.drop_column("copyright_jobs", "started_at")
+    op.drop_column("copyright_jobs", "heartbeat_at")
+    op.drop_column("copyright_jobs", "worker_id")
+    op.drop_column("copyright_jobs", "attempts")
+    op.drop_column("copyright_jobs", "resume")
+    op.drop_column("copyright_jobs", "use_cache")
@@ -0,0 +1,43 @@
+"""add chat summaries and message keyset index
+
+Revision ID: 8d2e4a6c1f3b
+Revises: 6c8f6f1b8b2f
+Create Date: 2026-10-16 21:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e4a6c1f3b"
+down_revision: Union[str, Sequence[str], None] = "6c8f6f1b8b2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_messages_user_id_id", "messages", ["user_id", "id"], unique=False)
+
+    op.create_table(
+        "chat_summaries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("last_message_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_chat_summaries_id"), "chat_summaries", ["id"], unique=False)
+    op.create_index(op.f("ix_chat_summaries_user_id"), "chat_summaries", ["user_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_chat_summaries_user_id"), table_name="chat_summaries")
+    op.drop_index(op.f("ix_chat_summaries_id"), table_name="chat_summaries")
+    op.drop_table("chat_summaries")
+    op.drop_index("ix_messages_user_id_id", table_name="messages")
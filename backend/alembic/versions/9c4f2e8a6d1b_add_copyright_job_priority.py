@@ -0,0 +1,29 @@
+"""add copyright job priority
+
+Revision ID: 9c4f2e8a6d1b
+Revises: 5e1a7f3c9b2d
+Create Date: 2026-10-17 01:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4f2e8a6d1b"
+down_revision: Union[str, Sequence[str], None] = "5e1a7f3c9b2d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "copyright_jobs",
+        sa.Column("priority", sa.String(length=20), nullable=False, server_default="interactive"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("copyright_jobs", "priority")
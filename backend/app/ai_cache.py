@@ -0,0 +1,216 @@
+"""
+AI 生成结果缓存 - 内存 LRU + 磁盘持久化两级缓存
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import (
+    AI_CACHE_DISK_MAX_MB,
+    AI_CACHE_ENABLED,
+    AI_CACHE_MEMORY_ENTRIES,
+    AI_CACHE_TTL_SECONDS,
+)
+from .utils.paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def build_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> str:
+    """
+    计算请求的内容哈希
+
+    base_url 也参与计算，避免不同服务商的同名模型互相命中；API Key 的摘要参与计算，
+    缓存只在同一 Key 内复用，Key 无效、被吊销或额度用尽的用户不会拿到其他用户的结果。
+    """
+    payload = {
+        "base_url": (base_url or "").rstrip("/"),
+        "api_key": hashlib.sha256((api_key or "").encode("utf-8")).hexdigest(),
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "response_format": response_format,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """按内容哈希缓存 AI 补全结果"""
+
+    def __init__(
+        self,
+        directory: Path,
+        memory_entries: int,
+        ttl_seconds: int,
+        disk_max_bytes: int,
+    ):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        self.stats: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "writes": 0,
+            "evictions": 0,
+            "rejected": 0,
+        }
+
+    def _expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self.ttl_seconds
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, created_at: float, content: str) -> None:
+        self._memory[key] = (created_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> Optional[tuple[float, str]]:
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            created_at = float(data["created_at"])
+            content = data["content"]
+        except Exception:
+            logger.warning("缓存文件损坏，已忽略: %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+        if self._expired(created_at):
+            path.unlink(missing_ok=True)
+            return None
+        return created_at, content
+
+    def _disk_set(self, key: str, created_at: float, content: str, model: str) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw = json.dumps(
+            {"created_at": created_at, "model": model, "content": content},
+            ensure_ascii=False,
+        )
+        # 覆盖已有文件时只累计大小差值
+        try:
+            old_size = path.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+        path.write_text(raw, encoding="utf-8")
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(p.stat().st_size for p in self.directory.rglob("*.json"))
+        else:
+            self._disk_bytes += len(raw.encode("utf-8")) - old_size
+        if self._disk_bytes > self.disk_max_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """删除过期文件，仍超限时按修改时间从旧到新淘汰至上限的 90%"""
+        files = []
+        for path in self.directory.rglob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.disk_max_bytes * 0.9)
+        now = time.time()
+        for mtime, size, path in files:
+            if total <= target and now - mtime <= self.ttl_seconds:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats["evictions"] += 1
+        self._disk_bytes = total
+
+    async def get(self, key: str) -> Optional[str]:
+        cached = self._memory.get(key)
+        if cached is not None:
+            created_at, content = cached
+            if not self._expired(created_at):
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return content
+            self._memory.pop(key, None)
+
+        cached = await asyncio.to_thread(self._disk_get, key)
+        if cached is None:
+            self.stats["misses"] += 1
+            return None
+        created_at, content = cached
+        self._remember(key, created_at, content)
+        self.stats["disk_hits"] += 1
+        return content
+
+    async def set(self, key: str, content: str, model: str = "") -> None:
+        created_at = time.time()
+        self._remember(key, created_at, content)
+        self.stats["writes"] += 1
+        try:
+            await asyncio.to_thread(self._disk_set, key, created_at, content, model)
+        except Exception:
+            logger.warning("写入磁盘缓存失败", exc_info=True)
+
+    def _disk_delete(self, key: str) -> None:
+        path = self._path_for(key)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return
+        path.unlink(missing_ok=True)
+        if self._disk_bytes is not None:
+            self._disk_bytes = max(self._disk_bytes - size, 0)
+
+    async def delete(self, key: str) -> None:
+        """删除缓存条目（调用方校验缓存内容不合格时使用）"""
+        self._memory.pop(key, None)
+        self.stats["rejected"] += 1
+        try:
+            await asyncio.to_thread(self._disk_delete, key)
+        except Exception:
+            logger.warning("删除磁盘缓存失败", exc_info=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        return {
+            **self.stats,
+            "enabled": AI_CACHE_ENABLED,
+            "memory_size": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+completion_cache = CompletionCache(
+    directory=CACHE_DIR / "completions",
+    memory_entries=AI_CACHE_MEMORY_ENTRIES,
+    ttl_seconds=AI_CACHE_TTL_SECONDS,
+    disk_max_bytes=AI_CACHE_DISK_MAX_MB * 1024 * 1024,
+)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    return completion_cache.get_stats()
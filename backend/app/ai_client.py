@@ -0,0 +1,500 @@
+"""
+AI 客户端模块 - 按 (api_key, base_url) 复用 AsyncOpenAI 客户端，统一对话补全调用
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import openai
+
+from .ai_cache import build_cache_key, completion_cache
+from .ai_errors import is_rate_limit_error
+from .ai_limiter import ai_call_slot
+from .ai_metrics import record_ai_call
+from .ai_retry import DEFAULT_RETRY_POLICY, RetryPolicy, RetryState, call_with_retry
+from .config import (
+    AI_CACHE_ENABLED,
+    AI_CLIENT_IDLE_TTL,
+    AI_CLIENT_MAX_ENTRIES,
+    AI_HTTP_CONNECT_TIMEOUT,
+    AI_HTTP_KEEPALIVE_EXPIRY,
+    AI_HTTP_MAX_CONNECTIONS,
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    AI_HTTP_READ_TIMEOUT,
+    AI_STREAM_INCLUDE_USAGE,
+)
+from .utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ClientEntry:
+    client: openai.AsyncOpenAI
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    # 正在使用该客户端的调用数，大于 0 时不会被淘汰关闭
+    leases: int = 0
+    # 已从注册表移除，最后一个租用结束时关闭
+    retired: bool = False
+
+
+_clients: "OrderedDict[Tuple[str, str], _ClientEntry]" = OrderedDict()
+# 按客户端对象查找注册表条目（租用时使用）
+_entries_by_client: Dict[int, _ClientEntry] = {}
+# 后台 worker 可能在其他线程的事件循环中使用注册表
+_lock = threading.Lock()
+
+
+def _registry_key(api_key: str, base_url: str) -> Tuple[str, str]:
+    """API Key 只以摘要形式出现在注册表中"""
+    key_digest = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+    return key_digest, (base_url or "").strip().rstrip("/")
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    return openai.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=AI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=AI_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            AI_HTTP_READ_TIMEOUT,
+            connect=AI_HTTP_CONNECT_TIMEOUT,
+        ),
+    )
+
+
+def _schedule_close(entries: List[_ClientEntry]) -> None:
+    """
+    在客户端所属的事件循环上关闭客户端
+
+    所属事件循环已关闭时无法再关闭连接池，交给 GC 回收。
+    """
+    try:
+        running: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    for entry in entries:
+        _entries_by_client.pop(id(entry.client), None)
+        loop = entry.loop or running
+        if loop is None or loop.is_closed():
+            continue
+        if loop is running:
+            loop.create_task(entry.client.close())
+        else:
+            asyncio.run_coroutine_threadsafe(entry.client.close(), loop)
+
+
+def _retire(key: Tuple[str, str]) -> List[_ClientEntry]:
+    """从注册表移除客户端，返回可立即关闭的条目（租用中的在租用结束时关闭）"""
+    entry = _clients.pop(key)
+    entry.retired = True
+    return [entry] if entry.leases == 0 else []
+
+
+def _evict_idle(now: float) -> List[_ClientEntry]:
+    """淘汰空闲超时与超出容量的客户端，租用中的客户端不淘汰"""
+    evicted: List[_ClientEntry] = []
+    for key in list(_clients.keys()):
+        entry = _clients[key]
+        if entry.leases == 0 and now - entry.last_used_at > AI_CLIENT_IDLE_TTL:
+            evicted.extend(_retire(key))
+    overflow = len(_clients) - AI_CLIENT_MAX_ENTRIES
+    for key in [k for k, entry in _clients.items() if entry.leases == 0][:max(overflow, 0)]:
+        evicted.extend(_retire(key))
+    return evicted
+
+
+def get_async_client(api_key: str, base_url: str) -> openai.AsyncOpenAI:
+    """
+    获取进程内共享的 AsyncOpenAI 客户端
+
+    同一 (api_key, base_url) 复用同一个 httpx 连接池，连续生成可直接使用已建立的
+    keep-alive 连接；长时间未使用或超出容量的客户端会被淘汰并关闭。
+
+    Args:
+        api_key: AI API Key
+        base_url: AI API Base URL
+
+    Returns:
+        AsyncOpenAI 客户端
+    """
+    now = time.monotonic()
+    key = _registry_key(api_key, base_url)
+    try:
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    closing: List[_ClientEntry] = []
+    with _lock:
+        entry = _clients.get(key)
+        if entry is not None and entry.loop is not None and loop is not None and entry.loop is not loop:
+            # 连接池绑定创建时的事件循环，不能跨循环复用；旧客户端在其所属循环上关闭
+            closing.extend(_retire(key))
+            entry = None
+        if entry is None:
+            entry = _ClientEntry(
+                loop=loop,
+                client=openai.AsyncOpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    http_client=_build_http_client(),
+                    # 429 与瞬时错误由统一重试策略处理，避免 SDK 在限流器之外重试
+                    max_retries=0,
+                )
+            )
+            _clients[key] = entry
+            _entries_by_client[id(entry.client)] = entry
+            logger.info("创建 AI 客户端: %s（当前 %d 个）", key[1], len(_clients))
+        entry.last_used_at = now
+        _clients.move_to_end(key)
+        closing.extend(_evict_idle(now))
+        _schedule_close(closing)
+    return entry.client
+
+
+@contextmanager
+def lease_client(client: openai.AsyncOpenAI) -> Iterator[openai.AsyncOpenAI]:
+    """
+    租用客户端：租用期间不会因空闲超时或超出容量被淘汰关闭
+
+    模型调用期间自动租用；在整个任务中持有同一客户端的调用方（如软著生成）
+    应在任务期间租用，避免两次调用之间客户端被淘汰。
+    """
+    with _lock:
+        entry = _entries_by_client.get(id(client))
+        if entry is not None:
+            entry.leases += 1
+    try:
+        yield client
+    finally:
+        if entry is not None:
+            with _lock:
+                entry.leases -= 1
+                entry.last_used_at = time.monotonic()
+                if entry.retired and entry.leases == 0:
+                    _schedule_close([entry])
+
+
+def get_client_registry_stats() -> Dict[str, object]:
+    """客户端缓存的汇总统计（不含各用户配置的服务商地址）"""
+    now = time.monotonic()
+    with _lock:
+        entries = list(_clients.values())
+    return {
+        "clients": len(entries),
+        "max_entries": AI_CLIENT_MAX_ENTRIES,
+        "idle_ttl_seconds": AI_CLIENT_IDLE_TTL,
+        "leased_clients": sum(1 for entry in entries if entry.leases),
+        "leases": sum(entry.leases for entry in entries),
+        "max_age_seconds": round(max((now - entry.created_at for entry in entries), default=0.0), 1),
+        "max_idle_seconds": round(max((now - entry.last_used_at for entry in entries), default=0.0), 1),
+    }
+
+
+async def close_all_clients() -> None:
+    """关闭全部客户端（应用关闭时调用）"""
+    with _lock:
+        entries = list(_clients.values())
+        _clients.clear()
+        _entries_by_client.clear()
+    for entry in entries:
+        try:
+            await entry.client.close()
+        except Exception:
+            logger.warning("关闭 AI 客户端失败", exc_info=True)
+
+
+def _build_completion_key(
+    client: openai.AsyncOpenAI,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float],
+    response_format: Optional[Dict[str, Any]],
+) -> Optional[str]:
+    if not AI_CACHE_ENABLED:
+        return None
+    return build_cache_key(
+        model,
+        messages,
+        temperature=temperature,
+        response_format=response_format,
+        base_url=str(client.base_url),
+        api_key=client.api_key,
+    )
+
+
+async def _read_cache(
+    cache_key: str, cache_validator: Optional[Callable[[str], bool]]
+) -> Optional[str]:
+    """读取缓存；内容未通过校验（如旧版本写入的不完整结果）时删除并视为未命中"""
+    cached = await completion_cache.get(cache_key)
+    if cached is None:
+        return None
+    if cache_validator is not None and not cache_validator(cached):
+        logger.info("AI 生成缓存内容未通过校验，已删除: key=%s", cache_key[:12])
+        await completion_cache.delete(cache_key)
+        return None
+    return cached
+
+
+async def _write_cache(
+    cache_key: str,
+    content: str,
+    model: str,
+    cache_validator: Optional[Callable[[str], bool]],
+) -> None:
+    if cache_validator is not None and not cache_validator(content):
+        completion_cache.stats["rejected"] += 1
+        return
+    await completion_cache.set(cache_key, content, model=model)
+
+
+def _build_completion_params(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float],
+    response_format: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"model": model, "messages": messages}
+    if temperature is not None:
+        params["temperature"] = temperature
+    if response_format is not None:
+        params["response_format"] = response_format
+    return params
+
+
+def _outcome_of(error: BaseException) -> str:
+    if not isinstance(error, Exception):
+        return "cancelled"
+    return "rate_limited" if is_rate_limit_error(error) else "error"
+
+
+def _messages_tokens(messages: List[Dict[str, Any]]) -> int:
+    return sum(
+        estimate_tokens(message.get("content") if isinstance(message.get("content"), str) else "")
+        for message in messages
+    )
+
+
+def _record_call(
+    client: openai.AsyncOpenAI,
+    params: Dict[str, Any],
+    call_site: str,
+    outcome: str,
+    started_at: float,
+    *,
+    ttft: Optional[float] = None,
+    usage: Any = None,
+    content: str = "",
+    stream: bool = False,
+    error: Optional[BaseException] = None,
+) -> None:
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    usage_estimated = False
+    if outcome == "success" and (prompt_tokens is None or completion_tokens is None):
+        # 服务商未返回 usage（流式默认不返回）时按文本粗略估算
+        prompt_tokens = _messages_tokens(params.get("messages") or [])
+        completion_tokens = estimate_tokens(content)
+        usage_estimated = True
+    record_ai_call(
+        call_site=call_site,
+        model=params.get("model") or "",
+        base_url=str(client.base_url),
+        outcome=outcome,
+        latency=time.monotonic() - started_at,
+        ttft=ttft,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        usage_estimated=usage_estimated,
+        stream=stream,
+        error=error,
+    )
+
+
+async def iter_chat_chunks(
+    client: openai.AsyncOpenAI,
+    params: Dict[str, Any],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    call_site: str = "unknown",
+) -> AsyncGenerator[Any, None]:
+    """
+    在限流器额度内发起流式补全，逐个产出原始 chunk
+
+    收到第一段内容之前的失败按重试策略重试；之后的失败直接抛出，
+    避免调用方收到重复内容。整个接收过程占用一个并发额度。
+    每次尝试都会按 call_site 记录耗时、首字延迟与 token 用量。
+    """
+    state = RetryState(policy, label=f"AI[{params.get('model')}]")
+    request_params = dict(params)
+    if AI_STREAM_INCLUDE_USAGE:
+        request_params["stream_options"] = {"include_usage": True}
+    has_content = False
+    with lease_client(client):
+        while True:
+            state.begin_attempt()
+            try:
+                async with ai_call_slot(str(client.base_url), client.api_key):
+                    started_at = time.monotonic()
+                    ttft: Optional[float] = None
+                    usage = None
+                    received: List[str] = []
+                    try:
+                        stream = await client.chat.completions.create(stream=True, **request_params)
+                        async for chunk in stream:
+                            if getattr(chunk, "usage", None) is not None:
+                                usage = chunk.usage
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                if ttft is None:
+                                    ttft = time.monotonic() - started_at
+                                has_content = True
+                                received.append(chunk.choices[0].delta.content)
+                            yield chunk
+                    except BaseException as exc:
+                        _record_call(
+                            client, params, call_site, _outcome_of(exc), started_at,
+                            ttft=ttft, stream=True, error=exc,
+                        )
+                        raise
+                    _record_call(
+                        client, params, call_site, "success", started_at,
+                        ttft=ttft, usage=usage, content="".join(received), stream=True,
+                    )
+                state.succeeded()
+                return
+            except Exception as exc:
+                if has_content:
+                    raise
+                await state.handle_failure(exc)
+
+
+async def complete_chat(
+    client: openai.AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    call_site: str = "unknown",
+    cache_validator: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """
+    非流式调用对话补全并返回文本内容
+
+    相同 (base_url, model, messages, temperature, response_format) 的请求优先从
+    生成缓存返回；use_cache=False 时跳过读取，但仍会写入最新结果。
+    限流、超时、5xx 等瞬时错误按 retry_policy 退避重试。
+
+    Args:
+        call_site: 调用场景标识，用于指标统计（如 lesson_plan、copyright.frontend）
+        cache_validator: 回复校验函数，只有校验通过的回复才写入缓存，
+            命中的缓存未通过校验时删除并重新请求（如 JSON 无法解析、HTML 不完整）
+
+    Returns:
+        去除首尾空白的回复文本（无内容时返回空字符串）
+    """
+    cache_key = _build_completion_key(client, model, messages, temperature, response_format)
+    if cache_key:
+        if use_cache:
+            cached = await _read_cache(cache_key, cache_validator)
+            if cached is not None:
+                logger.info("AI 生成缓存命中: model=%s key=%s", model, cache_key[:12])
+                record_ai_call(
+                    call_site=call_site, model=model, base_url=str(client.base_url),
+                    outcome="cache_hit", latency=0.0,
+                )
+                return cached
+        else:
+            completion_cache.stats["bypassed"] += 1
+
+    params = _build_completion_params(model, messages, temperature, response_format)
+
+    async def _create() -> Any:
+        async with ai_call_slot(str(client.base_url), client.api_key):
+            started_at = time.monotonic()
+            try:
+                response = await client.chat.completions.create(**params)
+            except BaseException as exc:
+                _record_call(client, params, call_site, _outcome_of(exc), started_at, error=exc)
+                raise
+            content = (response.choices[0].message.content or "") if response.choices else ""
+            _record_call(
+                client, params, call_site, "success", started_at,
+                usage=getattr(response, "usage", None), content=content,
+            )
+            return response
+
+    with lease_client(client):
+        response = await call_with_retry(_create, policy=retry_policy, label=f"AI[{model}]")
+
+    if not response.choices:
+        return ""
+    content = (response.choices[0].message.content or "").strip()
+
+    if cache_key and content:
+        await _write_cache(cache_key, content, model, cache_validator)
+    return content
+
+
+async def stream_chat(
+    client: openai.AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    call_site: str = "unknown",
+    cache_validator: Optional[Callable[[str], bool]] = None,
+) -> AsyncGenerator[str, None]:
+    """
+    流式调用对话补全，逐段产出文本
+
+    与 complete_chat 共用生成缓存：命中时一次性产出缓存内容，
+    完整接收且通过 cache_validator 校验后写入缓存。开始输出内容之前的
+    瞬时错误按 retry_policy 重试。
+    """
+    cache_key = _build_completion_key(client, model, messages, temperature, response_format)
+    if cache_key:
+        if use_cache:
+            cached = await _read_cache(cache_key, cache_validator)
+            if cached is not None:
+                logger.info("AI 生成缓存命中: model=%s key=%s", model, cache_key[:12])
+                record_ai_call(
+                    call_site=call_site, model=model, base_url=str(client.base_url),
+                    outcome="cache_hit", latency=0.0, stream=True,
+                )
+                yield cached
+                return
+        else:
+            completion_cache.stats["bypassed"] += 1
+
+    params = _build_completion_params(model, messages, temperature, response_format)
+    parts: List[str] = []
+    async for chunk in iter_chat_chunks(client, params, policy=retry_policy, call_site=call_site):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield delta
+
+    content = "".join(parts).strip()
+    if cache_key and content:
+        await _write_cache(cache_key, content, model, cache_validator)
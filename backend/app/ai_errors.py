@@ -0,0 +1,104 @@
+"""
+AI 调用错误识别 - 限流/可重试判断与 Retry-After 解析
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+
+import httpx
+import openai
+
+
+def collect_error_text(error: Exception) -> str:
+    parts: List[str] = [str(error), repr(error)]
+    body = getattr(error, "body", None)
+    if body is not None:
+        if isinstance(body, (dict, list)):
+            parts.append(json.dumps(body, ensure_ascii=False))
+        else:
+            parts.append(str(body))
+    return " ".join(part for part in parts if part).strip()
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    if hasattr(openai, "RateLimitError") and isinstance(error, openai.RateLimitError):
+        return True
+    if get_status_code(error) == 429:
+        return True
+    message = collect_error_text(error).lower()
+    if "rate limit" in message or "too many requests" in message or "429" in message:
+        return True
+    return False
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    从错误响应头解析服务端要求的等待秒数
+
+    支持 retry-after-ms、retry-after（秒数或 HTTP 日期），无法解析时返回 None。
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    raw_ms = headers.get("retry-after-ms")
+    if raw_ms:
+        try:
+            return max(0.0, float(raw_ms) / 1000)
+        except ValueError:
+            pass
+
+    raw = headers.get("retry-after")
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    判断错误是否为可重试的瞬时错误
+
+    限流、连接失败、超时、5xx 以及服务端返回非 JSON 响应体视为可重试；
+    鉴权失败、参数错误等 4xx 直接失败。
+    """
+    if is_rate_limit_error(error):
+        return True
+    if isinstance(
+        error,
+        (
+            openai.APIConnectionError,
+            openai.InternalServerError,
+            httpx.TransportError,
+            asyncio.TimeoutError,
+            json.JSONDecodeError,
+        ),
+    ):
+        return True
+    status_code = get_status_code(error)
+    if status_code is not None:
+        return status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+    return False
@@ -0,0 +1,247 @@
+"""
+AI 调用限流 - 按服务商（Base URL 与 API Key，AI_LIMITER_PER_KEY 关闭时只按 Base URL）的令牌桶 + AIMD 并发控制
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from .ai_errors import get_retry_after, is_rate_limit_error
+from .config import (
+    AI_LIMITER_BURST,
+    AI_LIMITER_INITIAL_CONCURRENCY,
+    AI_LIMITER_MAX_CONCURRENCY,
+    AI_LIMITER_MIN_CONCURRENCY,
+    AI_LIMITER_PER_KEY,
+    AI_LIMITER_RATE_PER_SECOND,
+    AI_RATE_LIMIT_DEFAULT_BACKOFF,
+    AI_RATE_LIMIT_MAX_BACKOFF,
+)
+
+logger = logging.getLogger(__name__)
+
+# 等待期间的最长单次休眠，保证限额变化能被及时感知
+_MAX_WAIT_SLICE = 1.0
+
+
+class ProviderLimiter:
+    """
+    单个服务商的限流器
+
+    - 令牌桶限制请求速率（rate 个/秒，最多积攒 burst 个）
+    - 并发上限按 AIMD 调整：遇到 429 减半并按 Retry-After 暂停放行，
+      连续成功达到当前上限次数后加一
+    - 额度不足时排队等待，而不是直接失败
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int,
+        initial_concurrency: int,
+        min_concurrency: int,
+        max_concurrency: int,
+    ):
+        self.name = name
+        self.rate = max(rate, 0.01)
+        self.burst = max(burst, 1)
+        self.min_concurrency = max(min_concurrency, 1)
+        self.max_concurrency = max(max_concurrency, self.min_concurrency)
+        self.concurrency = float(
+            min(max(initial_concurrency, self.min_concurrency), self.max_concurrency)
+        )
+        self.tokens = float(self.burst)
+        self.in_flight = 0
+        self.waiting = 0
+        self.blocked_until = 0.0
+        self._updated_at = time.monotonic()
+        self._success_streak = 0
+        self._released = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats: Dict[str, float] = {
+            "acquired": 0,
+            "rate_limited": 0,
+            "errors": 0,
+            "wait_seconds_total": 0.0,
+        }
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def _bind_loop(self) -> None:
+        """asyncio.Event 绑定首次使用的事件循环，换循环（如独立 worker、脚本多次 asyncio.run）时重建"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._released = asyncio.Event()
+            self.in_flight = 0
+
+    async def acquire(self) -> None:
+        self._bind_loop()
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.in_flight < int(self.concurrency):
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        self.in_flight += 1
+                        break
+                    delay = (1 - self.tokens) / self.rate
+                else:
+                    delay = max(self.blocked_until - now, 0.0) or _MAX_WAIT_SLICE
+
+                self._released.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._released.wait(),
+                        timeout=min(max(delay, 0.01), _MAX_WAIT_SLICE),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - started
+        self.stats["acquired"] += 1
+        self.stats["wait_seconds_total"] += waited
+        if waited > 1:
+            logger.info("AI 调用排队 %.1fs: %s", waited, self.name)
+
+    def release(self, outcome: str, retry_after: Optional[float] = None) -> None:
+        """
+        归还并发额度并调整上限
+
+        Args:
+            outcome: success / rate_limited / error / cancelled
+            retry_after: 服务端要求的等待秒数（仅 rate_limited 时使用）
+        """
+        self.in_flight = max(self.in_flight - 1, 0)
+        now = time.monotonic()
+
+        if outcome == "rate_limited":
+            self.stats["rate_limited"] += 1
+            self._success_streak = 0
+            self.concurrency = max(float(self.min_concurrency), self.concurrency / 2)
+            backoff = retry_after if retry_after is not None else AI_RATE_LIMIT_DEFAULT_BACKOFF
+            backoff = min(backoff, AI_RATE_LIMIT_MAX_BACKOFF)
+            self.blocked_until = max(self.blocked_until, now + backoff)
+            # 暂停期间不积攒令牌，恢复后逐步放行
+            self.tokens = min(self.tokens, 1.0)
+            logger.warning(
+                "AI 服务限流: %s，并发上限降至 %d，暂停 %.1fs",
+                self.name,
+                int(self.concurrency),
+                backoff,
+            )
+        elif outcome == "success":
+            self._success_streak += 1
+            if (
+                self._success_streak >= int(self.concurrency)
+                and self.concurrency < self.max_concurrency
+            ):
+                self.concurrency = min(float(self.max_concurrency), self.concurrency + 1)
+                self._success_streak = 0
+        elif outcome == "error":
+            self.stats["errors"] += 1
+
+        self._released.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "provider": self.name,
+            "concurrency_limit": int(self.concurrency),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "tokens": round(self.tokens, 2),
+            "blocked_seconds": round(max(self.blocked_until - now, 0.0), 1),
+            **{key: round(value, 3) for key, value in self.stats.items()},
+        }
+
+
+_limiters: Dict[Tuple[str, str], ProviderLimiter] = {}
+
+
+def _limiter_key(base_url: str, api_key: Optional[str]) -> Tuple[str, str]:
+    provider = (base_url or "").strip().rstrip("/")
+    key_digest = ""
+    if AI_LIMITER_PER_KEY and api_key:
+        key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+    return provider, key_digest
+
+
+def get_provider_limiter(base_url: str, api_key: Optional[str] = None) -> ProviderLimiter:
+    """获取服务商的限流器（默认按 API Key 区分，AI_LIMITER_PER_KEY 关闭时同一 Base URL 共享）"""
+    key = _limiter_key(base_url, api_key)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        name = key[0] if not key[1] else f"{key[0]}#{key[1]}"
+        limiter = ProviderLimiter(
+            name=name,
+            rate=AI_LIMITER_RATE_PER_SECOND,
+            burst=AI_LIMITER_BURST,
+            initial_concurrency=AI_LIMITER_INITIAL_CONCURRENCY,
+            min_concurrency=AI_LIMITER_MIN_CONCURRENCY,
+            max_concurrency=AI_LIMITER_MAX_CONCURRENCY,
+        )
+        _limiters[key] = limiter
+    return limiter
+
+
+@asynccontextmanager
+async def ai_call_slot(base_url: str, api_key: Optional[str] = None) -> AsyncIterator[ProviderLimiter]:
+    """
+    在限流器额度内执行一次 AI 调用
+
+    流式调用应在整个接收过程中持有额度。
+
+    Example:
+        async with ai_call_slot(base_url, api_key):
+            response = await client.chat.completions.create(...)
+    """
+    limiter = get_provider_limiter(base_url, api_key)
+    await limiter.acquire()
+    outcome = "error"
+    retry_after: Optional[float] = None
+    try:
+        yield limiter
+        outcome = "success"
+    except Exception as exc:
+        if is_rate_limit_error(exc):
+            outcome = "rate_limited"
+            retry_after = get_retry_after(exc)
+        raise
+    except BaseException:
+        # 取消或消费方提前关闭流，不计入成功或失败
+        outcome = "cancelled"
+        raise
+    finally:
+        limiter.release(outcome, retry_after)
+
+
+def get_limiter_stats() -> Dict[str, Any]:
+    """所有限流器的汇总统计（不含各用户配置的服务商地址与 Key 摘要）"""
+    stats = [limiter.get_stats() for limiter in list(_limiters.values())]
+    totals = {
+        key: round(sum(item[key] for item in stats), 3)
+        for key in ("in_flight", "waiting", "acquired", "rate_limited", "errors", "wait_seconds_total")
+    }
+    return {
+        "per_key": AI_LIMITER_PER_KEY,
+        "limiters": len(stats),
+        "blocked_limiters": sum(1 for item in stats if item["blocked_seconds"] > 0),
+        "min_concurrency_limit": min((item["concurrency_limit"] for item in stats), default=None),
+        **totals,
+    }
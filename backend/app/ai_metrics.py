@@ -0,0 +1,174 @@
+"""
+AI 调用指标 - 按调用场景 / 模型统计耗时、首字延迟、token 用量与结果
+
+服务商地址由用户自行配置，只写入服务端的 ai_call 结构化日志，不进入通过接口
+返回的汇总指标。
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 秒
+LATENCY_BUCKETS: List[float] = [0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300]
+# token 数
+TOKEN_BUCKETS: List[float] = [64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384]
+
+
+class Histogram:
+    """固定分桶直方图，分位数按桶上界估算"""
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 3) if self.count else None,
+            "min": round(self.min, 3) if self.min is not None else None,
+            "max": round(self.max, 3) if self.max is not None else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": {
+                **{f"le_{bucket:g}": count for bucket, count in zip(self.buckets, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class _Series:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.outcomes: Dict[str, int] = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.ttft = Histogram(LATENCY_BUCKETS)
+        self.completion_tokens = Histogram(TOKEN_BUCKETS)
+        self.prompt_tokens_total = 0
+        self.completion_tokens_total = 0
+        self.estimated_usage = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        failures = sum(
+            count for outcome, count in self.outcomes.items()
+            if outcome not in {"success", "cache_hit"}
+        )
+        return {
+            "calls": self.calls,
+            "outcomes": dict(self.outcomes),
+            "error_rate": round(failures / self.calls, 4) if self.calls else None,
+            "latency_seconds": self.latency.snapshot(),
+            "ttft_seconds": self.ttft.snapshot(),
+            "completion_tokens": self.completion_tokens.snapshot(),
+            "prompt_tokens_total": self.prompt_tokens_total,
+            "completion_tokens_total": self.completion_tokens_total,
+            "estimated_usage_calls": self.estimated_usage,
+        }
+
+
+_series: Dict[Tuple[str, str], _Series] = {}
+_started_at = time.time()
+
+
+def _host_of(base_url: str) -> str:
+    return urlparse(str(base_url or "")).netloc or str(base_url or "")
+
+
+def record_ai_call(
+    *,
+    call_site: str,
+    model: str,
+    base_url: str,
+    outcome: str,
+    latency: float,
+    ttft: Optional[float] = None,
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None,
+    usage_estimated: bool = False,
+    stream: bool = False,
+    error: Optional[BaseException] = None,
+) -> None:
+    """
+    记录一次 AI 调用（每次尝试记录一次，重试会产生多条）
+
+    Args:
+        outcome: success / cache_hit / rate_limited / error / cancelled
+    """
+    host = _host_of(base_url)
+    key = (call_site, model)
+    series = _series.get(key)
+    if series is None:
+        series = _series[key] = _Series()
+
+    series.calls += 1
+    series.outcomes[outcome] = series.outcomes.get(outcome, 0) + 1
+    if outcome != "cache_hit":
+        series.latency.observe(latency)
+        if ttft is not None:
+            series.ttft.observe(ttft)
+    if prompt_tokens:
+        series.prompt_tokens_total += prompt_tokens
+    if completion_tokens:
+        series.completion_tokens_total += completion_tokens
+        series.completion_tokens.observe(completion_tokens)
+    if usage_estimated:
+        series.estimated_usage += 1
+
+    record: Dict[str, Any] = {
+        "call_site": call_site,
+        "model": model,
+        "host": host,
+        "stream": stream,
+        "outcome": outcome,
+        "latency_ms": round(latency * 1000),
+    }
+    if ttft is not None:
+        record["ttft_ms"] = round(ttft * 1000)
+    if prompt_tokens is not None:
+        record["prompt_tokens"] = prompt_tokens
+    if completion_tokens is not None:
+        record["completion_tokens"] = completion_tokens
+    if usage_estimated:
+        record["usage_estimated"] = True
+    if error is not None:
+        record["error"] = type(error).__name__
+    level = logging.INFO if outcome in {"success", "cache_hit"} else logging.WARNING
+    logger.log(level, "ai_call %s", json.dumps(record, ensure_ascii=False))
+
+
+def get_ai_metrics() -> Dict[str, Any]:
+    return {
+        "since": _started_at,
+        "series": [
+            {"call_site": call_site, "model": model, **series.snapshot()}
+            for (call_site, model), series in sorted(_series.items())
+        ],
+    }
@@ -0,0 +1,175 @@
+"""
+AI 调用重试策略 - 指数退避 + 全抖动，遵守 Retry-After 与总时限
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .ai_errors import get_retry_after, is_rate_limit_error, is_retryable_error
+from .config import (
+    AI_RETRY_BASE_DELAY,
+    AI_RETRY_DEADLINE,
+    AI_RETRY_MAX_ATTEMPTS,
+    AI_RETRY_MAX_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    重试策略
+
+    Attributes:
+        max_attempts: 最多尝试次数（含首次）
+        base_delay: 首次重试的退避上限（秒），之后每次翻倍
+        max_delay: 单次退避上限（秒）
+        deadline: 从首次尝试开始的总时限（秒），None 表示不限
+    """
+
+    max_attempts: int = AI_RETRY_MAX_ATTEMPTS
+    base_delay: float = AI_RETRY_BASE_DELAY
+    max_delay: float = AI_RETRY_MAX_DELAY
+    deadline: Optional[float] = AI_RETRY_DEADLINE
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        计算第 attempt 次失败（从 0 开始）后的等待时间
+
+        在 [0, min(max_delay, base_delay * 2^attempt)] 内均匀取值（full jitter），
+        服务端给出 Retry-After 时至少等待该时长。
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+_retry_stats: Dict[str, Any] = {
+    "calls": 0,
+    "attempts": 0,
+    "retries": 0,
+    "recovered": 0,
+    "exhausted": 0,
+    "non_retryable": 0,
+    "backoff_seconds_total": 0.0,
+    "errors_by_type": {},
+}
+
+
+def _record_error(error: Exception) -> None:
+    name = "RateLimit" if is_rate_limit_error(error) else type(error).__name__
+    errors = _retry_stats["errors_by_type"]
+    errors[name] = errors.get(name, 0) + 1
+
+
+class RetryState:
+    """
+    单次逻辑调用的重试状态，供无法直接包装成协程的场景（如流式输出）使用
+
+    Example:
+        state = RetryState(policy, label="stream")
+        while True:
+            state.begin_attempt()
+            try:
+                ...
+                state.succeeded()
+                break
+            except Exception as exc:
+                await state.handle_failure(exc)  # 不可重试时重新抛出
+    """
+
+    def __init__(self, policy: RetryPolicy = DEFAULT_RETRY_POLICY, label: str = "ai"):
+        self.policy = policy
+        self.label = label
+        self.attempt = 0
+        self.started_at = time.monotonic()
+        _retry_stats["calls"] += 1
+
+    def begin_attempt(self) -> None:
+        _retry_stats["attempts"] += 1
+
+    def succeeded(self) -> None:
+        if self.attempt:
+            _retry_stats["recovered"] += 1
+
+    async def handle_failure(self, error: Exception) -> None:
+        _record_error(error)
+        if not is_retryable_error(error):
+            _retry_stats["non_retryable"] += 1
+            raise error
+        if self.attempt + 1 >= self.policy.max_attempts:
+            _retry_stats["exhausted"] += 1
+            raise error
+
+        delay = self.policy.backoff(self.attempt, get_retry_after(error))
+        if self.policy.deadline is not None:
+            elapsed = time.monotonic() - self.started_at
+            if elapsed + delay > self.policy.deadline:
+                _retry_stats["exhausted"] += 1
+                raise error
+
+        self.attempt += 1
+        _retry_stats["retries"] += 1
+        _retry_stats["backoff_seconds_total"] += delay
+        logger.warning(
+            "%s 调用失败，%.1fs 后第 %d 次重试: %s: %s",
+            self.label,
+            delay,
+            self.attempt,
+            type(error).__name__,
+            error,
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    *,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    label: str = "ai",
+) -> T:
+    """
+    按重试策略执行异步调用
+
+    Args:
+        func: 每次尝试都会重新调用的无参协程工厂
+        policy: 重试策略
+        label: 日志中的调用标识
+    """
+    state = RetryState(policy, label=label)
+    while True:
+        state.begin_attempt()
+        try:
+            result = await func()
+        except Exception as exc:
+            await state.handle_failure(exc)
+            continue
+        state.succeeded()
+        return result
+
+
+def get_retry_stats() -> Dict[str, Any]:
+    return {
+        **_retry_stats,
+        "backoff_seconds_total": round(_retry_stats["backoff_seconds_total"], 3),
+        "errors_by_type": dict(_retry_stats["errors_by_type"]),
+        "policy": {
+            "max_attempts": DEFAULT_RETRY_POLICY.max_attempts,
+            "base_delay": DEFAULT_RETRY_POLICY.base_delay,
+            "max_delay": DEFAULT_RETRY_POLICY.max_delay,
+            "deadline": DEFAULT_RETRY_POLICY.deadline,
+        },
+    }
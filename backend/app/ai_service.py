@@ -1,27 +1,22 @@
 """
 AI 服务模块 - 调用 OpenAI API
 """
-from typing import AsyncGenerator, Any, Dict, Optional, Tuple
-import openai
+from typing import AsyncGenerator, Any, Dict, List, Optional, Tuple
 import logging
 import traceback
 import json
 
+from .ai_client import get_async_client, iter_chat_chunks, stream_chat
+from .ai_structured import complete_json, disable_json_mode, is_valid_json, json_response_format
+from .config import AI_STREAM_LOG_SAMPLE_EVERY
+from .utils.allocation import largest_remainder
+from .utils.json_repair import JSONRepairError, parse_json_lenient
+from .utils.json_stream import IncrementalJSONObjectParser
 from .utils.plan_params import build_plan_params_from_schedule
 
 logger = logging.getLogger(__name__)
 
 
-def _strip_json_code_block(content: str) -> str:
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
-        content = content.strip()
-    return content
-
-
 async def chat_completion_stream(
     messages: list,
     api_key: str,
@@ -40,50 +35,29 @@ async def chat_completion_stream(
     Yields:
         str: 流式返回的文本片段
     """
-    logger.info(f"开始调用 AI API")
-    logger.info(f"  Model: {model}")
-    logger.info(f"  Base URL: {base_url}")
-    logger.info(f"  API Key: {api_key[:10]}..." if api_key else "  API Key: None")
-    logger.info(f"  消息数量: {len(messages)}")
+    logger.info("开始调用 AI 对话: model=%s base_url=%s messages=%d", model, base_url, len(messages))
     
-    client = openai.AsyncOpenAI(
-        api_key=api_key,
-        base_url=base_url
-    )
+    client = get_async_client(api_key, base_url)
     
     try:
-        logger.info("正在创建流式请求...")
-        stream = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            stream=True
-        )
-        
-        logger.info("开始接收流式响应...")
         has_content = False
         chunk_count = 0
-        
-        async for chunk in stream:
+
+        # 限流与首段内容前的瞬时错误重试由 iter_chat_chunks 统一处理
+        params = {"model": model, "messages": messages}
+
+        async for chunk in iter_chat_chunks(client, params, call_site="chat"):
             chunk_count += 1
-            
-            # 详细记录每个 chunk
-            logger.debug(f"收到 chunk #{chunk_count}:")
-            logger.debug(f"  chunk.choices: {chunk.choices}")
-            
-            if chunk.choices:
-                logger.debug(f"  choices[0].delta: {chunk.choices[0].delta}")
-                logger.debug(f"  delta.content: {chunk.choices[0].delta.content}")
-                logger.debug(f"  finish_reason: {chunk.choices[0].finish_reason}")
-            
+
+            # 逐 chunk 日志只按采样输出到 DEBUG，避免长回答产生大量日志
+            if logger.isEnabledFor(logging.DEBUG) and (chunk_count - 1) % AI_STREAM_LOG_SAMPLE_EVERY == 0:
+                logger.debug("收到 chunk #%d: %r", chunk_count, chunk.choices[0].delta if chunk.choices else None)
+
             if chunk.choices and chunk.choices[0].delta.content:
                 has_content = True
-                content = chunk.choices[0].delta.content
-                logger.info(f"✅ 收到内容 chunk #{chunk_count}: {content[:50]}...")
-                yield content
-            else:
-                logger.debug(f"⚠️ Chunk #{chunk_count} 没有内容")
-        
-        logger.info(f"流式响应完成，共收到 {chunk_count} 个 chunk，有内容: {has_content}")
+                yield chunk.choices[0].delta.content
+
+        logger.info("AI 对话流式响应完成: chunks=%d has_content=%s", chunk_count, has_content)
         
         if not has_content:
             logger.warning("AI 返回内容为空")
@@ -92,8 +66,8 @@ async def chat_completion_stream(
     except Exception as e:
         error_type = type(e).__name__
         error_msg = str(e)
-        logger.error(f"AI 调用失败: {error_type}: {error_msg}")
-        logger.error(f"完整错误:\n{traceback.format_exc()}")
+        logger.error("AI 调用失败: %s: %s", error_type, error_msg)
+        logger.error("完整错误:\n%s", traceback.format_exc())
         
         yield f"\n\n❌ 调用失败\n"
         yield f"错误类型: {error_type}\n"
@@ -102,70 +76,16 @@ async def chat_completion_stream(
         yield f"1. Base URL: {base_url}\n"
         yield f"2. 模型名称: {model}\n"
         yield "3. API Key 是否有效\n"
-        yield f"\\n\\n❌ 调用失败\\n"
-        yield f"错误类型: {error_type}\\n"
-        yield f"错误信息: {error_msg}\\n\\n"
-        yield "请检查：\\n"
-        yield f"1. Base URL: {base_url}\\n"
-        yield f"2. 模型名称: {model}\\n"
-        yield "3. API Key 是否有效\\n"
 
 
-async def generate_lesson_plan_content(
-    sequence: int,
-    plan_item: Optional[Dict[str, Any]],
-    system_fields: Optional[Dict[str, Any]],
-    document_full_text: str,
-    course_context: str,
-    api_key: str,
-    base_url: str,
-    model: str = "gpt-4",
-    strict_mode: bool = True,
-) -> dict:
-    """
-    生成教案的结构化内容
-    
-    Args:
-        sequence: 授课顺序
-        plan_item: 授课计划条目
-        system_fields: 系统计算字段
-        document_full_text: 授课计划全文
-        course_context: 课程上下文信息
-        api_key: OpenAI API Key
-        base_url: OpenAI Base URL
-        model: 模型名称
-        strict_mode: 是否启用系统字段严格校验
-        
-    Returns:
-        结构化的教案数据（字典）
-    """
-    # 构建提示词（使用用户提供的完整提示词）
-    prompt = f"""# Role
+# 教案生成的系统提示词只包含固定的角色与规则（严格/推断两种模式各一份），
+# 每次请求变化的授课计划、系统字段与课程上下文全部放在其后的用户消息中，
+# 使同一模式下所有请求共享字节一致的前缀，便于服务商命中提示词缓存。
+_LESSON_PLAN_SYSTEM_HEAD = """# Role
 你是一位广东碧桂园职业学院的资深专业课教师，擅长进行课程设计和教案编写。你非常熟悉职业教育的教学规范，能根据"授课计划"生成高质量、符合逻辑的教案数据。
 
 # Task
-请根据我提供的【基础信息】，按照【生成规则】，生成一份用于自动化教案生成的 JSON 数据。
-
-# Input Data (基础信息)
-1. **授课顺序 (Sequence)**: {sequence}
-2. **授课计划全文 (Plan Full Content)**:
-{document_full_text}
-"""
-
-    if system_fields is not None:
-        prompt += f"""
-3. **系统计算字段 (System Fields)**: {json.dumps(system_fields, ensure_ascii=False)}
-"""
-
-    if plan_item is not None:
-        prompt += f"""
-4. **授课计划条目 (Plan Item)**: {json.dumps(plan_item, ensure_ascii=False)}
-"""
-
-    prompt += f"""
-
-# Course Context (课程上下文)
-{course_context}
+请根据用户消息中提供的【基础信息】，按照【生成规则】，生成一份用于自动化教案生成的 JSON 数据。
 
 # Constraints & Rules (生成规则)
 请严格遵守以下约束，任何违反都将导致任务失败：
@@ -175,17 +95,16 @@ async def generate_lesson_plan_content(
 * **Key 值命名**：必须严格使用指定的英文 Key：project_name, week, sequence, hours, total_hours, knowledge_goals, ability_goals, quality_goals, teaching_content, teaching_focus, teaching_difficulty, review_content, review_time, new_lessons, assessment_content, summary_content, homework_content。
 """
 
-    if strict_mode:
-        prompt += """
+_LESSON_PLAN_STRICT_RULES = """
 * **系统字段必须复用**：`project_name`, `week`, `sequence`, `hours`, `total_hours` 必须与 System Fields 完全一致，不允许改写或重新计算。
 * **授课计划条目为唯一依据**：`project_name` 必须完全等于 Plan Item 的 `title`，教学内容与新课教学需围绕 `tasks` 展开。
 """
-    else:
-        prompt += """
+
+_LESSON_PLAN_INFER_RULES = """
 * **字段推断要求**：未提供 System Fields 与 Plan Item 时，`sequence` 必须等于输入的授课顺序，其余 `project_name`、`week`、`hours`、`total_hours` 请结合授课计划全文合理推断并保持一致性。
 """
 
-    prompt += """
+_LESSON_PLAN_SYSTEM_TAIL = """
 
 ## 2. 内容质量规则
 * **教学目标 (goals)**：`knowledge_goals`、`ability_goals`、`quality_goals` 三部分。
@@ -245,21 +164,189 @@ async def generate_lesson_plan_content(
 
 请直接返回 JSON，不要包含任何额外的文字说明。
 """
+
+LESSON_PLAN_SYSTEM_PROMPTS = {
+    True: _LESSON_PLAN_SYSTEM_HEAD + _LESSON_PLAN_STRICT_RULES + _LESSON_PLAN_SYSTEM_TAIL,
+    False: _LESSON_PLAN_SYSTEM_HEAD + _LESSON_PLAN_INFER_RULES + _LESSON_PLAN_SYSTEM_TAIL,
+}
+
+LESSON_PLAN_KEYS = (
+    "project_name", "week", "sequence", "hours", "total_hours",
+    "knowledge_goals", "ability_goals", "quality_goals",
+    "teaching_content", "teaching_focus", "teaching_difficulty",
+    "review_content", "review_time", "new_lessons",
+    "assessment_content", "summary_content", "homework_content",
+)
+
+
+def _has_new_lessons(data: Any) -> bool:
+    new_lessons = data.get("new_lessons") if isinstance(data, dict) else None
+    return isinstance(new_lessons, list) and len(new_lessons) >= 3 and all(
+        isinstance(item, dict) and "content" in item and "time" in item for item in new_lessons
+    )
+
+
+def is_complete_lesson_plan(data: Any) -> bool:
+    """教案字段是否齐全（输出被截断后补全括号的结果须通过此校验）"""
+    if not isinstance(data, dict) or any(key not in data for key in LESSON_PLAN_KEYS):
+        return False
+    return _has_new_lessons(data)
+
+
+def _build_lesson_plan_messages(
+    sequence: int,
+    plan_item: Optional[Dict[str, Any]],
+    system_fields: Optional[Dict[str, Any]],
+    document_full_text: str,
+    course_context: str,
+    strict_mode: bool,
+) -> List[Dict[str, str]]:
+    # 授课计划全文在同一课程的各次课之间相同，放在最前面以延长可共享的前缀
+    prompt = f"""# Input Data (基础信息)
+1. **授课计划全文 (Plan Full Content)**:
+{document_full_text}
+
+2. **授课顺序 (Sequence)**: {sequence}
+"""
+
+    if system_fields is not None:
+        prompt += f"""
+3. **系统计算字段 (System Fields)**: {json.dumps(system_fields, ensure_ascii=False)}
+"""
+
+    if plan_item is not None:
+        prompt += f"""
+4. **授课计划条目 (Plan Item)**: {json.dumps(plan_item, ensure_ascii=False)}
+"""
+
+    prompt += f"""
+
+# Course Context (课程上下文)
+{course_context}
+
+请根据以上基础信息，严格遵守系统提示中的生成规则，直接返回 JSON。
+"""
+
+    return [
+        {"role": "system", "content": LESSON_PLAN_SYSTEM_PROMPTS[bool(strict_mode)]},
+        {"role": "user", "content": prompt}
+    ]
+
+
+async def generate_lesson_plan_content(
+    sequence: int,
+    plan_item: Optional[Dict[str, Any]],
+    system_fields: Optional[Dict[str, Any]],
+    document_full_text: str,
+    course_context: str,
+    api_key: str,
+    base_url: str,
+    model: str = "gpt-4",
+    strict_mode: bool = True,
+    use_cache: bool = True,
+) -> dict:
+    """
+    生成教案的结构化内容
     
-    client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+    Args:
+        sequence: 授课顺序
+        plan_item: 授课计划条目
+        system_fields: 系统计算字段
+        document_full_text: 授课计划全文
+        course_context: 课程上下文信息
+        api_key: OpenAI API Key
+        base_url: OpenAI Base URL
+        model: 模型名称
+        strict_mode: 是否启用系统字段严格校验
+        use_cache: 是否允许使用生成缓存
+        
+    Returns:
+        结构化的教案数据（字典）
+    """
+    messages = _build_lesson_plan_messages(
+        sequence, plan_item, system_fields, document_full_text, course_context, strict_mode
+    )
+    client = get_async_client(api_key, base_url)
     
-    response = await client.chat.completions.create(
+    return await complete_json(
+        client,
         model=model,
-        messages=[
-            {"role": "system", "content": "你是一位广东碧桂园职业学院的资深专业课教师，擅长进行课程设计和教案编写。"},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.7
+        messages=messages,
+        temperature=0.7,
+        use_cache=use_cache,
+        call_site="lesson_plan",
+        is_complete=is_complete_lesson_plan,
     )
-    
-    content = response.choices[0].message.content.strip()
-    content = _strip_json_code_block(content)
-    return json.loads(content)
+
+
+async def stream_lesson_plan_content(
+    sequence: int,
+    plan_item: Optional[Dict[str, Any]],
+    system_fields: Optional[Dict[str, Any]],
+    document_full_text: str,
+    course_context: str,
+    api_key: str,
+    base_url: str,
+    model: str = "gpt-4",
+    strict_mode: bool = True,
+    use_cache: bool = True,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    流式生成教案，每完成一个顶层字段即产出一次事件
+
+    参数与 generate_lesson_plan_content 相同。
+
+    Yields:
+        {"type": "field", "key": 字段名, "value": 字段值}，
+        最后产出 {"type": "done", "data": 完整教案数据}
+    """
+    messages = _build_lesson_plan_messages(
+        sequence, plan_item, system_fields, document_full_text, course_context, strict_mode
+    )
+    client = get_async_client(api_key, base_url)
+    parser = IncrementalJSONObjectParser()
+    parts: List[str] = []
+    response_format = json_response_format(client, messages)
+
+    while True:
+        try:
+            async for delta in stream_chat(
+                client,
+                model=model,
+                messages=messages,
+                temperature=0.7,
+                response_format=response_format,
+                use_cache=use_cache,
+                call_site="lesson_plan",
+                cache_validator=lambda text: is_valid_json(text, dict, is_complete_lesson_plan),
+            ):
+                parts.append(delta)
+                for key, value in parser.feed(delta):
+                    yield {"type": "field", "key": key, "value": value}
+        except Exception as exc:
+            # 服务商不支持 JSON 模式时在输出任何内容之前就会报错，去掉后重新请求
+            if parts or response_format is None or not disable_json_mode(client, exc):
+                raise
+            response_format = None
+            continue
+        break
+
+    try:
+        data, _ = parse_json_lenient("".join(parts), dict, is_complete_lesson_plan)
+    except JSONRepairError:
+        # 本地修复失败或输出被截断，跳过缓存重新生成一次（字段事件已发出，以最终数据为准）
+        logger.warning("流式教案 JSON 无法解析或被截断，重新生成")
+        data = await complete_json(
+            client,
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            use_cache=False,
+            call_site="lesson_plan",
+            is_complete=is_complete_lesson_plan,
+            retries=0,
+        )
+    yield {"type": "done", "data": data}
 
 
 def validate_time_allocation(lesson_plan_data: Dict[str, Any], hours: int) -> Tuple[bool, str]:
@@ -285,12 +372,98 @@ def validate_time_allocation(lesson_plan_data: Dict[str, Any], hours: int) -> Tu
     return True, "ok"
 
 
+def _as_positive_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    if isinstance(value, str):
+        digits = "".join(ch for ch in value if ch.isdigit() or ch == ".")
+        try:
+            number = float(digits)
+        except ValueError:
+            return None
+        return number if number > 0 else None
+    return None
+
+
+def solve_time_allocation(
+    lesson_plan_data: Dict[str, Any],
+    hours: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    本地求解时间分配
+
+    以模型给出的 review_time 与 new_lessons[].time 为权重按比例缩放，
+    review_time 限制在 5-15 分钟，新课时间用最大余数法取整，保证
+    review_time + sum(time) + 10 + 5 == hours * 40。
+
+    Returns:
+        与 regenerate_time_allocation 相同结构的分配结果；new_lessons 数量不符合
+        3-5 项等无法仅靠调整时间修复的情况返回 None
+    """
+    if not isinstance(hours, int) or hours <= 0:
+        return None
+    new_lessons = lesson_plan_data.get("new_lessons")
+    if not isinstance(new_lessons, list) or not (3 <= len(new_lessons) <= 5):
+        return None
+    if not all(isinstance(item, dict) for item in new_lessons):
+        return None
+
+    available = hours * 40 - 10 - 5
+    count = len(new_lessons)
+    if available < 5 + count:
+        return None
+
+    lesson_weights = [_as_positive_number(item.get("time")) for item in new_lessons]
+    if any(weight is None for weight in lesson_weights):
+        lesson_weights = [1.0] * count
+    review_weight = _as_positive_number(lesson_plan_data.get("review_time")) or 10.0
+
+    weight_sum = review_weight + sum(lesson_weights)
+    review_time = round(available * review_weight / weight_sum)
+    review_time = max(5, min(15, review_time, available - count))
+
+    times = largest_remainder(available - review_time, lesson_weights)
+    return {
+        "review_time": review_time,
+        "new_lessons": [
+            {"content": item.get("content", ""), "time": time_value}
+            for item, time_value in zip(new_lessons, times)
+        ],
+    }
+
+
+TIME_ALLOCATION_SYSTEM_PROMPT = """# Role
+你是一名教学教案时间分配审校员，只负责时间分配校正。
+
+# Task
+仅重新生成时间分配计划，不修改任何教学内容。
+
+# Rules
+1. 固定扣除：考核评价 10 分钟，课堂小结 5 分钟。
+2. review_time 必须为 5-15 之间的整数分钟。
+3. new_lessons 列表必须与输入长度一致，content 不可修改，只能填写 time。
+4. time 为正整数，且满足：review_time + sum(time) + 10 + 5 == 输入中的总时长(分钟)。
+
+# Output Format
+只输出 JSON 对象，结构如下：
+{
+  "review_time": 10,
+  "new_lessons": [
+    {"content": "...", "time": 20}
+  ]
+}
+"""
+
+
 async def regenerate_time_allocation(
     lesson_plan_data: Dict[str, Any],
     hours: int,
     api_key: str,
     base_url: str,
     model: str = "gpt-4",
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     total_minutes = hours * 40
     new_lessons = lesson_plan_data.get("new_lessons") or []
@@ -298,73 +471,41 @@ async def regenerate_time_allocation(
         {"content": item.get("content", "")} for item in new_lessons if isinstance(item, dict)
     ]
 
-    prompt = f"""# Role
-你是一名教学教案时间分配审校员。
-
-# Task
-仅重新生成时间分配计划，不修改任何教学内容。
-
-# Input
+    prompt = f"""# Input
 - 本次学时: {hours}
 - 总时长(分钟): {total_minutes}
-- 固定扣除: 考核评价 10 分钟，课堂小结 5 分钟
 - 新课教学内容列表: {json.dumps(new_lessons_payload, ensure_ascii=False)}
-
-# Rules
-1. review_time 必须为 5-15 之间的整数分钟。
-2. new_lessons 列表必须与输入长度一致，content 不可修改，只能填写 time。
-3. time 为正整数，且满足：review_time + sum(time) + 10 + 5 == {total_minutes}。
-
-# Output Format
-只输出 JSON 对象，结构如下：
-{{
-  "review_time": 10,
-  "new_lessons": [
-    {{"content": "...", "time": 20}}
-  ]
-}}
 """
 
-    client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
-    response = await client.chat.completions.create(
+    client = get_async_client(api_key, base_url)
+    return await complete_json(
+        client,
         model=model,
         messages=[
-            {"role": "system", "content": "你只负责时间分配校正。"},
+            {"role": "system", "content": TIME_ALLOCATION_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
-        temperature=0.3
+        temperature=0.3,
+        use_cache=use_cache,
+        call_site="time_allocation",
+        is_complete=lambda data: "review_time" in data and _has_new_lessons(data),
     )
-    content = response.choices[0].message.content.strip()
-    content = _strip_json_code_block(content)
-    return json.loads(content)
 
 
-async def parse_teaching_plan_params(
-    extracted_text: str,
-    course_total_hours: Optional[int],
-    api_key: str,
-    base_url: str,
-    model: str = "gpt-4",
-) -> Dict[str, Any]:
-    prompt = f"""# Role
-你是一名教学计划数据整理员。
+PLAN_PARAMS_SYSTEM_PROMPT = """# Role
+你是一名教学计划数据整理员，擅长结构化提取授课计划参数。
 
 # Task
 从授课计划文本中提取课次参数，生成结构化 JSON。
 
-# Input
-课程总学时（可用于推断单次学时）：{course_total_hours if course_total_hours is not None else "未知"}
-授课计划文本：
-{extracted_text}
-
 # Output Format
 只输出 JSON 对象，结构如下：
-{{
+{
   "schedule": [
-    {{"week": 1, "order": 1, "title": "项目一：...", "tasks": "1. ...\\n2. ...", "hour": 4}}
+    {"week": 1, "order": 1, "title": "项目一：...", "tasks": "1. ...\\n2. ...", "hour": 4}
   ],
   "hour_per_class": 4
-}}
+}
 
 # Rules
 1. schedule 为完整课次列表，包含理论/实训/复习考核等所有课次。
@@ -373,18 +514,34 @@ async def parse_teaching_plan_params(
 4. 输出必须为标准 JSON，不要包含额外说明或 Markdown。
 """
 
-    client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
-    response = await client.chat.completions.create(
+
+async def parse_teaching_plan_params(
+    extracted_text: str,
+    course_total_hours: Optional[int],
+    api_key: str,
+    base_url: str,
+    model: str = "gpt-4",
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    prompt = f"""# Input
+课程总学时（可用于推断单次学时）：{course_total_hours if course_total_hours is not None else "未知"}
+授课计划文本：
+{extracted_text}
+"""
+
+    client = get_async_client(api_key, base_url)
+    data = await complete_json(
+        client,
         model=model,
         messages=[
-            {"role": "system", "content": "你擅长结构化提取授课计划参数。"},
+            {"role": "system", "content": PLAN_PARAMS_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
-        temperature=0.2
+        temperature=0.2,
+        use_cache=use_cache,
+        call_site="plan_params",
+        is_complete=lambda data: "schedule" in data and "hour_per_class" in data,
     )
-    content = response.choices[0].message.content.strip()
-    content = _strip_json_code_block(content)
-    data = json.loads(content)
 
     if not isinstance(data, dict):
         raise ValueError("解析结果不是 JSON 对象")
@@ -0,0 +1,183 @@
+"""
+结构化输出 - 请求 JSON 模式并在本地修复、校验模型返回的 JSON
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import openai
+
+from .ai_client import complete_chat
+from .ai_errors import collect_error_text, get_status_code
+from .config import AI_JSON_MODE
+from .utils.json_repair import JSONRepairError, parse_json_lenient
+
+logger = logging.getLogger(__name__)
+
+JSON_OBJECT_FORMAT: Dict[str, Any] = {"type": "json_object"}
+
+_UNSUPPORTED_HINTS = ("response_format", "json_object", "json mode", "json_mode")
+
+# 已确认不支持 response_format 的服务商（按 base_url 记录，进程内有效）
+_unsupported_base_urls: Set[str] = set()
+
+_structured_stats: Dict[str, int] = {
+    "requests": 0,
+    "json_mode_requests": 0,
+    "json_mode_unsupported": 0,
+    "retries": 0,
+    "failed": 0,
+}
+
+
+def json_response_format(
+    client: openai.AsyncOpenAI,
+    messages: List[Dict[str, Any]],
+    expect: Optional[type] = dict,
+) -> Optional[Dict[str, Any]]:
+    """
+    返回本次调用应使用的 response_format
+
+    JSON 模式只保证顶层为对象，且要求提示词中出现 “JSON” 字样；期望数组、
+    配置关闭或服务商已确认不支持时返回 None。
+    """
+    if AI_JSON_MODE != "auto" or expect is not dict:
+        return None
+    if str(client.base_url) in _unsupported_base_urls:
+        return None
+    if not any("json" in str(message.get("content") or "").lower() for message in messages):
+        return None
+    return JSON_OBJECT_FORMAT
+
+
+def disable_json_mode(client: openai.AsyncOpenAI, error: Exception) -> bool:
+    """
+    判断错误是否由服务商不支持 response_format 引起，是则记录并返回 True
+
+    调用方据此去掉 response_format 重新请求。
+    """
+    if get_status_code(error) not in {400, 404, 415, 422}:
+        return False
+    message = collect_error_text(error).lower()
+    if not any(hint in message for hint in _UNSUPPORTED_HINTS):
+        return False
+    base_url = str(client.base_url)
+    if base_url not in _unsupported_base_urls:
+        _unsupported_base_urls.add(base_url)
+        _structured_stats["json_mode_unsupported"] += 1
+        logger.info("服务商不支持 JSON 模式，改为本地修复解析: %s", base_url)
+    return True
+
+
+async def _complete_with_format(
+    client: openai.AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float],
+    use_cache: bool,
+    call_site: str,
+    expect: Optional[type],
+    cache_validator: Optional[Callable[[str], bool]] = None,
+) -> str:
+    response_format = json_response_format(client, messages, expect)
+    if response_format is not None:
+        _structured_stats["json_mode_requests"] += 1
+        try:
+            return await complete_chat(
+                client,
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                response_format=response_format,
+                use_cache=use_cache,
+                call_site=call_site,
+                cache_validator=cache_validator,
+            )
+        except Exception as exc:
+            if not disable_json_mode(client, exc):
+                raise
+    return await complete_chat(
+        client,
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        use_cache=use_cache,
+        call_site=call_site,
+        cache_validator=cache_validator,
+    )
+
+
+def is_valid_json(
+    content: str,
+    expect: Optional[type] = dict,
+    is_complete: Optional[Callable[[Any], bool]] = None,
+) -> bool:
+    """回复能否解析为期望类型的完整 JSON（用作生成缓存的写入校验）"""
+    try:
+        parse_json_lenient(content, expect, is_complete)
+    except JSONRepairError:
+        return False
+    return True
+
+
+async def complete_json(
+    client: openai.AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    use_cache: bool = True,
+    call_site: str = "unknown",
+    expect: Optional[type] = dict,
+    is_complete: Optional[Callable[[Any], bool]] = None,
+    retries: int = 1,
+) -> Any:
+    """
+    调用模型并返回解析后的 JSON
+
+    服务商支持时请求 JSON 模式；返回内容经 parse_json_lenient 提取与修复，
+    仍无法解析时跳过缓存重新生成，最多重试 retries 次。无法解析的回复不写入缓存。
+
+    Args:
+        expect: 期望的顶层类型（dict 或 list），None 表示不限
+        is_complete: 输出被截断时的完整性校验（必需字段与数量），见 parse_json_lenient；
+            未提供时截断的回复一律重新生成
+
+    Raises:
+        JSONRepairError: 重试后仍无法得到期望类型的 JSON
+    """
+    _structured_stats["requests"] += 1
+    for attempt in range(retries + 1):
+        content = await _complete_with_format(
+            client,
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            use_cache=use_cache and attempt == 0,
+            call_site=call_site,
+            expect=expect,
+            cache_validator=lambda text: is_valid_json(text, expect, is_complete),
+        )
+        try:
+            value, path = parse_json_lenient(content, expect, is_complete)
+        except JSONRepairError:
+            if attempt >= retries:
+                _structured_stats["failed"] += 1
+                raise
+            _structured_stats["retries"] += 1
+            logger.warning("AI 返回的 JSON 无法解析或被截断，重新生成: call_site=%s", call_site)
+            continue
+        if path != "direct":
+            logger.info("AI 返回的 JSON 经本地处理后解析成功: call_site=%s path=%s", call_site, path)
+        return value
+    raise JSONRepairError("AI 返回内容无法解析为 JSON")
+
+
+def get_structured_stats() -> Dict[str, Any]:
+    return {
+        **_structured_stats,
+        "json_mode": AI_JSON_MODE,
+        "unsupported_providers": len(_unsupported_base_urls),
+    }
@@ -0,0 +1,256 @@
+"""
+AI 对话上下文组装 - 按 token 预算装入最近历史，较早的对话压缩为滚动摘要
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from .ai_client import complete_chat, get_async_client
+from .config import (
+    CHAT_CONTEXT_TOKEN_BUDGET,
+    CHAT_HISTORY_PAGE_SIZE,
+    CHAT_SUMMARY_BATCH_MESSAGES,
+    CHAT_SUMMARY_MAX_CHARS,
+    CHAT_SUMMARY_TRIGGER_TOKENS,
+)
+from .database import SessionLocal
+from .models import ChatSummary, Message
+from .offload import run_blocking
+from .utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+CHAT_SYSTEM_PROMPT = "你是一个有帮助的AI助手。"
+
+SUMMARY_SYSTEM_PROMPT = f"""你负责维护一段对话的滚动摘要。
+根据【已有摘要】与【新增对话】输出更新后的摘要：
+1. 保留用户的身份背景、目标、偏好、已确认的结论与未解决的问题。
+2. 省略寒暄与重复内容，使用第三人称陈述（“用户……”“助手……”）。
+3. 不超过 {CHAT_SUMMARY_MAX_CHARS} 字，只输出摘要正文。
+"""
+
+# 每条消息的角色与分隔开销（估算）
+_MESSAGE_OVERHEAD_TOKENS = 4
+# 写入摘要提示词时单条消息的最大字符数
+_SUMMARY_MESSAGE_MAX_CHARS = 2000
+
+_context_stats: Dict[str, int] = {
+    "assembled": 0,
+    "history_messages": 0,
+    "history_tokens": 0,
+    "overflow_messages": 0,
+    "summary_refreshes": 0,
+    "summary_failures": 0,
+}
+
+_refreshing: Set[int] = set()
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _message_tokens(content: str) -> int:
+    return estimate_tokens(content) + _MESSAGE_OVERHEAD_TOKENS
+
+
+def _summary_message(summary: str) -> Dict[str, str]:
+    return {"role": "system", "content": f"以下是此前对话的摘要，供回答时参考：\n{summary}"}
+
+
+def assemble_chat_messages(
+    db: Session,
+    user_id: int,
+    content: str,
+    before_id: Optional[int] = None,
+    budget: int = CHAT_CONTEXT_TOKEN_BUDGET,
+) -> Tuple[List[Dict[str, str]], Optional[int]]:
+    """
+    组装发送给模型的对话消息
+
+    固定系统提示词在前，其后依次为滚动摘要、最近历史与本次消息。历史按 id 倒序
+    分页读取（keyset 分页，不使用 OFFSET），只读取摘要之后的消息，在预算内
+    由新到旧装入；预算外未摘要的历史超过 CHAT_SUMMARY_TRIGGER_TOKENS 时需要刷新摘要。
+
+    Args:
+        before_id: 只读取 id 小于该值的历史（通常为刚保存的本次用户消息 id）
+
+    Returns:
+        (messages, summarize_before_id)：后者不为 None 时表示 id 小于该值的
+        未摘要历史应合并进摘要
+    """
+    summary_row = db.query(ChatSummary).filter(ChatSummary.user_id == user_id).first()
+    summary = summary_row.summary if summary_row and summary_row.summary else ""
+    floor_id = summary_row.last_message_id if summary_row else 0
+
+    remaining = budget - _message_tokens(CHAT_SYSTEM_PROMPT) - _message_tokens(content)
+    if summary:
+        remaining -= _message_tokens(_summary_message(summary)["content"])
+
+    history: List[Tuple[int, str, str]] = []
+    overflow_tokens = 0
+    overflow_messages = 0
+    cursor = before_id
+    while True:
+        query = db.query(Message.id, Message.role, Message.content).filter(
+            Message.user_id == user_id, Message.id > floor_id
+        )
+        if cursor is not None:
+            query = query.filter(Message.id < cursor)
+        page = query.order_by(Message.id.desc()).limit(CHAT_HISTORY_PAGE_SIZE).all()
+        for row in page:
+            tokens = _message_tokens(row.content or "")
+            if overflow_messages or tokens > remaining:
+                overflow_messages += 1
+                overflow_tokens += tokens
+                continue
+            remaining -= tokens
+            history.append((row.id, row.role, row.content or ""))
+        # 预算外的历史只需统计到足以判断是否刷新摘要为止
+        if len(page) < CHAT_HISTORY_PAGE_SIZE or overflow_tokens >= CHAT_SUMMARY_TRIGGER_TOKENS:
+            break
+        cursor = page[-1].id
+
+    history.reverse()
+    messages: List[Dict[str, str]] = [{"role": "system", "content": CHAT_SYSTEM_PROMPT}]
+    if summary:
+        messages.append(_summary_message(summary))
+    messages.extend(
+        {"role": role if role in {"user", "assistant"} else "user", "content": text}
+        for _, role, text in history
+    )
+    messages.append({"role": "user", "content": content})
+
+    _context_stats["assembled"] += 1
+    _context_stats["history_messages"] += len(history)
+    _context_stats["history_tokens"] += budget - remaining
+    _context_stats["overflow_messages"] += overflow_messages
+
+    if overflow_tokens < CHAT_SUMMARY_TRIGGER_TOKENS:
+        return messages, None
+    return messages, history[0][0] if history else before_id
+
+
+def _format_transcript(rows: List[Any]) -> str:
+    lines = []
+    for row in rows:
+        speaker = "用户" if row.role == "user" else "助手"
+        text = (row.content or "").strip()
+        if len(text) > _SUMMARY_MESSAGE_MAX_CHARS:
+            text = f"{text[:_SUMMARY_MESSAGE_MAX_CHARS]}……"
+        lines.append(f"{speaker}：{text}")
+    return "\n".join(lines)
+
+
+def _load_summary_inputs(
+    user_id: int, before_id: Optional[int]
+) -> Tuple[str, int, List[Any]]:
+    """读取已有摘要与待合并的历史：(摘要, 已摘要到的消息 id, 新增消息)"""
+    db = SessionLocal()
+    try:
+        summary_row = db.query(ChatSummary).filter(ChatSummary.user_id == user_id).first()
+        previous = summary_row.summary if summary_row else ""
+        floor_id = summary_row.last_message_id if summary_row else 0
+        query = db.query(Message.id, Message.role, Message.content).filter(
+            Message.user_id == user_id, Message.id > floor_id
+        )
+        if before_id is not None:
+            query = query.filter(Message.id < before_id)
+        rows = query.order_by(Message.id.asc()).limit(CHAT_SUMMARY_BATCH_MESSAGES).all()
+    finally:
+        db.close()
+    return previous or "", floor_id or 0, rows
+
+
+def _store_summary(user_id: int, floor_id: int, last_message_id: int, summary: str) -> bool:
+    """保存摘要，期间历史已被清空或摘要已被其他进程刷新时放弃并返回 False"""
+    db = SessionLocal()
+    try:
+        summary_row = db.query(ChatSummary).filter(ChatSummary.user_id == user_id).first()
+        current_floor = summary_row.last_message_id if summary_row else 0
+        still_exists = db.query(Message.id).filter(Message.id == last_message_id).first()
+        if (current_floor or 0) != floor_id or not still_exists:
+            return False
+        if summary_row is None:
+            summary_row = ChatSummary(user_id=user_id)
+            db.add(summary_row)
+        summary_row.summary = summary[:CHAT_SUMMARY_MAX_CHARS]
+        summary_row.last_message_id = last_message_id
+        db.commit()
+    finally:
+        db.close()
+    return True
+
+
+async def refresh_chat_summary(
+    user_id: int,
+    before_id: Optional[int],
+    api_key: str,
+    base_url: str,
+    model: str,
+) -> None:
+    """
+    把 id 小于 before_id 的未摘要历史（每次最多 CHAT_SUMMARY_BATCH_MESSAGES 条）合并进摘要
+
+    读取与写入各使用一个短会话（在线程池中执行），等待模型期间不占用数据库连接。
+    """
+    previous, floor_id, rows = await run_blocking(_load_summary_inputs, user_id, before_id)
+    if not rows:
+        return
+
+    prompt = f"""【已有摘要】
+{previous or "（无）"}
+
+【新增对话】
+{_format_transcript(rows)}
+"""
+    summary = await complete_chat(
+        get_async_client(api_key, base_url),
+        model=model,
+        messages=[
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.3,
+        call_site="chat.summary",
+    )
+    if not summary:
+        raise ValueError("AI 未返回摘要内容")
+
+    if await run_blocking(_store_summary, user_id, floor_id, rows[-1].id, summary):
+        _context_stats["summary_refreshes"] += 1
+
+
+def schedule_summary_refresh(
+    user_id: int,
+    before_id: Optional[int],
+    api_key: str,
+    base_url: str,
+    model: str,
+) -> None:
+    """在后台刷新滚动摘要（同一用户同时只有一个刷新任务）"""
+    if user_id in _refreshing:
+        return
+    _refreshing.add(user_id)
+
+    async def _run() -> None:
+        try:
+            await refresh_chat_summary(user_id, before_id, api_key, base_url, model)
+        except Exception as exc:
+            _context_stats["summary_failures"] += 1
+            logger.warning("刷新对话摘要失败: user=%s %s", user_id, exc)
+        finally:
+            _refreshing.discard(user_id)
+
+    task = asyncio.create_task(_run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def clear_chat_summary(db: Session, user_id: int) -> None:
+    db.query(ChatSummary).filter(ChatSummary.user_id == user_id).delete()
+
+
+def get_chat_context_stats() -> Dict[str, int]:
+    return dict(_context_stats)
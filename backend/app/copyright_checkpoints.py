@@ -0,0 +1,129 @@
+"""
+软著生成检查点 - 保存各阶段的输出，续跑时复用输入未变化的阶段
+
+每个阶段完成后在 data/copyright/checkpoints/{project_id}/{stage}.json 保存：
+- inputs_hash：阶段全部输入（提示词模板、模型、项目参数、依赖阶段的 content_hash 等）的哈希
+- content_hash：阶段结果与产出文件的哈希，作为下游阶段的输入
+- result / files：阶段返回值与写入工作区的文件内容
+
+工作区在每次生成开始时会被清空，因此检查点保存文件内容本身而不是路径。
+依赖阶段的 content_hash 参与下游的 inputs_hash，上游变化会沿依赖图使下游失效。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .utils.paths import COPYRIGHT_CHECKPOINTS_DIR
+
+logger = logging.getLogger(__name__)
+
+# 检查点格式或阶段实现变化时递增，使旧检查点全部失效
+CHECKPOINT_VERSION = 1
+
+
+def hash_payload(value: Any) -> str:
+    raw = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def content_hash(result: Any, files: Dict[str, str]) -> str:
+    """阶段结果与产出文件的哈希（下游阶段的输入）"""
+    return hash_payload({"result": result, "files": files})
+
+
+@dataclass
+class StageCheckpoint:
+    stage: str
+    inputs_hash: str
+    content_hash: str
+    result: Any
+    files: Dict[str, str]
+
+
+def collect_outputs(project_dir: Path, paths: Iterable[str]) -> Dict[str, str]:
+    """读取阶段产出（相对工作区的文件或目录）为 {相对路径: 内容}"""
+    files: Dict[str, str] = {}
+    for relative in paths:
+        target = project_dir / relative
+        if target.is_dir():
+            candidates = sorted(path for path in target.rglob("*") if path.is_file())
+        elif target.is_file():
+            candidates = [target]
+        else:
+            continue
+        for path in candidates:
+            files[path.relative_to(project_dir).as_posix()] = path.read_text(encoding="utf-8")
+    return files
+
+
+def restore_outputs(project_dir: Path, files: Dict[str, str]) -> None:
+    root = project_dir.resolve()
+    for relative, content in files.items():
+        target = (project_dir / relative).resolve()
+        if root not in target.parents:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+
+
+class CheckpointStore:
+    """单个软著项目的阶段检查点"""
+
+    def __init__(self, project_id: int, root: Path = COPYRIGHT_CHECKPOINTS_DIR):
+        self.directory = root / str(project_id)
+
+    def _path(self, stage: str) -> Path:
+        return self.directory / f"{stage}.json"
+
+    def load(self, stage: str, inputs_hash: str) -> Optional[StageCheckpoint]:
+        """读取检查点，不存在、输入已变化或内容校验失败时返回 None"""
+        path = self._path(stage)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("读取检查点失败: %s", path)
+            return None
+        if data.get("version") != CHECKPOINT_VERSION or data.get("inputs_hash") != inputs_hash:
+            return None
+        result = data.get("result")
+        files = data.get("files") or {}
+        stored_hash = content_hash(result, files)
+        if stored_hash != data.get("content_hash"):
+            logger.warning("检查点内容校验失败，重新生成: %s", path)
+            return None
+        return StageCheckpoint(stage, inputs_hash, stored_hash, result, files)
+
+    def save(self, stage: str, inputs_hash: str, result: Any, files: Dict[str, str]) -> StageCheckpoint:
+        result_hash = content_hash(result, files)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "stage": stage,
+            "inputs_hash": inputs_hash,
+            "content_hash": result_hash,
+            "created_at": datetime.utcnow().isoformat(),
+            "result": result,
+            "files": files,
+        }
+        # 先写临时文件再替换，避免中途失败留下不完整的检查点
+        path = self._path(stage)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+        return StageCheckpoint(stage, inputs_hash, result_hash, result, files)
+
+    def has_any(self) -> bool:
+        return self.directory.exists() and any(self.directory.glob("*.json"))
+
+    def clear(self) -> None:
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
@@ -7,20 +7,39 @@ import json
 import logging
 import re
 import shutil
-import subprocess
 import sys
 import zipfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import asyncio
 import json as json_lib
 
 import openai
 
+from .ai_client import complete_chat, get_async_client, lease_client
+from .ai_errors import is_rate_limit_error
+from .ai_structured import is_valid_json
+from .config import (
+    COPYRIGHT_FRONTEND_PAGE_ATTEMPTS,
+    COPYRIGHT_FRONTEND_PAGE_CONCURRENCY,
+    COPYRIGHT_MAX_PARALLEL_STAGES,
+)
+from .copyright_checkpoints import (
+    CheckpointStore,
+    collect_outputs,
+    content_hash,
+    hash_payload,
+    restore_outputs,
+)
 from .database import SessionLocal
+from .job_queue import JobCancelledError, is_job_cancelled
 from .models import CopyrightJob, CopyrightProject, User
+from .offload import run_blocking
+from .utils.json_repair import parse_json_lenient
+from .utils.stage_graph import Stage, StageResults, run_stage_graph
 from .utils.paths import (
     COPYRIGHT_PROJECTS_DIR,
     COPYRIGHT_ZIPS_DIR,
@@ -53,36 +72,26 @@ def normalize_base_url(base_url: str) -> str:
     return f"{trimmed}/v1"
 
 
-def _collect_error_text(error: Exception) -> str:
-    parts: List[str] = [str(error), repr(error)]
-    body = getattr(error, "body", None)
-    if body is not None:
-        if isinstance(body, (dict, list)):
-            parts.append(json.dumps(body, ensure_ascii=False))
-        else:
-            parts.append(str(body))
-    return " ".join(part for part in parts if part).strip()
-
-
-def is_rate_limit_error(error: Exception) -> bool:
-    if hasattr(openai, "RateLimitError") and isinstance(error, openai.RateLimitError):
-        return True
-    status_code = getattr(error, "status_code", None)
-    if status_code == 429:
-        return True
-    response = getattr(error, "response", None)
-    if response is not None and getattr(response, "status_code", None) == 429:
-        return True
-    message = _collect_error_text(error).lower()
-    if "rate limit" in message or "too many requests" in message or "429" in message:
-        return True
-    return False
+# 随项目变化的模板变量不直接写入系统提示词，而是替换为对【项目参数】的引用，
+# 参数值放在用户消息开头。这样各阶段的系统提示词在所有项目之间字节一致，
+# 兼容的服务商可以复用缓存的前缀。
+PROJECT_PROMPT_VARIABLES = {
+    "title": "系统名称",
+    "short_title": "软件简称",
+    "framework_design": "框架设计文档路径",
+    "module_list": "功能模块清单",
+    "innovation_points": "核心创新点",
+}
 
 
 def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def _read_text_if_exists(path: Path) -> str:
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
 def render_prompt(template: str, variables: Dict[str, str]) -> str:
     rendered = template
     for key, value in variables.items():
@@ -90,6 +99,105 @@ def render_prompt(template: str, variables: Dict[str, str]) -> str:
     return rendered
 
 
+# 前端逐页生成使用的系统提示词。原 04 号提示词要求一次生成所有页面并拆分
+# css/js 目录，与每次调用只输出一个 HTML 文件的要求矛盾，因此单独维护。
+FRONTEND_PAGE_SYSTEM_PROMPT = """## 角色定义
+
+你是一名资深的前端开发工程师，熟练掌握 {{front}}（前端开发语言）与 HTML5、CSS3、JavaScript ES6+，擅长把界面设计方案转化为高质量、可维护的页面代码，熟悉软著申请材料对源代码的要求。
+
+## 核心任务
+
+每次调用只生成用户消息中指定的**一个页面**，输出该页面完整、可独立运行的 HTML 文件。其他页面由其他调用分别生成，不要输出。
+
+## 设计与导航
+
+- 严格按照用户消息中的界面设计方案实现色彩、字体、间距与组件规范。
+- 导航使用用户消息中给出的全部页面清单生成，链接指向对应的 .html 文件；所有页面使用相同的导航结构与类名，并高亮当前页面。
+- 为 AI 功能模块添加特殊的视觉标识与交互反馈。
+
+## 页面实现
+
+- 标准 HTML5 文档结构，包含 charset、viewport 与“页面标题 - 系统名称”格式的 title。
+- 实现页面规划中该页面的全部功能模块：数据展示、表单验证、交互逻辑，使用模拟数据。
+- CSS 与 JavaScript 全部内嵌在该 HTML 文件中，不引用本地 css/、js/ 目录下的文件。
+- 语义化标签，关键代码使用中文注释，缩进 2 个空格，变量使用驼峰命名。
+
+## 技术资源
+
+- CSS 框架：<link href="https://lf3-cdn-tos.bytecdntp.com/cdn/expire-1-M/tailwindcss/2.2.19/tailwind.min.css" rel="stylesheet">
+- 图标库：<link href="https://lf6-cdn-tos.bytecdntp.com/cdn/expire-100-M/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+- 中文字体：<link href="https://fonts.googleapis.com/css2?family=Noto+Serif+SC:wght@400;500;600;700&family=Noto+Sans+SC:wght@300;400;500;700&display=swap" rel="stylesheet">
+- 图表库（如需要）：<script src="https://cdn.bootcdn.net/ajax/libs/echarts/5.4.3/echarts.min.js"></script>
+
+## 输出要求
+
+- 只输出这一个页面的 HTML 文档，从 <!DOCTYPE html> 开始到 </html> 结束。
+- 不要输出其他页面、目录结构、解释文字或多个代码块。
+- 所有页面文字使用中文。
+"""
+
+# 不在 vendor 提示词目录中的阶段模板
+_INLINE_STAGE_TEMPLATES = {
+    "frontend_page": FRONTEND_PAGE_SYSTEM_PROMPT,
+}
+
+
+@lru_cache(maxsize=None)
+def load_stage_template(stage: str) -> str:
+    if stage in _INLINE_STAGE_TEMPLATES:
+        return _INLINE_STAGE_TEMPLATES[stage]
+    return _read_text(VENDOR_PROMPTS_DIR / PROMPT_FILES[stage])
+
+
+def render_stage_system_prompt(stage: str, variables: Dict[str, Any]) -> str:
+    """渲染阶段系统提示词，项目相关变量只保留引用"""
+    static_variables = {
+        key: value for key, value in variables.items() if key not in PROJECT_PROMPT_VARIABLES
+    }
+    static_variables.update(
+        {key: f"【项目参数·{label}】" for key, label in PROJECT_PROMPT_VARIABLES.items()}
+    )
+    return render_prompt(load_stage_template(stage), static_variables)
+
+
+def build_prompt_variables(config: Dict[str, Any]) -> Dict[str, Any]:
+    """由项目配置得到提示词模板变量（功能模块与创新点在框架设计阶段后填入）"""
+    return {
+        "front": config.get("front"),
+        "backend": config.get("backend"),
+        "title": config.get("title"),
+        "short_title": config.get("short_title"),
+        "requirements_description": config.get("requirements_description"),
+        "dev_tech_stack": config.get("dev_tech_stack"),
+        "ui_design_spec": config.get("ui_design_spec"),
+        "ui_design_style": config.get("ui_design_style"),
+        "generation_mode": config.get("generation_mode"),
+        "page_count_fast": config.get("page_count_fast"),
+        "page_count_full": config.get("page_count_full"),
+        "api_count_min": config.get("api_count_min"),
+        "api_count_max": config.get("api_count_max"),
+        "framework_design": config.get("framework_design"),
+        "page_list": config.get("page_list"),
+        "ui_design": config.get("ui_design"),
+        "database_schema": config.get("database_schema"),
+        "copyright_application": config.get("copyright_application"),
+        "module_list": "",
+        "innovation_points": "",
+    }
+
+
+def build_project_parameters(variables: Dict[str, Any]) -> str:
+    """渲染放在各阶段用户消息开头的项目参数"""
+    lines = ["【项目参数】"]
+    for key, label in PROJECT_PROMPT_VARIABLES.items():
+        value = str(variables.get(key) or "").strip() or "（暂无）"
+        if "\n" in value:
+            lines.append(f"- {label}：\n{value}")
+        else:
+            lines.append(f"- {label}：{value}")
+    return "\n".join(lines) + "\n\n"
+
+
 def truncate_text(text: str, max_chars: int = 12000) -> str:
     if len(text) <= max_chars:
         return text
@@ -226,43 +334,35 @@ async def run_prompt(
     user_prompt: str,
     model: str,
     temperature: float = 0.7,
+    use_cache: bool = True,
+    call_site: str = "copyright",
+    cache_validator: Optional[Callable[[str], bool]] = None,
 ) -> str:
-    last_error: Optional[Exception] = None
-    for attempt in range(3):
-        try:
-            response = await client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=temperature,
-            )
-            if not response.choices:
-                return ""
-            content = response.choices[0].message.content or ""
-            return content.strip()
-        except Exception as exc:
-            last_error = exc
-            if is_rate_limit_error(exc):
-                raise RuntimeError(
-                    "已触发接口限流（Rate Limit）。请稍后再试或更换接口提供商。"
-                    "建议避免同时发起多个生成任务。"
-                )
-            message = str(exc)
-            if isinstance(exc, json_lib.JSONDecodeError) or "Expecting value" in message:
-                logger.warning("AI 响应解析失败，尝试重试。")
-            if attempt < 2:
-                await asyncio.sleep(1.5 * (attempt + 1))
-                continue
-            break
-    if last_error:
-        message = str(last_error)
-        if isinstance(last_error, json_lib.JSONDecodeError) or "Expecting value" in message:
+    # 瞬时错误与限流的退避重试由 complete_chat 的统一重试策略处理
+    try:
+        return await complete_chat(
+            client,
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=temperature,
+            use_cache=use_cache,
+            call_site=call_site,
+            cache_validator=cache_validator,
+        )
+    except Exception as exc:
+        if is_rate_limit_error(exc):
+            raise RuntimeError(
+                "已触发接口限流（Rate Limit），多次排队重试后仍失败。请稍后再试或更换接口提供商。"
+            ) from exc
+        message = str(exc)
+        if isinstance(exc, json_lib.JSONDecodeError) or "Expecting value" in message:
             raise RuntimeError(
                 "AI 服务响应异常（返回空内容或非 JSON）。请检查 Base URL、模型名与网络连通性，并确认服务支持 OpenAI 兼容接口。"
-            )
-    raise RuntimeError(f"AI 调用失败：{last_error}")
+            ) from exc
+        raise RuntimeError(f"AI 调用失败：{exc}") from exc
 
 
 def parse_file_blocks(content: str) -> Dict[str, str]:
@@ -298,23 +398,40 @@ def safe_write_files(root_dir: Path, file_map: Dict[str, str]) -> List[Path]:
     return written
 
 
-async def extract_framework_insights(
-    client: openai.AsyncOpenAI,
-    framework_doc: str,
-    model: str,
-) -> Tuple[str, str]:
-    prompt = f"""请从以下框架设计文档中提取：
+INSIGHTS_SYSTEM_PROMPT = """你擅长结构化抽取软件文档信息。
+请从用户提供的框架设计文档中提取：
 1) 功能模块清单（列表）
 2) 核心创新点（列表）
 
 要求仅输出 JSON，对象字段为 module_list 和 innovation_points，均为字符串数组。
+"""
 
-框架设计文档：
+PAGE_ITEMS_SYSTEM_PROMPT = """你擅长从文档中提取页面结构。
+请从用户提供的页面规划文档中提取页面清单，输出 JSON 数组。
+每个元素包含：name（页面名称）、path（页面路径）、file（建议文件名，如 dashboard.html）、description（页面功能描述，50字以内）。
+"""
+
+
+def _has_insights(data: Dict[str, Any]) -> bool:
+    return "module_list" in data and "innovation_points" in data
+
+
+async def extract_framework_insights(
+    client: openai.AsyncOpenAI,
+    framework_doc: str,
+    model: str,
+    use_cache: bool = True,
+) -> Tuple[str, str]:
+    prompt = f"""框架设计文档：
 {truncate_text(framework_doc, 10000)}
 """
-    content = await run_prompt(client, "你擅长结构化抽取软件文档信息。", prompt, model, temperature=0.2)
+    content = await run_prompt(
+        client, INSIGHTS_SYSTEM_PROMPT, prompt, model, temperature=0.2, use_cache=use_cache,
+        call_site="copyright.insights",
+        cache_validator=lambda text: is_valid_json(text, dict, _has_insights),
+    )
     try:
-        data = json.loads(content)
+        data, _ = parse_json_lenient(content, dict, _has_insights)
         module_list = data.get("module_list") or []
         innovation_points = data.get("innovation_points") or []
         module_text = "\n".join(f"- {item}" for item in module_list) if module_list else ""
@@ -325,20 +442,32 @@ async def extract_framework_insights(
         return "", ""
 
 
+# 页面清单解析失败时使用的默认页面
+DEFAULT_PAGE_ITEMS: List[Dict[str, str]] = [
+    {"name": "仪表盘", "path": "/dashboard", "file": "dashboard.html", "description": "系统总览与关键指标展示。"},
+    {"name": "项目管理", "path": "/projects", "file": "projects.html", "description": "软著项目的创建、编辑与查看。"},
+    {"name": "生成中心", "path": "/generate", "file": "generate.html", "description": "一键生成软著材料与进度管理。"},
+    {"name": "系统设置", "path": "/settings", "file": "settings.html", "description": "系统配置与用户权限管理。"},
+    {"name": "帮助中心", "path": "/help", "file": "help.html", "description": "使用说明与常见问题。"},
+]
+
+
 async def extract_page_items(
     client: openai.AsyncOpenAI,
     page_plan_doc: str,
     model: str,
+    use_cache: bool = True,
 ) -> List[Dict[str, str]]:
-    prompt = f"""请从以下页面规划文档中提取页面清单，输出 JSON 数组。
-每个元素包含：name（页面名称）、path（页面路径）、file（建议文件名，如 dashboard.html）、description（页面功能描述，50字以内）。
-
-页面规划文档：
+    prompt = f"""页面规划文档：
 {truncate_text(page_plan_doc, 10000)}
 """
-    content = await run_prompt(client, "你擅长从文档中提取页面结构。", prompt, model, temperature=0.2)
+    content = await run_prompt(
+        client, PAGE_ITEMS_SYSTEM_PROMPT, prompt, model, temperature=0.2, use_cache=use_cache,
+        call_site="copyright.page_items",
+        cache_validator=lambda text: is_valid_json(text, list),
+    )
     try:
-        data = json.loads(content)
+        data, _ = parse_json_lenient(content, list)
         if isinstance(data, list):
             return [
                 {
@@ -352,13 +481,136 @@ async def extract_page_items(
             ]
     except Exception:
         logger.warning("解析页面清单失败，使用默认页面。")
-    return [
-        {"name": "仪表盘", "path": "/dashboard", "file": "dashboard.html", "description": "系统总览与关键指标展示。"},
-        {"name": "项目管理", "path": "/projects", "file": "projects.html", "description": "软著项目的创建、编辑与查看。"},
-        {"name": "生成中心", "path": "/generate", "file": "generate.html", "description": "一键生成软著材料与进度管理。"},
-        {"name": "系统设置", "path": "/settings", "file": "settings.html", "description": "系统配置与用户权限管理。"},
-        {"name": "帮助中心", "path": "/help", "file": "help.html", "description": "使用说明与常见问题。"},
-    ]
+    return [dict(page) for page in DEFAULT_PAGE_ITEMS]
+
+
+_HTML_FENCE_PATTERN = re.compile(r"```(?:html|HTML)?\s*\n(.*?)```", re.DOTALL)
+
+
+def extract_html_document(content: str) -> Optional[str]:
+    """
+    从模型输出中提取第一个完整的 HTML 文档
+
+    截取到起始位置之后的第一个 </html>，模型多输出了其他页面时只保留第一个；
+    缺少 </html>（输出被截断）时返回 None。
+    """
+    text = content.strip()
+    fenced = _HTML_FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+    lower = text.lower()
+    start = lower.find("<!doctype")
+    if start < 0:
+        start = lower.find("<html")
+    if start < 0:
+        return None
+    end = lower.find("</html>", start)
+    if end < 0:
+        return None
+    return text[start:end + len("</html>")]
+
+
+def assign_page_files(pages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """规范化页面文件名：只保留文件名部分、统一 .html 后缀并去重"""
+    used: set = set()
+    assigned: List[Dict[str, str]] = []
+    for index, page in enumerate(pages, start=1):
+        stem = Path(str(page.get("file") or "")).stem or f"page{index}"
+        filename = f"{stem}.html"
+        if filename in used:
+            filename = f"{stem}-{index}.html"
+        used.add(filename)
+        assigned.append({**page, "file": filename})
+    return assigned
+
+
+async def generate_frontend_pages(
+    client: openai.AsyncOpenAI,
+    model: str,
+    system_prompt: str,
+    project_parameters: str,
+    pages: List[Dict[str, str]],
+    ui_doc: str,
+    project_dir: Path,
+    system_name: str,
+    use_cache: bool = True,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    逐页并发生成前端页面，每次调用只输出一个 HTML 文件
+
+    同时进行的页面数不超过 COPYRIGHT_FRONTEND_PAGE_CONCURRENCY；单页调用失败或
+    输出被截断时跳过缓存重新生成，最多 COPYRIGHT_FRONTEND_PAGE_ATTEMPTS 次，
+    仍失败的页面使用占位页面。每完成一页调用 on_progress(已完成页数, 总页数)；
+    任一页面（或 on_progress）抛出异常时取消其余页面后抛出。
+
+    Returns:
+        {"generated": 模型生成的页面数, "fallback": 使用占位的页面数}
+    """
+    pages = assign_page_files(pages)
+    navigation = json.dumps(
+        [{"name": page.get("name"), "file": page["file"]} for page in pages],
+        ensure_ascii=False,
+    )
+    ui_excerpt = truncate_text(ui_doc, 8000)
+    semaphore = asyncio.Semaphore(max(COPYRIGHT_FRONTEND_PAGE_CONCURRENCY, 1))
+    summary = {"generated": 0, "fallback": 0}
+    finished = 0
+
+    async def _generate(page: Dict[str, str]) -> None:
+        nonlocal finished
+        target = f"output_sourcecode/front/{page['file']}"
+        # 导航、设计方案等公共部分在前，便于服务商复用提示词前缀缓存
+        user_prompt = project_parameters + f"""全部页面（用于生成导航链接）：
+{navigation}
+
+界面设计方案：
+{ui_excerpt}
+
+本次只生成以下单个页面：
+{json.dumps(page, ensure_ascii=False, indent=2)}
+
+输出要求：只输出该页面完整的 HTML 文档（从 <!DOCTYPE html> 到 </html>），不要输出其他页面或解释文字。
+目标文件：{target}
+"""
+        html: Optional[str] = None
+        async with semaphore:
+            for attempt in range(max(COPYRIGHT_FRONTEND_PAGE_ATTEMPTS, 1)):
+                try:
+                    output = await run_prompt(
+                        client, system_prompt, user_prompt, model,
+                        use_cache=use_cache and attempt == 0,
+                        call_site="copyright.frontend_page",
+                        cache_validator=lambda text: extract_html_document(text) is not None,
+                    )
+                except RuntimeError as exc:
+                    logger.warning("生成页面 %s 失败（第 %d 次）: %s", page["file"], attempt + 1, exc)
+                    continue
+                html = extract_html_document(output)
+                if html:
+                    break
+                logger.warning("页面 %s 输出不完整（第 %d 次），重新生成", page["file"], attempt + 1)
+
+        if html:
+            safe_write_files(project_dir, {target: html})
+            summary["generated"] += 1
+        else:
+            create_fallback_frontend_files(project_dir, system_name, [page])
+            summary["fallback"] += 1
+        finished += 1
+        if on_progress is not None:
+            on_progress(finished, len(pages))
+
+    # 任一页面抛出异常（如 on_progress 中发现任务已取消）时取消其余页面，
+    # 等待它们结束后再抛出，避免任务结束后仍有模型调用与文件写入
+    tasks = [asyncio.create_task(_generate(page)) for page in pages]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return summary
 
 
 def create_fallback_frontend_files(
@@ -482,7 +734,17 @@ def update_job_state(
     progress: Optional[int] = None,
     error: Optional[str] = None,
     output_zip_path: Optional[str] = None,
+    stage_states: Optional[Dict[str, str]] = None,
 ) -> None:
+    """
+    写入任务状态
+
+    Raises:
+        JobCancelledError: 任务已被取消（不覆盖 cancelled 状态，并中止生成流程）
+    """
+    if is_job_cancelled(db, job.id):
+        db.rollback()
+        raise JobCancelledError(f"任务已取消: job={job.id}")
     if status is not None:
         job.status = status
     if stage is not None:
@@ -495,24 +757,302 @@ def update_job_state(
         job.error = error
     if output_zip_path is not None:
         job.output_zip_path = output_zip_path
+    if stage_states is not None:
+        job.stage_states = dict(stage_states)
     db.commit()
     db.refresh(job)
 
 
-async def run_copyright_generation(job_id: int, project_id: int, user_id: int) -> None:
+# 生成流水线的阶段依赖图：(阶段, 依赖, 展示名称, 进度权重)
+# 框架设计之后，登记信息表只依赖框架设计；界面设计完成后前端、数据库、用户手册互不依赖，
+# 后端源码依赖数据库脚本的表结构。
+COPYRIGHT_STAGE_SPECS: List[Tuple[str, Tuple[str, ...], str, float]] = [
+    ("framework", (), "框架设计文档", 2.0),
+    ("page_plan", ("framework",), "页面规划文档", 1.5),
+    ("page_items", ("page_plan",), "页面清单", 0.5),
+    ("ui_design", ("framework", "page_plan"), "界面设计方案", 1.5),
+    ("frontend", ("page_items", "ui_design"), "前端源码", 3.0),
+    ("database", ("framework", "page_plan", "ui_design"), "数据库脚本", 1.5),
+    ("backend", ("framework", "page_plan", "database"), "后端源码", 2.5),
+    ("manual", ("framework", "page_plan", "ui_design"), "用户手册", 2.0),
+    ("form", ("framework",), "登记信息表", 1.0),
+]
+
+# AI 生成阶段在整体进度中的区间
+_STAGE_PROGRESS_START = 15
+_STAGE_PROGRESS_END = 90
+
+
+def build_copyright_stages(
+    runners: Dict[str, Callable[[StageResults], Awaitable[Any]]],
+) -> List[Stage]:
+    """按 COPYRIGHT_STAGE_SPECS 组装阶段图，runners 为各阶段的执行函数"""
+    return [
+        Stage(name=name, run=runners[name], deps=deps, label=label, weight=weight)
+        for name, deps, label, weight in COPYRIGHT_STAGE_SPECS
+    ]
+
+
+# 各阶段使用的系统提示词模板（参与检查点的输入哈希，模板更新后检查点失效）
+_STAGE_TEMPLATE_KEYS: Dict[str, str] = {
+    "framework": "framework",
+    "page_plan": "page_list",
+    "ui_design": "ui_design",
+    "frontend": "frontend_page",
+    "database": "database",
+    "backend": "backend",
+    "manual": "user_manual",
+    "form": "application_form",
+}
+
+
+def _stage_prompt_fingerprint(name: str) -> str:
+    prompts = []
+    if name in _STAGE_TEMPLATE_KEYS:
+        prompts.append(load_stage_template(_STAGE_TEMPLATE_KEYS[name]))
+    if name == "framework":
+        prompts.append(INSIGHTS_SYSTEM_PROMPT)
+    if name == "page_items":
+        prompts.append(PAGE_ITEMS_SYSTEM_PROMPT)
+    return hash_payload(prompts)
+
+
+def checkpoint_stages(
+    stages: List[Stage],
+    store: CheckpointStore,
+    *,
+    project_dir: Path,
+    base_inputs: Dict[str, Any],
+    stage_inputs: Dict[str, Dict[str, Any]],
+    stage_outputs: Dict[str, List[str]],
+    resume: bool,
+    fallback_stages: Optional[Set[str]] = None,
+    on_reuse: Optional[Callable[[str], None]] = None,
+) -> List[Stage]:
+    """
+    为阶段加上检查点：完成后保存结果与产出文件
+
+    阶段的输入哈希由公共输入、阶段自身输入、提示词模板与依赖阶段的 content_hash
+    组成；resume 时输入哈希一致的阶段直接恢复检查点（写回产出文件），不再调用模型。
+
+    阶段使用了占位内容（模型输出无法解析等）时把阶段名加入 fallback_stages，
+    这类结果不保存检查点，续跑时重新生成。
+    """
+    fallback_stages = fallback_stages if fallback_stages is not None else set()
+    content_hashes: Dict[str, str] = {}
+
+    def _wrap(stage: Stage) -> Stage:
+        async def _run(results: StageResults) -> Any:
+            inputs_hash = hash_payload({
+                "stage": stage.name,
+                "common": base_inputs,
+                "inputs": stage_inputs.get(stage.name, {}),
+                "prompts": _stage_prompt_fingerprint(stage.name),
+                "deps": {dep: content_hashes[dep] for dep in stage.deps},
+            })
+            if resume:
+                checkpoint = await run_blocking(store.load, stage.name, inputs_hash)
+                if checkpoint is not None:
+                    await run_blocking(restore_outputs, project_dir, checkpoint.files)
+                    content_hashes[stage.name] = checkpoint.content_hash
+                    if on_reuse is not None:
+                        on_reuse(stage.name)
+                    return checkpoint.result
+            result = await stage.run(results)
+            files = await run_blocking(collect_outputs, project_dir, stage_outputs.get(stage.name, []))
+            if stage.name in fallback_stages:
+                logger.warning("阶段 %s 使用了占位内容，不保存检查点", stage.name)
+                content_hashes[stage.name] = content_hash(result, files)
+                return result
+            checkpoint = await run_blocking(store.save, stage.name, inputs_hash, result, files)
+            content_hashes[stage.name] = checkpoint.content_hash
+            return result
+
+        return Stage(name=stage.name, run=_run, deps=stage.deps, label=stage.label, weight=stage.weight)
+
+    return [_wrap(stage) for stage in stages]
+
+
+class _StageProgressTracker:
+    """
+    把阶段的开始/完成同步到 CopyrightJob（整体进度按已完成阶段的权重计算）
+
+    阶段回调在事件循环中同步调用，状态写入交给后台任务在线程池中执行，
+    写入期间产生的新状态合并为一次写入。写入失败（如任务已取消）时，
+    下一次回调抛出该异常以中止生成流程。
+    """
+
+    def __init__(self, db, job: CopyrightJob, stages: List[Stage]):
+        self.db = db
+        self.job = job
+        self._pending: Optional[Dict[str, Any]] = None
+        self._writer: Optional["asyncio.Task[None]"] = None
+        self._error: Optional[BaseException] = None
+        self.stages = stages
+        self.total_weight = sum(stage.weight for stage in stages) or 1.0
+        self.done_weight = 0.0
+        self.running: List[Stage] = []
+        self.states: Dict[str, str] = {stage.name: "pending" for stage in stages}
+        # 进行中阶段的完成比例与进度说明（如前端逐页生成时的页数）
+        self.fractions: Dict[str, float] = {}
+        self.details: Dict[str, str] = {}
+
+    def _report(self) -> None:
+        span = _STAGE_PROGRESS_END - _STAGE_PROGRESS_START
+        weight = self.done_weight + sum(
+            stage.weight * self.fractions.get(stage.name, 0.0) for stage in self.running
+        )
+        progress = _STAGE_PROGRESS_START + int(span * weight / self.total_weight)
+        if self.running:
+            labels = [
+                f"{stage.label}（{self.details[stage.name]}）" if stage.name in self.details else stage.label
+                for stage in self.running
+            ]
+            message = f"生成{'、'.join(labels)}..."
+        else:
+            message = "AI 生成阶段已完成"
+        if self._error is not None:
+            raise self._error
+        self._pending = {"message": message, "progress": progress, "stage_states": dict(self.states)}
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._pending is not None:
+            fields, self._pending = self._pending, None
+            try:
+                await run_blocking(update_job_state, self.db, self.job, stage="generating", **fields)
+            except (Exception, JobCancelledError) as exc:
+                self._error = exc
+                self._pending = None
+                return
+
+    async def wait_idle(self) -> None:
+        """等待进行中的状态写入完成（之后才能在其他地方使用同一数据库会话）"""
+        if self._writer is not None:
+            await asyncio.gather(self._writer, return_exceptions=True)
+
+    async def drain(self) -> None:
+        """等待状态写入完成，写入失败时抛出该异常"""
+        await self.wait_idle()
+        if self._error is not None:
+            raise self._error
+
+    def started(self, stage: Stage) -> None:
+        self.running.append(stage)
+        self.states[stage.name] = "running"
+        self._report()
+
+    def advance(self, name: str, fraction: float, detail: str) -> None:
+        """更新进行中阶段的完成比例与进度说明"""
+        self.fractions[name] = min(max(fraction, 0.0), 1.0)
+        self.details[name] = detail
+        self._report()
+
+    def reused(self, name: str) -> None:
+        """阶段直接复用了检查点"""
+        self.states[name] = "reused"
+
+    def finished(self, stage: Stage) -> None:
+        self.running.remove(stage)
+        if self.states.get(stage.name) != "reused":
+            self.states[stage.name] = "completed"
+        self.done_weight += stage.weight
+        self.fractions.pop(stage.name, None)
+        self.details.pop(stage.name, None)
+        self._report()
+
+
+def _load_generation_inputs(
+    db, job_id: int, project_id: int, user_id: int
+) -> Tuple[Optional[CopyrightJob], Optional[CopyrightProject], Optional[User]]:
+    job = db.query(CopyrightJob).filter(CopyrightJob.id == job_id).first()
+    project = db.query(CopyrightProject).filter(
+        CopyrightProject.id == project_id, CopyrightProject.user_id == user_id
+    ).first()
+    user = db.query(User).filter(User.id == user_id).first()
+    # 项目与用户只读取已加载的字段：脱离会话，避免提交任务状态后在事件循环上重新加载
+    for instance in (project, user):
+        if instance is not None:
+            db.expunge(instance)
+    return job, project, user
+
+
+# 取消 / 失败收尾使用独立会话：被取消的 run_blocking 调用可能仍在线程池中使用任务的共享会话，
+# Session 不能跨线程并发使用
+def _mark_cancelled_stages(job_id: int) -> None:
     db = SessionLocal()
     try:
         job = db.query(CopyrightJob).filter(CopyrightJob.id == job_id).first()
-        project = db.query(CopyrightProject).filter(
-            CopyrightProject.id == project_id, CopyrightProject.user_id == user_id
-        ).first()
-        user = db.query(User).filter(User.id == user_id).first()
+        if job and job.status == "cancelled":
+            job.stage_states = {
+                name: "cancelled" if state in ("running", "pending") else state
+                for name, state in (job.stage_states or {}).items()
+            }
+            db.commit()
+    finally:
+        db.close()
+
+
+def _mark_job_failed(job_id: int, exc: Exception) -> None:
+    db = SessionLocal()
+    try:
+        job = db.query(CopyrightJob).filter(CopyrightJob.id == job_id).first()
+        if not job:
+            return
+        error_message = str(exc)
+        if is_rate_limit_error(exc):
+            error_message = (
+                "已触发接口限流（Rate Limit），多次排队重试后仍失败。请稍后再试或更换接口提供商。"
+            )
+        # 失败时仍在执行的阶段（失败阶段及被取消的并发阶段）标记为 failed
+        stage_states = {
+            name: "failed" if state == "running" else state
+            for name, state in (job.stage_states or {}).items()
+        }
+        update_job_state(
+            db,
+            job,
+            status="failed",
+            stage="error",
+            message=f"生成失败：{error_message}",
+            error=error_message,
+            progress=0,
+            stage_states=stage_states,
+        )
+    except JobCancelledError:
+        pass
+    finally:
+        db.close()
+
+
+async def run_copyright_generation(
+    job_id: int,
+    project_id: int,
+    user_id: int,
+    use_cache: bool = True,
+    resume: bool = False,
+) -> None:
+    """
+    执行软著材料生成任务
+
+    Args:
+        use_cache: 是否允许使用生成缓存
+        resume: 是否复用上次生成的阶段检查点（只重新生成输入发生变化的阶段）
+    """
+    db = SessionLocal()
+    tracker: Optional[_StageProgressTracker] = None
+    try:
+        job, project, user = await run_blocking(
+            _load_generation_inputs, db, job_id, project_id, user_id
+        )
 
         if not job or not project or not user:
             return
 
         if not user.ai_api_key or not user.ai_base_url:
-            update_job_state(
+            await run_blocking(
+                update_job_state,
                 db,
                 job,
                 status="failed",
@@ -524,7 +1064,8 @@ async def run_copyright_generation(job_id: int, project_id: int, user_id: int) -
             return
 
         if not project.requirements_text or not project.requirements_text.strip():
-            update_job_state(
+            await run_blocking(
+                update_job_state,
                 db,
                 job,
                 status="failed",
@@ -535,7 +1076,8 @@ async def run_copyright_generation(job_id: int, project_id: int, user_id: int) -
             )
             return
 
-        update_job_state(
+        await run_blocking(
+            update_job_state,
             db,
             job,
             status="running",
@@ -544,8 +1086,9 @@ async def run_copyright_generation(job_id: int, project_id: int, user_id: int) -
             progress=5,
         )
 
-        project_dir = prepare_project_workspace(project.id)
-        requirements_path, ui_path, tech_path = write_project_documents(
+        project_dir = await run_blocking(prepare_project_workspace, project.id)
+        requirements_path, ui_path, tech_path = await run_blocking(
+            write_project_documents,
             project_dir=project_dir,
             system_name=project.system_name or project.name,
             domain=project.domain,
@@ -562,7 +1105,8 @@ async def run_copyright_generation(job_id: int, project_id: int, user_id: int) -
             if project.generation_mode and project.generation_mode.lower() in {"fast", "full"}
             else "fast"
         )
-        config = build_project_config(
+        config = await run_blocking(
+            build_project_config,
             project_dir=project_dir,
             system_name=project.system_name or project.name,
             software_abbr=project.software_abbr or project.name,
@@ -571,251 +1115,264 @@ async def run_copyright_generation(job_id: int, project_id: int, user_id: int) -
             include_tech_desc=project.include_tech_desc,
         )
 
-        variables = {
-            "front": config.get("front"),
-            "backend": config.get("backend"),
-            "title": config.get("title"),
-            "short_title": config.get("short_title"),
-            "requirements_description": config.get("requirements_description"),
-            "dev_tech_stack": config.get("dev_tech_stack"),
-            "ui_design_spec": config.get("ui_design_spec"),
-            "ui_design_style": config.get("ui_design_style"),
-            "generation_mode": config.get("generation_mode"),
-            "page_count_fast": config.get("page_count_fast"),
-            "page_count_full": config.get("page_count_full"),
-            "api_count_min": config.get("api_count_min"),
-            "api_count_max": config.get("api_count_max"),
-            "framework_design": config.get("framework_design"),
-            "page_list": config.get("page_list"),
-            "ui_design": config.get("ui_design"),
-            "database_schema": config.get("database_schema"),
-            "copyright_application": config.get("copyright_application"),
-            "module_list": "",
-            "innovation_points": "",
-        }
+        variables = build_prompt_variables(config)
 
         base_url = normalize_base_url(user.ai_base_url)
-        client = openai.AsyncOpenAI(api_key=user.ai_api_key, base_url=base_url)
+        client = get_async_client(user.ai_api_key, base_url)
         model = user.ai_model_name or "gpt-4"
-
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成框架设计文档...",
-            progress=15,
-        )
-        framework_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["framework"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        framework_user = f"""需求文档内容：
-{truncate_text(project.requirements_text, 12000)}
+        requirements_text = project.requirements_text
+        system_title = config.get("title")
+        tech_text = await run_blocking(_read_text_if_exists, tech_path)
+        ui_spec_content = ""
+        if project.include_ui_desc:
+            ui_spec_content = await run_blocking(_read_text_if_exists, ui_path)
+
+        # 使用了占位内容的阶段，不保存检查点
+        fallback_stages: Set[str] = set()
+
+        def _stage_variables(results: StageResults) -> Dict[str, Any]:
+            # 功能模块与创新点由框架设计阶段抽取
+            framework = results["framework"]
+            return {
+                **variables,
+                "module_list": framework["module_list"],
+                "innovation_points": framework["innovation_points"],
+            }
+
+        async def _framework_stage(results: StageResults) -> Dict[str, str]:
+            framework_prompt = render_stage_system_prompt("framework", variables)
+            framework_user = build_project_parameters(variables) + f"""需求文档内容：
+{truncate_text(requirements_text, 12000)}
 
 技术栈说明：
-{truncate_text(tech_path.read_text(encoding="utf-8") if tech_path.exists() else "", 4000)}
+{truncate_text(tech_text, 4000)}
 """
-        framework_doc = await run_prompt(client, framework_prompt, framework_user, model)
-        framework_path = project_dir / config.get("framework_design")
-        framework_path.write_text(framework_doc + "\n", encoding="utf-8")
-
-        module_list, innovation_points = await extract_framework_insights(
-            client, framework_doc, model
-        )
-        variables["module_list"] = module_list
-        variables["innovation_points"] = innovation_points
+            framework_doc = await run_prompt(
+                client, framework_prompt, framework_user, model, use_cache=use_cache,
+                call_site="copyright.framework",
+            )
+            framework_path = project_dir / config.get("framework_design")
+            framework_path.write_text(framework_doc + "\n", encoding="utf-8")
 
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成页面规划文档...",
-            progress=30,
-        )
-        page_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["page_list"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        page_user = f"""框架设计文档：
-{truncate_text(framework_doc, 12000)}
+            module_list, innovation_points = await extract_framework_insights(
+                client, framework_doc, model, use_cache=use_cache
+            )
+            return {
+                "doc": framework_doc,
+                "module_list": module_list,
+                "innovation_points": innovation_points,
+            }
+
+        async def _page_plan_stage(results: StageResults) -> str:
+            stage_vars = _stage_variables(results)
+            page_prompt = render_stage_system_prompt("page_list", stage_vars)
+            page_user = build_project_parameters(stage_vars) + f"""框架设计文档：
+{truncate_text(results["framework"]["doc"], 12000)}
 """
-        page_doc = await run_prompt(client, page_prompt, page_user, model)
-        page_path = project_dir / config.get("page_list")
-        page_path.write_text(page_doc + "\n", encoding="utf-8")
-
-        pages = await extract_page_items(client, page_doc, model)
-
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成界面设计方案...",
-            progress=45,
-        )
-        ui_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["ui_design"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        ui_spec_content = ""
-        if ui_path.exists() and project.include_ui_desc:
-            ui_spec_content = ui_path.read_text(encoding="utf-8")
-        ui_user = f"""页面规划文档：
-{truncate_text(page_doc, 12000)}
+            page_doc = await run_prompt(
+                client, page_prompt, page_user, model, use_cache=use_cache,
+                call_site="copyright.page_plan",
+            )
+            page_path = project_dir / config.get("page_list")
+            page_path.write_text(page_doc + "\n", encoding="utf-8")
+            return page_doc
+
+        async def _page_items_stage(results: StageResults) -> List[Dict[str, str]]:
+            pages = await extract_page_items(client, results["page_plan"], model, use_cache=use_cache)
+            if pages == DEFAULT_PAGE_ITEMS:
+                fallback_stages.add("page_items")
+            return pages
+
+        async def _ui_design_stage(results: StageResults) -> str:
+            stage_vars = _stage_variables(results)
+            ui_prompt = render_stage_system_prompt("ui_design", stage_vars)
+            ui_user = build_project_parameters(stage_vars) + f"""页面规划文档：
+{truncate_text(results["page_plan"], 12000)}
 
 框架设计文档：
-{truncate_text(framework_doc, 6000)}
+{truncate_text(results["framework"]["doc"], 6000)}
 
 UI设计规范：
 {truncate_text(ui_spec_content, 4000)}
 """
-        ui_doc = await run_prompt(client, ui_prompt, ui_user, model)
-        ui_path_out = project_dir / config.get("ui_design")
-        ui_path_out.write_text(ui_doc + "\n", encoding="utf-8")
-
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成前端源码...",
-            progress=55,
-        )
-        frontend_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["frontend"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        page_list_hint = json.dumps(pages, ensure_ascii=False, indent=2)
-        frontend_user = f"""请根据以下页面清单和设计方案生成前端代码。
-页面清单(JSON)：
-{page_list_hint}
-
-界面设计方案：
-{truncate_text(ui_doc, 8000)}
-
-输出格式要求：
-使用多文件格式输出，每个文件以行首 `### FILE: output_sourcecode/front/文件名` 标记。
-示例：
-### FILE: output_sourcecode/front/dashboard.html
-<html>...</html>
-"""
-        frontend_output = await run_prompt(client, frontend_prompt, frontend_user, model)
-        frontend_files = parse_file_blocks(frontend_output)
-        if frontend_files:
-            written = safe_write_files(project_dir, frontend_files)
-            html_written = [path for path in written if path.suffix.lower() == ".html"]
-            if not html_written:
-                create_fallback_frontend_files(project_dir, config.get("title"), pages)
-        else:
-            create_fallback_frontend_files(project_dir, config.get("title"), pages)
+            ui_doc = await run_prompt(
+                client, ui_prompt, ui_user, model, use_cache=use_cache,
+                call_site="copyright.ui_design",
+            )
+            ui_path_out = project_dir / config.get("ui_design")
+            ui_path_out.write_text(ui_doc + "\n", encoding="utf-8")
+            return ui_doc
+
+        async def _frontend_stage(results: StageResults) -> None:
+            pages = results["page_items"]
+            stage_vars = _stage_variables(results)
+
+            def _on_page(done: int, total: int) -> None:
+                tracker.advance("frontend", done / total, f"{done}/{total} 页")
+
+            summary = await generate_frontend_pages(
+                client,
+                model,
+                render_stage_system_prompt("frontend_page", stage_vars),
+                build_project_parameters(stage_vars),
+                pages,
+                results["ui_design"],
+                project_dir,
+                system_title,
+                use_cache=use_cache,
+                on_progress=_on_page,
+            )
+            if summary["fallback"]:
+                fallback_stages.add("frontend")
+                logger.warning(
+                    "前端页面生成完成：%d 页，占位 %d 页", summary["generated"], summary["fallback"]
+                )
 
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成数据库脚本...",
-            progress=65,
-        )
-        db_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["database"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        db_user = f"""框架设计文档：
-{truncate_text(framework_doc, 8000)}
+        async def _database_stage(results: StageResults) -> None:
+            stage_vars = _stage_variables(results)
+            db_prompt = render_stage_system_prompt("database", stage_vars)
+            db_user = build_project_parameters(stage_vars) + f"""框架设计文档：
+{truncate_text(results["framework"]["doc"], 8000)}
 
 页面规划：
-{truncate_text(page_doc, 8000)}
+{truncate_text(results["page_plan"], 8000)}
 
 界面设计：
-{truncate_text(ui_doc, 4000)}
+{truncate_text(results["ui_design"], 4000)}
 
 输出格式要求：
 使用多文件格式输出，每个文件以行首 `### FILE: output_sourcecode/db/文件名` 标记。
 """
-        db_output = await run_prompt(client, db_prompt, db_user, model)
-        db_files = parse_file_blocks(db_output)
-        if db_files:
-            safe_write_files(project_dir, db_files)
-        else:
-            create_fallback_database_files(project_dir, config.get("title"))
-
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成后端源码...",
-            progress=75,
-        )
-        backend_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["backend"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        backend_user = f"""框架设计文档：
-{truncate_text(framework_doc, 8000)}
+            db_output = await run_prompt(
+                client, db_prompt, db_user, model, use_cache=use_cache,
+                call_site="copyright.database",
+                cache_validator=lambda text: bool(parse_file_blocks(text)),
+            )
+            db_files = parse_file_blocks(db_output)
+            if db_files:
+                safe_write_files(project_dir, db_files)
+            else:
+                fallback_stages.add("database")
+                create_fallback_database_files(project_dir, system_title)
+
+        async def _backend_stage(results: StageResults) -> None:
+            stage_vars = _stage_variables(results)
+            schema_path = project_dir / config.get("database_schema")
+            schema_text = schema_path.read_text(encoding="utf-8") if schema_path.exists() else ""
+            backend_prompt = render_stage_system_prompt("backend", stage_vars)
+            backend_user = build_project_parameters(stage_vars) + f"""框架设计文档：
+{truncate_text(results["framework"]["doc"], 8000)}
 
 页面规划：
-{truncate_text(page_doc, 8000)}
+{truncate_text(results["page_plan"], 8000)}
 
 数据库设计：
-{truncate_text((project_dir / config.get('database_schema')).read_text(encoding='utf-8') if (project_dir / config.get('database_schema')).exists() else '', 6000)}
+{truncate_text(schema_text, 6000)}
 
 输出格式要求：
 使用多文件格式输出，每个文件以行首 `### FILE: output_sourcecode/backend/文件名` 标记。
 """
-        backend_output = await run_prompt(client, backend_prompt, backend_user, model)
-        backend_files = parse_file_blocks(backend_output)
-        if backend_files:
-            safe_write_files(project_dir, backend_files)
-        else:
-            create_fallback_backend_files(project_dir, config.get("title"))
-
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成用户手册...",
-            progress=82,
-        )
-        manual_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["user_manual"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        manual_user = f"""需求文档：
-{truncate_text(project.requirements_text, 8000)}
+            backend_output = await run_prompt(
+                client, backend_prompt, backend_user, model, use_cache=use_cache,
+                call_site="copyright.backend",
+                cache_validator=lambda text: bool(parse_file_blocks(text)),
+            )
+            backend_files = parse_file_blocks(backend_output)
+            if backend_files:
+                safe_write_files(project_dir, backend_files)
+            else:
+                fallback_stages.add("backend")
+                create_fallback_backend_files(project_dir, system_title)
+
+        async def _manual_stage(results: StageResults) -> None:
+            stage_vars = _stage_variables(results)
+            manual_prompt = render_stage_system_prompt("user_manual", stage_vars)
+            manual_user = build_project_parameters(stage_vars) + f"""需求文档：
+{truncate_text(requirements_text, 8000)}
 
 框架设计：
-{truncate_text(framework_doc, 6000)}
+{truncate_text(results["framework"]["doc"], 6000)}
 
 页面规划：
-{truncate_text(page_doc, 6000)}
+{truncate_text(results["page_plan"], 6000)}
 
 界面设计：
-{truncate_text(ui_doc, 6000)}
+{truncate_text(results["ui_design"], 6000)}
 """
-        manual_doc = await run_prompt(client, manual_prompt, manual_user, model)
-        manual_path = project_dir / "output_docs" / "用户手册.txt"
-        manual_path.write_text(manual_doc + "\n", encoding="utf-8")
+            manual_doc = await run_prompt(
+                client, manual_prompt, manual_user, model, use_cache=use_cache,
+                call_site="copyright.manual",
+            )
+            manual_path = project_dir / "output_docs" / "用户手册.txt"
+            manual_path.write_text(manual_doc + "\n", encoding="utf-8")
 
-        update_job_state(
-            db,
-            job,
-            stage="generating",
-            message="生成登记信息表...",
-            progress=88,
-        )
-        form_prompt = render_prompt(
-            (VENDOR_PROMPTS_DIR / PROMPT_FILES["application_form"]).read_text(encoding="utf-8"),
-            variables,
-        )
-        form_user = f"""需求文档：
-{truncate_text(project.requirements_text, 6000)}
+        async def _form_stage(results: StageResults) -> None:
+            stage_vars = _stage_variables(results)
+            form_prompt = render_stage_system_prompt("application_form", stage_vars)
+            form_user = build_project_parameters(stage_vars) + f"""需求文档：
+{truncate_text(requirements_text, 6000)}
 
 框架设计：
-{truncate_text(framework_doc, 6000)}
+{truncate_text(results["framework"]["doc"], 6000)}
 """
-        form_doc = await run_prompt(client, form_prompt, form_user, model)
-        form_path = project_dir / "output_docs" / "软件著作权登记信息表.md"
-        form_path.write_text(form_doc + "\n", encoding="utf-8")
+            form_doc = await run_prompt(
+                client, form_prompt, form_user, model, use_cache=use_cache,
+                call_site="copyright.form",
+            )
+            form_path = project_dir / "output_docs" / "软件著作权登记信息表.md"
+            form_path.write_text(form_doc + "\n", encoding="utf-8")
+
+        stage_outputs = {
+            "framework": [config.get("framework_design")],
+            "page_plan": [config.get("page_list")],
+            "ui_design": [config.get("ui_design")],
+            "frontend": ["output_sourcecode/front"],
+            "database": ["output_sourcecode/db"],
+            "backend": ["output_sourcecode/backend"],
+            "manual": ["output_docs/用户手册.txt"],
+            "form": ["output_docs/软件著作权登记信息表.md"],
+        }
+        stage_inputs = {
+            "framework": {"requirements": requirements_text, "tech": tech_text},
+            "ui_design": {"ui_spec": ui_spec_content},
+            "manual": {"requirements": requirements_text},
+            "form": {"requirements": requirements_text},
+        }
+        stages = build_copyright_stages({
+            "framework": _framework_stage,
+            "page_plan": _page_plan_stage,
+            "page_items": _page_items_stage,
+            "ui_design": _ui_design_stage,
+            "frontend": _frontend_stage,
+            "database": _database_stage,
+            "backend": _backend_stage,
+            "manual": _manual_stage,
+            "form": _form_stage,
+        })
+        tracker = _StageProgressTracker(db, job, stages)
+        stages = checkpoint_stages(
+            stages,
+            CheckpointStore(project.id),
+            project_dir=project_dir,
+            base_inputs={"model": model, "base_url": base_url, "variables": variables},
+            stage_inputs=stage_inputs,
+            stage_outputs=stage_outputs,
+            resume=resume,
+            fallback_stages=fallback_stages,
+            on_reuse=tracker.reused,
+        )
+        # 各阶段共用同一客户端，生成期间租用，避免阶段之间被空闲淘汰关闭
+        with lease_client(client):
+            await run_stage_graph(
+                stages,
+                max_concurrency=COPYRIGHT_MAX_PARALLEL_STAGES,
+                on_start=tracker.started,
+                on_finish=tracker.finished,
+            )
+        await tracker.drain()
 
-        update_job_state(
+        await run_blocking(
+            update_job_state,
             db,
             job,
             stage="rendering",
@@ -823,16 +1380,20 @@ UI设计规范：
             progress=92,
         )
         merge_script = project_dir / "scripts" / "generators" / "merge_all_simple.py"
-        result = subprocess.run(
-            [sys.executable, str(merge_script)],
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(merge_script),
             cwd=project_dir,
-            capture_output=True,
-            text=True,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr or result.stdout or "源代码合并失败")
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            output = stderr.decode("utf-8", "replace") or stdout.decode("utf-8", "replace")
+            raise RuntimeError(output or "源代码合并失败")
 
-        update_job_state(
+        await run_blocking(
+            update_job_state,
             db,
             job,
             stage="saving",
@@ -841,9 +1402,10 @@ UI设计规范：
         )
         zip_name = f"{project.id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.zip"
         zip_path = COPYRIGHT_ZIPS_DIR / str(project.id) / zip_name
-        zip_project(project_dir, zip_path)
+        await run_blocking(zip_project, project_dir, zip_path)
 
-        update_job_state(
+        await run_blocking(
+            update_job_state,
             db,
             job,
             status="completed",
@@ -852,24 +1414,15 @@ UI设计规范：
             progress=100,
             output_zip_path=str(zip_path),
         )
+    except asyncio.CancelledError:
+        # 用户取消时把仍在执行的阶段标记为 cancelled；worker 停止导致的取消由 worker 重新排队
+        if tracker is not None:
+            await tracker.wait_idle()
+        await run_blocking(_mark_cancelled_stages, job_id)
+        raise
     except Exception as exc:
-        if db:
-            job = db.query(CopyrightJob).filter(CopyrightJob.id == job_id).first()
-            if job:
-                error_message = str(exc)
-                if is_rate_limit_error(exc):
-                    error_message = (
-                        "已触发接口限流（Rate Limit）。请稍后再试或更换接口提供商。"
-                        "建议避免同时发起多个生成任务。"
-                    )
-                update_job_state(
-                    db,
-                    job,
-                    status="failed",
-                    stage="error",
-                    message=f"生成失败：{error_message}",
-                    error=error_message,
-                    progress=0,
-                )
+        if tracker is not None:
+            await tracker.wait_idle()
+        await run_blocking(_mark_job_failed, job_id, exc)
     finally:
-        db.close()
+        await run_blocking(db.close)
@@ -1,16 +1,92 @@
 """
 数据库连接配置
+
+同步引擎（psycopg2）供同步接口、后台 worker 与 Alembic 使用；异步引擎
+（PostgreSQL 使用 asyncpg，SQLite 使用 aiosqlite）供异步接口使用，
+数据库 I/O 期间不占用事件循环，也不占用阻塞操作线程池。
+
+同步引擎的连接池大小与溢出由 DB_POOL_SIZE / DB_MAX_OVERFLOW 配置，异步引擎由
+DB_ASYNC_POOL_SIZE / DB_ASYNC_MAX_OVERFLOW 配置；超时、重建周期与 pre-ping 两者共用。
+连接池指标见 get_db_pool_stats()。
 """
+from typing import Any, AsyncGenerator, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from .config import DATABASE_URL
+from .config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_ASYNC_MAX_OVERFLOW,
+    DB_ASYNC_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from .db_pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    describe_pool,
+    instrument_engine,
+)
+
+# 同步驱动 -> 对应的异步驱动
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """把同步数据库地址转换为异步驱动地址（已是异步驱动的地址原样返回）"""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _pool_options(url: str, poolclass: type, pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    """连接池参数（SQLite 内存数据库只能使用单连接池，保持 SQLAlchemy 默认）"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
 
 # 创建数据库引擎
-engine = create_engine(DATABASE_URL)
+engine = create_engine(
+    DATABASE_URL,
+    **_pool_options(DATABASE_URL, InstrumentedQueuePool, DB_POOL_SIZE, DB_MAX_OVERFLOW),
+)
+instrument_engine(engine, InstrumentedQueuePool.metrics_name)
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 异步引擎与会话工厂（提交后不使对象过期，避免在事件循环上触发隐式加载）
+_async_url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    **_pool_options(
+        _async_url, InstrumentedAsyncQueuePool, DB_ASYNC_POOL_SIZE, DB_ASYNC_MAX_OVERFLOW
+    ),
+)
+instrument_engine(async_engine.sync_engine, InstrumentedAsyncQueuePool.metrics_name)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db():
     """获取数据库会话依赖项"""
@@ -19,3 +95,23 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """获取异步数据库会话依赖项（用于 async def 接口）"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    await async_engine.dispose()
+
+
+def get_db_pool_stats() -> Dict[str, Any]:
+    """同步与异步引擎的连接池状态（借出数、溢出、等待与占用时长）"""
+    return {
+        "sync": describe_pool(engine.pool, InstrumentedQueuePool.metrics_name),
+        "async": describe_pool(
+            async_engine.sync_engine.pool, InstrumentedAsyncQueuePool.metrics_name
+        ),
+    }
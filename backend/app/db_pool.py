@@ -0,0 +1,138 @@
+"""
+数据库连接池指标 - 记录连接获取等待、溢出连接与连接占用时长
+
+同步与异步引擎分别使用带统计的连接池类，统计按引擎名（sync / async）汇总：
+- 获取连接的等待时间（包含池满时排队、新建连接与 pre-ping）与超时次数
+- 溢出连接：池内连接已全部借出时额外新建的连接（超过 pool_size 的部分）
+- 连接从借出到归还的占用时长，用于发现长时间占用连接的请求（如 SSE 生成）
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# 获取连接等待超过该时长计为一次饱和（说明连接池偏小或连接被长时间占用）
+_SATURATION_WAIT_MS = 100.0
+
+_pool_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _stats_for(name: str) -> Dict[str, float]:
+    stats = _pool_stats.get(name)
+    if stats is None:
+        stats = _pool_stats[name] = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "saturated": 0,
+            "overflow_hits": 0,
+            "connects": 0,
+            "invalidated": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+            "checkins": 0,
+            "total_hold_ms": 0.0,
+            "max_hold_ms": 0.0,
+        }
+    return stats
+
+
+class _PoolMetricsMixin:
+    """统计获取连接的等待时间与溢出连接（连接池 dispose 重建时类属性 metrics_name 保持不变）"""
+
+    metrics_name = "default"
+
+    def connect(self):  # type: ignore[override]
+        stats = _stats_for(self.metrics_name)
+        started = time.perf_counter()
+        try:
+            return super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            stats["timeouts"] += 1
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            stats["checkouts"] += 1
+            stats["total_wait_ms"] += wait_ms
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_ms)
+            if wait_ms >= _SATURATION_WAIT_MS:
+                stats["saturated"] += 1
+
+    def _inc_overflow(self) -> bool:
+        # 计数本身不会切换协程，并发获取连接时也能准确判断本次新建的是否为溢出连接
+        created = super()._inc_overflow()  # type: ignore[misc]
+        if created and self._overflow > 0:  # type: ignore[attr-defined]
+            _stats_for(self.metrics_name)["overflow_hits"] += 1
+        return created
+
+
+class InstrumentedQueuePool(_PoolMetricsMixin, QueuePool):
+    metrics_name = "sync"
+
+
+class InstrumentedAsyncQueuePool(_PoolMetricsMixin, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """注册连接池事件：新建连接、失效连接与连接占用时长"""
+    stats = _stats_for(name)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        stats["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is None:
+            return
+        hold_ms = (time.perf_counter() - checked_out_at) * 1000
+        stats["checkins"] += 1
+        stats["total_hold_ms"] += hold_ms
+        stats["max_hold_ms"] = max(stats["max_hold_ms"], hold_ms)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        stats["invalidated"] += 1
+
+
+def describe_pool(pool: Pool, name: str) -> Dict[str, Any]:
+    """连接池当前状态与累计统计"""
+    stats = _stats_for(name)
+    checkouts = stats["checkouts"] or 1
+    checkins = stats["checkins"] or 1
+    result: Dict[str, Any] = {"pool_class": pool.__class__.__name__}
+    if isinstance(pool, QueuePool):
+        result.update(
+            {
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+    result.update(
+        {
+            "checkouts": int(stats["checkouts"]),
+            "timeouts": int(stats["timeouts"]),
+            "saturated": int(stats["saturated"]),
+            "overflow_hits": int(stats["overflow_hits"]),
+            "connects": int(stats["connects"]),
+            "invalidated": int(stats["invalidated"]),
+            "avg_wait_ms": round(stats["total_wait_ms"] / checkouts, 2),
+            "max_wait_ms": round(stats["max_wait_ms"], 2),
+            "avg_hold_ms": round(stats["total_hold_ms"] / checkins, 2),
+            "max_hold_ms": round(stats["max_hold_ms"], 2),
+        }
+    )
+    return result
@@ -1,10 +1,16 @@
 """
 API dependencies
+
+同步依赖项（get_current_user 等）供同步接口使用，由 FastAPI 在线程池中执行；
+async def 接口使用 *_async 版本，通过异步会话查询，不占用事件循环与线程池。
+同一请求中的依赖项共享同一个会话。
 """
 from fastapi import Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .database import get_db
+from .database import get_async_db, get_db
 from .models import Course, CourseDocument, User, CopyrightProject
 
 
@@ -68,3 +74,63 @@ def get_copyright_project_for_user(
     if not project:
         raise HTTPException(status_code=404, detail="软著项目不存在")
     return project
+
+
+async def get_current_user_async(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """获取当前登录用户（异步会话）"""
+    username = request.state.username
+    user = await db.scalar(select(User).where(User.username == username))
+    if not user:
+        raise HTTPException(status_code=404, detail="用户不存在")
+    return user
+
+
+async def get_course_for_user_async(
+    course_id: int,
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> Course:
+    """获取当前用户的课程（异步会话）"""
+    course = await db.scalar(
+        select(Course).where(Course.id == course_id, Course.user_id == user.id)
+    )
+    if not course:
+        raise HTTPException(status_code=404, detail="课程不存在")
+    return course
+
+
+async def get_document_for_user_async(
+    document_id: int,
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> CourseDocument:
+    """获取当前用户的文档（异步会话，校验归属课程）"""
+    document = await db.get(CourseDocument, document_id)
+    if not document:
+        raise HTTPException(status_code=404, detail="文档不存在")
+
+    course_id = await db.scalar(
+        select(Course.id).where(Course.id == document.course_id, Course.user_id == user.id)
+    )
+    if course_id is None:
+        raise HTTPException(status_code=403, detail="无权访问此文档")
+
+    return document
+
+
+async def get_copyright_project_for_user_async(
+    project_id: int,
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> CopyrightProject:
+    """获取当前用户的软著项目（异步会话）"""
+    project = await db.scalar(
+        select(CopyrightProject).where(
+            CopyrightProject.id == project_id, CopyrightProject.user_id == user.id
+        )
+    )
+    if not project:
+        raise HTTPException(status_code=404, detail="软著项目不存在")
+    return project
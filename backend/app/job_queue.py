@@ -0,0 +1,354 @@
+"""
+生成任务队列 - 以 copyright_jobs 表作为持久化队列
+
+任务写入数据库后由 worker 领取执行，Web 进程重启不会丢失任务，多个 worker
+（多个 uvicorn 进程或多台机器）可以同时领取。PostgreSQL 使用
+SELECT ... FOR UPDATE SKIP LOCKED 领取，其他数据库（如 SQLite）使用带状态条件的
+UPDATE 乐观领取。执行中的任务定期写入心跳，心跳超时的任务重新排队并以续跑方式
+复用已完成阶段的检查点。
+
+任务分为 interactive（用户正在页面上等待）与 bulk（批量生成）两个优先级，
+interactive 任务总是先被领取。取消任务时直接把状态改为 cancelled，执行中的
+任务在下一次写入状态或心跳时发现并取消本地协程。
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session
+
+from .config import JOB_DEFAULT_DURATION, JOB_MAX_ATTEMPTS
+from .models import CopyrightJob
+
+logger = logging.getLogger(__name__)
+
+# 认为任务仍在进行中的状态
+ACTIVE_STATUSES = ("queued", "running")
+# 已结束的状态
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+# 优先级：按顺序领取，interactive 优先于 bulk
+PRIORITY_CLASSES = ("interactive", "bulk")
+
+# 估算耗时时参考的最近完成任务数
+_ETA_SAMPLE_SIZE = 20
+
+
+class JobCancelledError(asyncio.CancelledError):
+    """任务已被用户取消（继承 CancelledError，不会被 except Exception 当作失败处理）"""
+
+
+def _priority_rank():
+    return case(
+        *((CopyrightJob.priority == name, rank) for rank, name in enumerate(PRIORITY_CLASSES)),
+        else_=len(PRIORITY_CLASSES),
+    )
+
+
+def normalize_priority(value: Optional[str]) -> str:
+    if value and value.lower() in PRIORITY_CLASSES:
+        return value.lower()
+    return PRIORITY_CLASSES[0]
+
+
+def enqueue_copyright_job(
+    db: Session,
+    project_id: int,
+    *,
+    use_cache: bool = True,
+    resume: bool = False,
+    priority: str = "interactive",
+    message: str = "已进入队列，等待开始生成...",
+) -> CopyrightJob:
+    job = CopyrightJob(
+        project_id=project_id,
+        status="queued",
+        stage="preparing",
+        message=message,
+        progress=0,
+        priority=normalize_priority(priority),
+        use_cache=use_cache,
+        resume=resume,
+        attempts=0,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def claim_next_job(
+    db: Session,
+    worker_id: str,
+    priorities: Sequence[str] = PRIORITY_CLASSES,
+) -> Optional[CopyrightJob]:
+    """
+    按优先级领取最早进入队列的任务，没有可领取的任务时返回 None
+
+    Args:
+        priorities: 允许领取的优先级（worker 的批量任务名额已满时只领取 interactive）
+    """
+    now = datetime.utcnow()
+    query = (
+        db.query(CopyrightJob)
+        .filter(CopyrightJob.status == "queued", CopyrightJob.priority.in_(priorities))
+        .order_by(_priority_rank(), CopyrightJob.created_at.asc(), CopyrightJob.id.asc())
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        job = query.with_for_update(skip_locked=True).first()
+        if job is None:
+            db.rollback()
+            return None
+        job.status = "running"
+        job.worker_id = worker_id
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = now
+        job.heartbeat_at = now
+        db.commit()
+        db.refresh(job)
+        return job
+
+    # 不支持 SKIP LOCKED 时按候选逐个尝试条件更新，被其他 worker 抢先时换下一个
+    for candidate_id, in query.with_entities(CopyrightJob.id).limit(5).all():
+        claimed = (
+            db.query(CopyrightJob)
+            .filter(CopyrightJob.id == candidate_id, CopyrightJob.status == "queued")
+            .update(
+                {
+                    CopyrightJob.status: "running",
+                    CopyrightJob.worker_id: worker_id,
+                    CopyrightJob.attempts: CopyrightJob.attempts + 1,
+                    CopyrightJob.started_at: now,
+                    CopyrightJob.heartbeat_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if claimed:
+            return db.query(CopyrightJob).filter(CopyrightJob.id == candidate_id).first()
+    return None
+
+
+def heartbeat(db: Session, job_id: int, worker_id: str) -> bool:
+    """
+    写入心跳
+
+    Returns:
+        任务是否仍归本 worker 执行（已被重新排队、取消或由其他 worker 领取时返回 False）
+    """
+    updated = (
+        db.query(CopyrightJob)
+        .filter(
+            CopyrightJob.id == job_id,
+            CopyrightJob.worker_id == worker_id,
+            CopyrightJob.status == "running",
+        )
+        .update({CopyrightJob.heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+    )
+    db.commit()
+    return bool(updated)
+
+
+def is_job_cancelled(db: Session, job_id: int) -> bool:
+    status = db.query(CopyrightJob.status).filter(CopyrightJob.id == job_id).scalar()
+    return status == "cancelled"
+
+
+def cancel_job(db: Session, job_id: int) -> bool:
+    """
+    取消排队中或执行中的任务
+
+    只修改数据库状态：排队中的任务不会再被领取；执行中的任务由所在 worker 在
+    下一次写入状态或心跳时发现并取消（同进程的内置 worker 由调用方直接通知）。
+
+    Returns:
+        是否取消成功（任务已结束时返回 False）
+    """
+    now = datetime.utcnow()
+    cancelled = (
+        db.query(CopyrightJob)
+        .filter(CopyrightJob.id == job_id, CopyrightJob.status.in_(ACTIVE_STATUSES))
+        .update(
+            {
+                CopyrightJob.status: "cancelled",
+                CopyrightJob.stage: "cancelled",
+                CopyrightJob.message: "任务已取消",
+                CopyrightJob.finished_at: now,
+                CopyrightJob.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return bool(cancelled)
+
+
+def finish_job(db: Session, job_id: int, worker_id: str) -> None:
+    """任务协程结束后收尾：记录结束时间，仍处于 running 的任务视为异常结束"""
+    job = (
+        db.query(CopyrightJob)
+        .filter(CopyrightJob.id == job_id, CopyrightJob.worker_id == worker_id)
+        .first()
+    )
+    if job is None:
+        return
+    job.finished_at = datetime.utcnow()
+    if job.status == "running":
+        job.status = "failed"
+        job.stage = "error"
+        job.message = "生成失败：任务未正常结束"
+        job.error = "任务未正常结束"
+    db.commit()
+
+
+def release_job(db: Session, job_id: int, worker_id: str, reason: str) -> None:
+    """worker 停止时把未完成的任务放回队列（下次以续跑方式执行）"""
+    (
+        db.query(CopyrightJob)
+        .filter(
+            CopyrightJob.id == job_id,
+            CopyrightJob.worker_id == worker_id,
+            CopyrightJob.status == "running",
+        )
+        .update(
+            {
+                CopyrightJob.status: "queued",
+                CopyrightJob.worker_id: None,
+                CopyrightJob.resume: True,
+                CopyrightJob.message: reason,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+
+
+def requeue_stalled_jobs(db: Session, stale_after: float) -> int:
+    """
+    处理心跳超时的任务：未超过 JOB_MAX_ATTEMPTS 时重新排队（续跑），否则标记失败
+
+    Returns:
+        处理的任务数量
+    """
+    deadline = datetime.utcnow() - timedelta(seconds=stale_after)
+    last_seen = func.coalesce(CopyrightJob.heartbeat_at, CopyrightJob.updated_at)
+    stalled = (
+        db.query(CopyrightJob)
+        .filter(CopyrightJob.status == "running", last_seen < deadline)
+        .all()
+    )
+    for job in stalled:
+        if (job.attempts or 0) >= JOB_MAX_ATTEMPTS:
+            job.status = "failed"
+            job.stage = "error"
+            job.message = "生成失败：任务多次中断"
+            job.error = f"任务执行中断 {job.attempts} 次"
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = "queued"
+            job.resume = True
+            job.message = "任务执行中断，已重新排队，将复用已完成的阶段..."
+        logger.warning(
+            "任务心跳超时: job=%s worker=%s attempts=%s -> %s",
+            job.id, job.worker_id, job.attempts, job.status,
+        )
+        job.worker_id = None
+    if stalled:
+        db.commit()
+    return len(stalled)
+
+
+def _average_duration(db: Session) -> float:
+    """最近完成任务的平均耗时（秒），没有历史数据时使用 JOB_DEFAULT_DURATION"""
+    rows = (
+        db.query(CopyrightJob.started_at, CopyrightJob.finished_at)
+        .filter(
+            CopyrightJob.status == "completed",
+            CopyrightJob.started_at.isnot(None),
+            CopyrightJob.finished_at.isnot(None),
+        )
+        .order_by(CopyrightJob.finished_at.desc())
+        .limit(_ETA_SAMPLE_SIZE)
+        .all()
+    )
+    durations = [
+        (finished - started).total_seconds()
+        for started, finished in rows
+        if finished >= started
+    ]
+    if not durations:
+        return JOB_DEFAULT_DURATION
+    return sum(durations) / len(durations)
+
+
+def estimate_queue_position(db: Session, job: CopyrightJob) -> Tuple[Optional[int], Optional[int]]:
+    """
+    估算任务的排队位置与预计剩余时间（秒）
+
+    排队位置为按领取顺序排在它前面的排队任务数 + 1。预计时间按最近完成任务的
+    平均耗时估算：执行中的任务为平均耗时减去已执行时间；排队中的任务假设当前
+    执行中的任务数即 worker 的总并发，等待前面的任务分批完成后再执行。
+
+    Returns:
+        (queue_position, eta_seconds)，已结束的任务均为 None
+    """
+    if job.status not in ACTIVE_STATUSES:
+        return None, None
+    now = datetime.utcnow()
+    average = _average_duration(db)
+    if job.status == "running":
+        elapsed = (now - job.started_at).total_seconds() if job.started_at else 0.0
+        return None, int(max(average - elapsed, 0))
+
+    rank = PRIORITY_CLASSES.index(job.priority) if job.priority in PRIORITY_CLASSES else len(PRIORITY_CLASSES)
+    job_rank = _priority_rank()
+    ahead = (
+        db.query(func.count(CopyrightJob.id))
+        .filter(
+            CopyrightJob.status == "queued",
+            CopyrightJob.id != job.id,
+            or_(
+                job_rank < rank,
+                and_(
+                    job_rank == rank,
+                    or_(
+                        CopyrightJob.created_at < job.created_at,
+                        and_(CopyrightJob.created_at == job.created_at, CopyrightJob.id < job.id),
+                    ),
+                ),
+            ),
+        )
+        .scalar()
+        or 0
+    )
+    running_started = [
+        started
+        for started, in db.query(CopyrightJob.started_at).filter(CopyrightJob.status == "running").all()
+    ]
+    capacity = max(len(running_started), 1)
+    # 最早空出的名额：执行中任务的最短剩余时间（没有执行中的任务时可立即开始）
+    remaining = [
+        max(average - (now - started).total_seconds(), 0.0) if started else average
+        for started in running_started
+    ]
+    first_slot = min(remaining) if remaining else 0.0
+    eta = first_slot + math.floor(ahead / capacity) * average + average
+    return ahead + 1, int(eta)
+
+
+def get_queue_counts(db: Session) -> Dict[str, int]:
+    rows = (
+        db.query(CopyrightJob.status, func.count(CopyrightJob.id))
+        .filter(CopyrightJob.status.in_(ACTIVE_STATUSES))
+        .group_by(CopyrightJob.status)
+        .all()
+    )
+    counts = {status: 0 for status in ACTIVE_STATUSES}
+    counts.update({status: count for status, count in rows})
+    return counts
@@ -2,9 +2,16 @@
 课程知识库服务 - RAG 系统
 提供课程相关信息的检索和上下文构建功能
 """
-from typing import Dict, Any, List
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from .config import AI_CONTEXT_TOKEN_BUDGET
 from .models import Course, CourseDocument
+from .utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
 
 
 def retrieve_course_context(db: Session, course_id: int) -> Dict[str, Any]:
@@ -28,6 +35,22 @@ def retrieve_course_context(db: Session, course_id: int) -> Dict[str, Any]:
         CourseDocument.course_id == course_id
     ).all()
     
+    return _build_course_context(course, documents)
+
+
+async def retrieve_course_context_async(db: AsyncSession, course_id: int) -> Dict[str, Any]:
+    """检索课程完整上下文信息（异步会话版本，返回结构同 retrieve_course_context）"""
+    course = await db.get(Course, course_id)
+    if not course:
+        raise ValueError(f"课程 {course_id} 不存在")
+
+    documents = await db.scalars(
+        select(CourseDocument).where(CourseDocument.course_id == course_id)
+    )
+    return _build_course_context(course, documents.all())
+
+
+def _build_course_context(course: Course, documents: List[CourseDocument]) -> Dict[str, Any]:
     # 构建上下文
     context = {
         "course_info": {
@@ -63,16 +86,88 @@ def retrieve_course_context(db: Session, course_id: int) -> Dict[str, Any]:
     return context
 
 
-def build_ai_context_prompt(context: Dict[str, Any]) -> str:
+DOC_TYPE_WEIGHTS = {
+    "standard": 3.0,
+    "info": 2.0,
+    "lesson": 1.5,
+    "lesson_plan": 1.5,
+    "courseware": 1.0,
+}
+
+MIN_SECTION_TOKENS = 120
+
+_packing_stats: Dict[str, int] = {
+    "calls": 0,
+    "budget_tokens": 0,
+    "used_tokens": 0,
+    "documents_included": 0,
+    "documents_truncated": 0,
+    "documents_dropped": 0,
+}
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def _bigrams(text: str) -> set:
+    compact = "".join(ch for ch in (text or "") if not ch.isspace())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _score_document(
+    doc: Dict[str, Any],
+    target_lesson: Optional[int],
+    target_bigrams: set,
+) -> float:
+    """文档相关度：文档类型权重 + 课次接近度 + 标题重合度"""
+    score = DOC_TYPE_WEIGHTS.get(doc.get("type"), 1.0)
+    lesson_number = doc.get("lesson_number")
+    if target_lesson is not None and isinstance(lesson_number, int):
+        distance = abs(target_lesson - lesson_number)
+        score += 3.0 / (1 + distance)
+        if lesson_number == target_lesson - 1:
+            # 上一次课的内容最常被复习导入引用
+            score += 1.0
+    if target_bigrams:
+        title_bigrams = _bigrams(doc.get("title") or "")
+        if title_bigrams:
+            overlap = len(title_bigrams & target_bigrams) / len(title_bigrams | target_bigrams)
+            score += 4.0 * overlap
+    return score
+
+
+def pack_course_context(
+    context: Dict[str, Any],
+    token_budget: Optional[int] = None,
+    target_lesson: Optional[int] = None,
+    target_title: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
     """
-    将课程上下文转换为 AI Prompt
-    
+    按 token 预算组装课程上下文提示词
+
+    课程与教材信息总是保留；课程目录次之（超出预算时截断）；其余文档按与
+    目标课次的相关度排序，依次放入剩余预算，放不下完整内容时截断。
+
     Args:
         context: 课程上下文字典
-        
+        token_budget: token 预算，默认取 AI_CONTEXT_TOKEN_BUDGET
+        target_lesson: 目标课次（授课顺序）
+        target_title: 目标课次标题
+
     Returns:
-        格式化的上下文提示词
+        (提示词, 预算使用明细)
     """
+    budget = token_budget if token_budget is not None else AI_CONTEXT_TOKEN_BUDGET
     course = context["course_info"]
     textbook = context["textbook"]
     
@@ -91,21 +186,109 @@ def build_ai_context_prompt(context: Dict[str, Any]) -> str:
 **ISBN**: {textbook['isbn']}
 **出版社**: {textbook.get('publisher') or '未指定'}
 """
+    header_tokens = estimate_tokens(prompt)
+    remaining = budget - header_tokens
+    breakdown: Dict[str, Any] = {
+        "budget": budget,
+        "header": header_tokens,
+        "catalog": 0,
+        "documents": [],
+        "truncated": 0,
+        "dropped": 0,
+    }
     
     # 添加课程目录
-    if context.get("catalog"):
-        prompt += f"\n# 课程目录\n\n{context['catalog']}\n"
+    if context.get("catalog") and remaining > MIN_SECTION_TOKENS:
+        catalog_section = f"\n# 课程目录\n\n{context['catalog']}\n"
+        if estimate_tokens(catalog_section) > remaining:
+            catalog_section = _truncate_to_tokens(catalog_section, remaining - 10) + "...\n"
+        breakdown["catalog"] = estimate_tokens(catalog_section)
+        remaining -= breakdown["catalog"]
+        prompt += catalog_section
     
-    # 添加相关文档
-    if context.get("documents"):
-        prompt += "\n# 相关文档\n\n"
-        for doc in context["documents"]:
-            if doc.get("content"):
-                prompt += f"## {doc['title']} ({doc['type']})\n\n{doc['content'][:500]}...\n\n"
+    # 添加相关文档（按相关度排序后装入预算）
+    documents = [doc for doc in context.get("documents") or [] if doc.get("content")]
+    if documents:
+        target_bigrams = _bigrams(target_title or "")
+        ranked = sorted(
+            documents,
+            key=lambda doc: _score_document(doc, target_lesson, target_bigrams),
+            reverse=True,
+        )
+        sections = []
+        heading = "\n# 相关文档\n\n"
+        remaining -= estimate_tokens(heading)
+        for doc in ranked:
+            section_head = f"## {doc['title']} ({doc['type']})\n\n"
+            section = f"{section_head}{doc['content']}\n\n"
+            tokens = estimate_tokens(section)
+            if tokens > remaining:
+                if remaining < MIN_SECTION_TOKENS:
+                    breakdown["dropped"] += 1
+                    continue
+                body = _truncate_to_tokens(
+                    doc["content"], remaining - estimate_tokens(section_head) - 5
+                )
+                section = f"{section_head}{body}...\n\n"
+                tokens = estimate_tokens(section)
+                breakdown["truncated"] += 1
+            sections.append(section)
+            remaining -= tokens
+            breakdown["documents"].append({"id": doc.get("id"), "tokens": tokens})
+        if sections:
+            prompt += heading + "".join(sections)
     
+    breakdown["used"] = estimate_tokens(prompt)
+    _packing_stats["calls"] += 1
+    _packing_stats["budget_tokens"] += budget
+    _packing_stats["used_tokens"] += breakdown["used"]
+    _packing_stats["documents_included"] += len(breakdown["documents"])
+    _packing_stats["documents_truncated"] += breakdown["truncated"]
+    _packing_stats["documents_dropped"] += breakdown["dropped"]
+    logger.info(
+        "课程上下文打包: budget=%d used=%d header=%d catalog=%d documents=%d truncated=%d dropped=%d",
+        budget,
+        breakdown["used"],
+        breakdown["header"],
+        breakdown["catalog"],
+        len(breakdown["documents"]),
+        breakdown["truncated"],
+        breakdown["dropped"],
+    )
+    return prompt, breakdown
+
+
+def build_ai_context_prompt(
+    context: Dict[str, Any],
+    token_budget: Optional[int] = None,
+    target_lesson: Optional[int] = None,
+    target_title: Optional[str] = None,
+) -> str:
+    """
+    将课程上下文转换为 AI Prompt
+    
+    Args:
+        context: 课程上下文字典
+        token_budget: token 预算，默认取 AI_CONTEXT_TOKEN_BUDGET
+        target_lesson: 目标课次（用于文档相关度排序）
+        target_title: 目标课次标题（用于文档相关度排序）
+        
+    Returns:
+        格式化的上下文提示词
+    """
+    prompt, _ = pack_course_context(
+        context,
+        token_budget=token_budget,
+        target_lesson=target_lesson,
+        target_title=target_title,
+    )
     return prompt
 
 
+def get_context_packing_stats() -> Dict[str, int]:
+    return dict(_packing_stats)
+
+
 def get_documents_by_type(db: Session, course_id: int, doc_type: str) -> List[Dict[str, Any]]:
     """
     获取指定类型的文档列表
@@ -0,0 +1,211 @@
+"""
+教案预生成 - 某次课生成成功后在后台预先生成下一次课的草稿
+
+教师通常按课次顺序逐个生成教案。第 N 次课生成成功后（请求开启 prefetch_next 时）
+在后台生成第 N+1 次课的草稿并保存在进程内存中；下一次请求的输入指纹一致时直接
+使用草稿，省去一次完整的模型调用。授课计划变化时草稿被取消或判定失效。
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .config import LESSON_PLAN_PREFETCH_MAX_PER_USER, LESSON_PLAN_PREFETCH_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+DraftKey = Tuple[int, int, int]
+
+
+def build_draft_fingerprint(**inputs: Any) -> str:
+    """对生成教案的全部输入（模型、系统字段、授课计划、课程上下文等）计算指纹"""
+    raw = json.dumps(inputs, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Draft:
+    fingerprint: str
+    task: "asyncio.Task[Dict[str, Any]]"
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class LessonPlanPrefetcher:
+    """
+    按 (user_id, course_id, sequence) 管理预生成草稿
+
+    - 每个用户同时进行的预生成不超过 max_per_user 个，超出时取消最早的一个
+      （用户已经继续往后生成，旧草稿价值最低）
+    - 预生成的模型调用同样经过服务商限流器，与正常请求共享额度
+    - 草稿超过 ttl_seconds 未被取用即丢弃
+    """
+
+    def __init__(self, max_per_user: int, ttl_seconds: float):
+        self.max_per_user = max(max_per_user, 1)
+        self.ttl_seconds = ttl_seconds
+        self._drafts: Dict[DraftKey, _Draft] = {}
+        # 草稿任务所在的事件循环（同步接口在线程池中取消草稿时转交该循环执行）
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats: Dict[str, int] = {
+            "scheduled": 0,
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+
+    def _drop(self, key: DraftKey, *, cancel: bool = True) -> None:
+        draft = self._drafts.pop(key, None)
+        if draft is not None and cancel and not draft.task.done():
+            draft.task.cancel()
+            self.stats["cancelled"] += 1
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, d in self._drafts.items() if now - d.created_at > self.ttl_seconds]:
+            self._drop(key)
+
+    def _on_done(self, key: DraftKey, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is None:
+            return
+        self.stats["failed"] += 1
+        logger.warning("预生成第 %s 次课教案失败: %s", key[2], error)
+        draft = self._drafts.get(key)
+        if draft is not None and draft.task is task:
+            self._drafts.pop(key, None)
+
+    def schedule(
+        self,
+        user_id: int,
+        course_id: int,
+        sequence: int,
+        fingerprint: str,
+        factory: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> bool:
+        """
+        在后台开始预生成
+
+        Returns:
+            是否新建了预生成任务（同一输入的草稿已存在或正在生成时返回 False）
+        """
+        self._purge_expired()
+        key = (user_id, course_id, sequence)
+        existing = self._drafts.get(key)
+        if existing is not None:
+            if existing.fingerprint == fingerprint:
+                return False
+            self._drop(key)
+
+        pending: List[Tuple[float, DraftKey]] = sorted(
+            (draft.created_at, k)
+            for k, draft in self._drafts.items()
+            if k[0] == user_id and not draft.task.done()
+        )
+        while len(pending) >= self.max_per_user:
+            _, oldest = pending.pop(0)
+            self._drop(oldest)
+
+        self._loop = asyncio.get_running_loop()
+        task = asyncio.create_task(factory())
+        task.add_done_callback(lambda t: self._on_done(key, t))
+        self._drafts[key] = _Draft(fingerprint=fingerprint, task=task)
+        self.stats["scheduled"] += 1
+        logger.info("开始预生成教案: course=%s sequence=%s", course_id, sequence)
+        return True
+
+    def lookup(self, user_id: int, course_id: int, sequence: int, fingerprint: str) -> Optional[str]:
+        """查询草稿状态：ready / pending，不存在或已失效时返回 None"""
+        self._purge_expired()
+        key = (user_id, course_id, sequence)
+        draft = self._drafts.get(key)
+        if draft is None:
+            return None
+        if draft.fingerprint != fingerprint:
+            self._drop(key)
+            self.stats["stale"] += 1
+            return None
+        return "ready" if draft.task.done() else "pending"
+
+    async def take(
+        self, user_id: int, course_id: int, sequence: int, fingerprint: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        取出草稿（一次性），仍在生成时等待其完成
+
+        Returns:
+            教案数据；没有可用草稿（不存在、输入已变化或预生成失败）时返回 None
+        """
+        if self.lookup(user_id, course_id, sequence, fingerprint) is None:
+            self.stats["misses"] += 1
+            return None
+        draft = self._drafts.pop((user_id, course_id, sequence))
+        try:
+            # shield：等待方被取消时不会连带取消草稿任务，便于区分两种取消
+            data = await asyncio.shield(draft.task)
+        except asyncio.CancelledError:
+            if draft.task.cancelled():
+                # 草稿任务本身被取消（如授课计划变化），按未命中处理
+                self.stats["misses"] += 1
+                return None
+            # 等待方被取消（如客户端断开），一并取消草稿任务并继续向上抛出
+            draft.task.cancel()
+            raise
+        except Exception:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return data
+
+    def cancel_course(self, course_id: int) -> int:
+        """
+        授课计划变化时取消该课程的全部草稿，返回取消数量
+
+        可在同步接口（线程池）中调用，此时取消操作转交事件循环线程执行。
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                count = sum(1 for key in list(self._drafts) if key[1] == course_id)
+                loop.call_soon_threadsafe(self._cancel_course, course_id)
+                return count
+        return self._cancel_course(course_id)
+
+    def _cancel_course(self, course_id: int) -> int:
+        keys = [key for key in self._drafts if key[1] == course_id]
+        for key in keys:
+            self._drop(key)
+        if keys:
+            logger.info("授课计划已变化，取消 %d 个预生成教案: course=%s", len(keys), course_id)
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "drafts": len(self._drafts),
+            "pending": sum(1 for draft in self._drafts.values() if not draft.task.done()),
+            "max_per_user": self.max_per_user,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+lesson_plan_prefetcher = LessonPlanPrefetcher(
+    max_per_user=LESSON_PLAN_PREFETCH_MAX_PER_USER,
+    ttl_seconds=LESSON_PLAN_PREFETCH_TTL_SECONDS,
+)
+
+
+def get_prefetch_stats() -> Dict[str, Any]:
+    return lesson_plan_prefetcher.get_stats()
@@ -0,0 +1,126 @@
+"""
+事件循环阻塞检测 - 定期测量事件循环的调度延迟
+
+监测任务每隔 interval 秒 sleep 一次，实际唤醒时间比预期晚的部分即为这段时间内
+事件循环被同步代码占用的时长。超过阈值时记录告警日志与当时进行中的请求
+（由 RequestTrackingMiddleware 登记），用于定位仍在事件循环上执行的阻塞操作。
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .config import LOOP_BLOCK_THRESHOLD_MS, LOOP_MONITOR_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# 保留最近的阻塞事件条数
+_RECENT_EVENTS = 20
+
+# 进行中的请求：{请求序号: "METHOD path"}
+_active_requests: Dict[int, str] = {}
+_request_ids = itertools.count(1)
+
+
+def request_started(method: str, path: str) -> int:
+    request_id = next(_request_ids)
+    _active_requests[request_id] = f"{method} {path}"
+    return request_id
+
+
+def request_finished(request_id: int) -> None:
+    _active_requests.pop(request_id, None)
+
+
+def active_requests() -> List[str]:
+    return list(_active_requests.values())
+
+
+class LoopMonitor:
+    """事件循环调度延迟监测"""
+
+    def __init__(
+        self,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        threshold_ms: float = LOOP_BLOCK_THRESHOLD_MS,
+    ):
+        self.interval = interval
+        self.threshold_ms = threshold_ms
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=_RECENT_EVENTS)
+        self.stats: Dict[str, float] = {
+            "checks": 0,
+            "blocked": 0,
+            "max_lag_ms": 0.0,
+            "total_lag_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def reset(self) -> None:
+        self.recent.clear()
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def record(self, lag_ms: float) -> None:
+        """记录一次测量结果（lag_ms 为比预期晚唤醒的毫秒数）"""
+        self.stats["checks"] += 1
+        self.stats["total_lag_ms"] += lag_ms
+        self.stats["max_lag_ms"] = max(self.stats["max_lag_ms"], lag_ms)
+        if lag_ms < self.threshold_ms:
+            return
+        self.stats["blocked"] += 1
+        requests = active_requests()
+        self.recent.append(
+            {
+                "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "lag_ms": round(lag_ms, 1),
+                "active_requests": requests,
+            }
+        )
+        logger.warning(
+            "事件循环被阻塞 %.0f ms，进行中的请求: %s",
+            lag_ms,
+            ", ".join(requests) or "无",
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(loop.time() - expected, 0.0) * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        checks = self.stats["checks"] or 1
+        return {
+            "enabled": self._task is not None,
+            "interval": self.interval,
+            "threshold_ms": self.threshold_ms,
+            "checks": int(self.stats["checks"]),
+            "blocked": int(self.stats["blocked"]),
+            "avg_lag_ms": round(self.stats["total_lag_ms"] / checks, 2),
+            "max_lag_ms": round(self.stats["max_lag_ms"], 2),
+            "active_requests": len(_active_requests),
+            "recent": list(self.recent),
+        }
+
+
+loop_monitor = LoopMonitor()
+
+
+def get_loop_monitor_stats() -> Dict[str, Any]:
+    return loop_monitor.get_stats()
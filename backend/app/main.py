@@ -6,8 +6,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.staticfiles import StaticFiles as StarletteStaticFiles
 
+from .ai_client import close_all_clients
 from .config import CORS_ORIGINS
-from .middleware import JWTAuthMiddleware
+from .database import dispose_async_engine
+from .loop_monitor import loop_monitor
+from .middleware import JWTAuthMiddleware, RequestTrackingMiddleware
+from .offload import configure_threadpools, shutdown_blocking_pool
+from .worker import start_embedded_worker, stop_embedded_worker
 from .utils.paths import (
     UPLOADS_DIR,
     COPYRIGHT_PROJECTS_DIR,
@@ -24,6 +29,7 @@ from .routers.teaching_plan_api import router as teaching_plan_router
 from .routers.misc_api import router as misc_router
 from .routers.dashboard_api import router as dashboard_router
 from .routers.copyright_api import router as copyright_router
+from .routers.metrics_api import router as metrics_router
 
 
 app = FastAPI(
@@ -32,9 +38,50 @@ app = FastAPI(
     version="1.0.0",
 )
 
+
+@app.on_event("startup")
+async def start_runtime_monitoring():
+    """设置阻塞操作线程池并启动事件循环阻塞检测"""
+    configure_threadpools()
+    loop_monitor.start()
+
+
+@app.on_event("startup")
+async def start_job_worker():
+    """JOB_WORKER_MODE=embedded 时在 Web 进程内运行生成任务 worker"""
+    start_embedded_worker()
+
+
+@app.on_event("shutdown")
+async def stop_job_worker():
+    """停止内置 worker，进行中的任务放回队列"""
+    await stop_embedded_worker()
+
+
+@app.on_event("shutdown")
+async def shutdown_ai_clients():
+    """关闭共享的 AI 客户端连接池"""
+    await close_all_clients()
+
+
+@app.on_event("shutdown")
+async def close_async_database():
+    """关闭异步数据库连接池"""
+    await dispose_async_engine()
+
+
+@app.on_event("shutdown")
+async def stop_runtime_monitoring():
+    await loop_monitor.stop()
+    shutdown_blocking_pool()
+
+
 # 添加 JWT 认证中间件（必须在 CORS 之前）
 app.add_middleware(JWTAuthMiddleware)
 
+# 登记进行中的请求（事件循环阻塞检测时定位请求）
+app.add_middleware(RequestTrackingMiddleware)
+
 # 配置 CORS 中间件（必须在最后）
 app.add_middleware(
     CORSMiddleware,
@@ -54,6 +101,7 @@ app.include_router(teaching_plan_router)
 app.include_router(misc_router)
 app.include_router(copyright_router)
 app.include_router(dashboard_router)
+app.include_router(metrics_router)
 
 # 配置静态文件服务（用于下载生成的文档）
 ensure_dir(UPLOADS_DIR)
@@ -1,5 +1,5 @@
 """
-JWT 认证中间件
+JWT 认证中间件与请求登记中间件
 """
 from urllib.parse import parse_qs
 
@@ -9,6 +9,7 @@ from starlette.datastructures import Headers
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .auth import verify_token
+from .loop_monitor import request_finished, request_started
 
 
 class JWTAuthMiddleware:
@@ -77,3 +78,21 @@ class JWTAuthMiddleware:
         scope["state"]["username"] = username
 
         await self.app(scope, receive, send)
+
+
+class RequestTrackingMiddleware:
+    """登记进行中的 API 请求（含流式响应），事件循环被阻塞时用于定位请求"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope.get("path", "").startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = request_started(scope.get("method", ""), scope["path"])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_finished(request_id)
@@ -2,8 +2,8 @@
 数据库模型定义
 """
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from typing import Optional, List, Dict
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from pydantic import BaseModel
@@ -29,6 +29,7 @@ class User(Base):
     
     # 关系
     messages = relationship("Message", back_populates="user", cascade="all, delete-orphan")
+    chat_summary = relationship("ChatSummary", uselist=False, cascade="all, delete-orphan")
     courses = relationship("Course", back_populates="user", cascade="all, delete-orphan")
     copyright_projects = relationship(
         "CopyrightProject",
@@ -50,6 +51,22 @@ class Message(Base):
     # 关系
     user = relationship("User", back_populates="messages")
 
+    # 按用户倒序分页读取历史（keyset: user_id = ? AND id < ? ORDER BY id DESC）
+    __table_args__ = (Index("ix_messages_user_id_id", "user_id", "id"),)
+
+
+class ChatSummary(Base):
+    """对话滚动摘要表模型（每个用户一条）"""
+    __tablename__ = "chat_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True, index=True)
+    summary = Column(Text, nullable=False, default="")
+    last_message_id = Column(Integer, nullable=False, default=0)  # 已纳入摘要的最后一条消息 ID
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
 
 def calculate_semester() -> str:
     """
@@ -178,10 +195,24 @@ class CopyrightJob(Base):
     progress = Column(Integer, nullable=True)
     error = Column(Text, nullable=True)
     output_zip_path = Column(String(500), nullable=True)
+    # 各生成阶段的状态：{阶段名: pending/running/completed/reused/failed/cancelled}
+    stage_states = Column(JSON, nullable=True)
+
+    # 任务队列：优先级（interactive/bulk）、生成参数、领取信息与心跳
+    priority = Column(String(20), default="interactive", nullable=False)
+    use_cache = Column(Boolean, default=True, nullable=False)
+    resume = Column(Boolean, default=False, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    worker_id = Column(String(100), nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_copyright_jobs_status_created_at", "status", "created_at"),)
+
     project = relationship("CopyrightProject", back_populates="jobs")
 
 
@@ -372,6 +403,12 @@ class CopyrightJobResponse(BaseModel):
     progress: Optional[int] = None
     error: Optional[str] = None
     output_zip_path: Optional[str] = None
+    stage_states: Optional[Dict[str, str]] = None
+    priority: str = "interactive"
+    # 排队中的任务前面（含自身）的任务数，非排队状态为 None
+    queue_position: Optional[int] = None
+    # 预计还需多少秒完成（排队中含等待时间），已结束的任务为 None
+    eta_seconds: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
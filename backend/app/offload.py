@@ -0,0 +1,128 @@
+"""
+阻塞操作卸载 - 在线程池中执行同步的数据库查询、文件读写与文档渲染
+
+异步接口（SSE 流式接口等）直接调用同步 SQLAlchemy、文件读写或 docx 渲染会阻塞
+事件循环，期间同一进程内的所有流式响应都会停顿。异步接口中的阻塞操作统一通过
+run_blocking 放到固定大小的线程池执行；不需要 await 的接口直接定义为同步函数，
+由 FastAPI 在线程池中执行（线程数上限同样由 BLOCKING_THREADPOOL_SIZE 控制）。
+
+注意：需要访问事件循环对象（创建任务、asyncio.Event 等）的代码不能放进线程池。
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .config import BLOCKING_THREADPOOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 排队等待线程超过该时长计为一次饱和（说明线程池偏小）
+_SATURATION_WAIT_MS = 100.0
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_offload_stats: Dict[str, float] = {
+    "calls": 0,
+    "errors": 0,
+    "in_flight": 0,
+    "max_in_flight": 0,
+    "saturated": 0,
+    "total_wait_ms": 0.0,
+    "max_wait_ms": 0.0,
+    "total_run_ms": 0.0,
+    "max_run_ms": 0.0,
+}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(BLOCKING_THREADPOOL_SIZE, 1),
+                    thread_name_prefix="blocking",
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    在阻塞操作线程池中执行同步函数并等待结果
+
+    与 asyncio.to_thread 相同会复制当前 contextvars；调用方被取消时线程中的
+    函数仍会执行完毕（同步代码无法中断），因此函数内不要依赖调用方的后续清理。
+    """
+    loop = asyncio.get_running_loop()
+    submitted = time.perf_counter()
+    ctx = contextvars.copy_context()
+
+    def _run() -> T:
+        started = time.perf_counter()
+        wait_ms = (started - submitted) * 1000
+        _offload_stats["total_wait_ms"] += wait_ms
+        _offload_stats["max_wait_ms"] = max(_offload_stats["max_wait_ms"], wait_ms)
+        if wait_ms >= _SATURATION_WAIT_MS:
+            _offload_stats["saturated"] += 1
+        try:
+            return ctx.run(functools.partial(func, *args, **kwargs))
+        finally:
+            run_ms = (time.perf_counter() - started) * 1000
+            _offload_stats["total_run_ms"] += run_ms
+            _offload_stats["max_run_ms"] = max(_offload_stats["max_run_ms"], run_ms)
+
+    _offload_stats["calls"] += 1
+    _offload_stats["in_flight"] += 1
+    _offload_stats["max_in_flight"] = max(_offload_stats["max_in_flight"], _offload_stats["in_flight"])
+    try:
+        return await loop.run_in_executor(_get_executor(), _run)
+    except Exception:
+        _offload_stats["errors"] += 1
+        raise
+    finally:
+        _offload_stats["in_flight"] -= 1
+
+
+def configure_threadpools() -> None:
+    """
+    应用启动时调用：设置 FastAPI 同步接口/依赖项使用的线程数上限，
+    并让 asyncio.to_thread 与 run_blocking 共用同一个线程池
+    """
+    import anyio.to_thread
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max(BLOCKING_THREADPOOL_SIZE, 1)
+    asyncio.get_running_loop().set_default_executor(_get_executor())
+
+
+def shutdown_blocking_pool() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def get_offload_stats() -> Dict[str, Any]:
+    calls = _offload_stats["calls"] or 1
+    return {
+        "pool_size": max(BLOCKING_THREADPOOL_SIZE, 1),
+        "calls": int(_offload_stats["calls"]),
+        "errors": int(_offload_stats["errors"]),
+        "in_flight": int(_offload_stats["in_flight"]),
+        "max_in_flight": int(_offload_stats["max_in_flight"]),
+        "saturated": int(_offload_stats["saturated"]),
+        "avg_wait_ms": round(_offload_stats["total_wait_ms"] / calls, 2),
+        "max_wait_ms": round(_offload_stats["max_wait_ms"], 2),
+        "avg_run_ms": round(_offload_stats["total_run_ms"] / calls, 2),
+        "max_run_ms": round(_offload_stats["max_run_ms"], 2),
+    }
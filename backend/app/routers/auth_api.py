@@ -5,9 +5,11 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from ..ai_client import get_async_client
+from ..ai_limiter import ai_call_slot
 from ..auth import authenticate_user, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
 from ..database import get_db
-from ..deps import get_current_user
+from ..deps import get_current_user, get_current_user_async
 from ..models import LoginRequest, Token, User, UserResponse, ChangePasswordRequest, UserSettingsRequest
 
 
@@ -15,7 +17,7 @@ router = APIRouter(prefix="/api/auth", tags=["认证"])
 
 
 @router.post("/login", response_model=Token)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     """
     用户登录接口
 
@@ -40,7 +42,7 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(user: User = Depends(get_current_user)):
+async def get_current_user_info(user: User = Depends(get_current_user_async)):
     """
     获取当前登录用户信息
 
@@ -50,7 +52,7 @@ async def get_current_user_info(user: User = Depends(get_current_user)):
 
 
 @router.post("/change-password", tags=["用户设置"])
-async def change_password(
+def change_password(
     password_data: ChangePasswordRequest,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -73,7 +75,7 @@ async def change_password(
 
 
 @router.put("/username", tags=["用户设置"])
-async def change_username(
+def change_username(
     username_data: dict,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -109,7 +111,7 @@ async def change_username(
 
 
 @router.put("/settings", tags=["用户设置"])
-async def update_settings(
+def update_settings(
     settings: UserSettingsRequest,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -176,8 +178,6 @@ async def get_available_models(
     - **ai_api_key**: AI API Key (可选，如果不提供则使用已保存的)
     - **ai_base_url**: AI Base URL (必填)
     """
-    import openai
-
     api_key = config.get("ai_api_key")
     base_url = config.get("ai_base_url")
 
@@ -190,8 +190,9 @@ async def get_available_models(
         raise HTTPException(status_code=400, detail="请提供 Base URL")
 
     try:
-        client = openai.OpenAI(api_key=api_key, base_url=base_url)
-        models = client.models.list()
+        client = get_async_client(api_key, base_url)
+        async with ai_call_slot(base_url, api_key):
+            models = await client.models.list()
 
         model_list = [
             {"id": model.id, "name": model.id, "created": model.created}
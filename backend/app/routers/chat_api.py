@@ -6,14 +6,43 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..ai_service import chat_completion_stream
-from ..database import get_db
+from ..chat_context import assemble_chat_messages, clear_chat_summary, schedule_summary_refresh
+from ..config import STREAM_COALESCE_MAX_BYTES, STREAM_COALESCE_MAX_DELAY_MS
+from ..database import SessionLocal, get_db
 from ..deps import get_current_user
 from ..models import ChatMessageRequest, Message, MessageResponse, User
+from ..offload import run_blocking
+from ..utils.stream_coalesce import coalesce_stream
 
 
 router = APIRouter(prefix="/api/chat", tags=["AI 对话"])
 
 
+def _save_message_and_assemble(db: Session, user_id: int, content: str):
+    """
+    保存用户消息并组装本次请求的上下文（在线程池中执行）
+
+    完成后关闭请求会话归还连接，AI 流式输出期间不占用连接池。
+    """
+    try:
+        user_msg = Message(user_id=user_id, role="user", content=content)
+        db.add(user_msg)
+        db.commit()
+        return assemble_chat_messages(db, user_id, content, before_id=user_msg.id)
+    finally:
+        db.close()
+
+
+def _save_assistant_message(user_id: int, content: str) -> None:
+    """使用短时会话保存 AI 回复"""
+    db = SessionLocal()
+    try:
+        db.add(Message(user_id=user_id, role="assistant", content=content))
+        db.commit()
+    finally:
+        db.close()
+
+
 @router.post("/send")
 async def send_message(
     message_data: ChatMessageRequest,
@@ -23,6 +52,8 @@ async def send_message(
     """
     发送消息到 AI 并流式返回响应
 
+    携带滚动摘要与 token 预算内的最近历史，支持多轮对话。
+
     - **content**: 消息内容
     """
     if not user.ai_api_key or not user.ai_base_url:
@@ -31,40 +62,45 @@ async def send_message(
             detail="请先在用户设置中配置 AI API Key 和 Base URL",
         )
 
-    user_msg = Message(user_id=user.id, role="user", content=message_data.content)
-    db.add(user_msg)
-    db.commit()
+    # 提交后 ORM 对象会过期，先取出后续需要的字段，避免在事件循环上重新查询
+    user_id = user.id
+    api_key = user.ai_api_key
+    base_url = user.ai_base_url
+    model = user.ai_model_name
 
-    messages = [
-        {"role": "system", "content": "你是一个有帮助的AI助手。"},
-        {"role": "user", "content": "你好，你是谁"},
-        {"role": "assistant", "content": "你好！我是AI助手，很高兴为您服务。"},
-        {"role": "user", "content": message_data.content},
-    ]
+    # 摘要 + 预算内的最近历史 + 本次消息；窗口外历史积累过多时在后台刷新摘要
+    messages, summarize_before_id = await run_blocking(
+        _save_message_and_assemble, db, user_id, message_data.content
+    )
+    if summarize_before_id is not None:
+        schedule_summary_refresh(user_id, summarize_before_id, api_key, base_url, model)
 
     async def generate():
         assistant_content = ""
         try:
-            async for chunk in chat_completion_stream(
-                messages=messages,
-                api_key=user.ai_api_key,
-                base_url=user.ai_base_url,
-                model=user.ai_model_name,
+            # 细碎增量合并后再写出，减少写调用与代理开销
+            async for chunk in coalesce_stream(
+                chat_completion_stream(
+                    messages=messages,
+                    api_key=api_key,
+                    base_url=base_url,
+                    model=model,
+                ),
+                max_bytes=STREAM_COALESCE_MAX_BYTES,
+                max_delay=STREAM_COALESCE_MAX_DELAY_MS / 1000,
             ):
                 assistant_content += chunk
                 yield chunk
         except Exception as e:
             yield f"\n\nError: {str(e)}"
 
-        ai_msg = Message(user_id=user.id, role="assistant", content=assistant_content)
-        db.add(ai_msg)
-        db.commit()
+        await run_blocking(_save_assistant_message, user_id, assistant_content)
 
     return StreamingResponse(generate(), media_type="text/plain; charset=utf-8")
 
 
 @router.get("/history")
-async def get_chat_history(
+def get_chat_history(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -84,7 +120,7 @@ async def get_chat_history(
 
 
 @router.delete("/clear")
-async def clear_chat_history(
+def clear_chat_history(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -92,6 +128,7 @@ async def clear_chat_history(
     清除聊天历史
     """
     db.query(Message).filter(Message.user_id == user.id).delete()
+    clear_chat_summary(db, user.id)
     db.commit()
 
     return {"message": "历史记录已清除"}
@@ -11,9 +11,20 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
-from ..copyright_service import run_copyright_generation
+from ..copyright_checkpoints import CheckpointStore
 from ..database import get_db
-from ..deps import get_current_user, get_copyright_project_for_user
+from ..deps import (
+    get_copyright_project_for_user,
+    get_copyright_project_for_user_async,
+    get_current_user,
+    get_current_user_async,
+)
+from ..job_queue import (
+    FINISHED_STATUSES,
+    cancel_job,
+    enqueue_copyright_job,
+    estimate_queue_position,
+)
 from ..models import (
     CopyrightJob,
     CopyrightJobResponse,
@@ -24,7 +35,9 @@ from ..models import (
     CopyrightProjectUpdateRequest,
     User,
 )
+from ..offload import run_blocking
 from ..utils.paths import COPYRIGHT_ZIPS_DIR
+from ..worker import cancel_embedded_job, wake_embedded_worker
 
 
 router = APIRouter(prefix="/api/copyright", tags=["软著材料"])
@@ -45,13 +58,28 @@ def _get_latest_job(db: Session, project_id: int) -> Optional[CopyrightJob]:
     )
 
 
+def _get_project_job(db: Session, project_id: int, job_id: int) -> Optional[CopyrightJob]:
+    return (
+        db.query(CopyrightJob)
+        .filter(CopyrightJob.id == job_id, CopyrightJob.project_id == project_id)
+        .first()
+    )
+
+
+def _serialize_job(db: Session, job: CopyrightJob) -> CopyrightJobResponse:
+    response = CopyrightJobResponse.model_validate(job, from_attributes=True)
+    response.queue_position, response.eta_seconds = estimate_queue_position(db, job)
+    return response
+
+
 def _serialize_project(
+    db: Session,
     project: CopyrightProject,
     latest_job: Optional[CopyrightJob] = None,
 ) -> CopyrightProjectResponse:
     response = CopyrightProjectResponse.model_validate(project, from_attributes=True)
     if latest_job:
-        response.latest_job = CopyrightJobResponse.model_validate(latest_job, from_attributes=True)
+        response.latest_job = _serialize_job(db, latest_job)
     return response
 
 
@@ -80,7 +108,7 @@ def create_project(
     db.add(project)
     db.commit()
     db.refresh(project)
-    return _serialize_project(project)
+    return _serialize_project(db, project)
 
 
 @router.get("/projects")
@@ -97,7 +125,7 @@ def list_projects(
     results: List[CopyrightProjectResponse] = []
     for project in projects:
         latest_job = _get_latest_job(db, project.id)
-        results.append(_serialize_project(project, latest_job))
+        results.append(_serialize_project(db, project, latest_job))
     return {"projects": results}
 
 
@@ -107,7 +135,7 @@ def get_project_detail(
     db: Session = Depends(get_db),
 ):
     latest_job = _get_latest_job(db, project.id)
-    return _serialize_project(project, latest_job)
+    return _serialize_project(db, project, latest_job)
 
 
 @router.put("/projects/{project_id}")
@@ -124,7 +152,7 @@ def update_project(
     db.commit()
     db.refresh(project)
     latest_job = _get_latest_job(db, project.id)
-    return _serialize_project(project, latest_job)
+    return _serialize_project(db, project, latest_job)
 
 
 @router.post("/projects/{project_id}/requirements")
@@ -139,41 +167,64 @@ def update_project_requirements(
     db.commit()
     db.refresh(project)
     latest_job = _get_latest_job(db, project.id)
-    return _serialize_project(project, latest_job)
+    return _serialize_project(db, project, latest_job)
 
 
 @router.get("/projects/{project_id}/jobs/latest")
 async def get_latest_job(
-    project: CopyrightProject = Depends(get_copyright_project_for_user),
+    project: CopyrightProject = Depends(get_copyright_project_for_user_async),
     wait: int = Query(0, description="长轮询等待秒数"),
     since: Optional[str] = Query(None, description="上次更新时间（ISO 格式）"),
     db: Session = Depends(get_db),
 ):
-    job = _get_latest_job(db, project.id)
+    job = await run_blocking(_get_latest_job, db, project.id)
     if not job:
         raise HTTPException(status_code=404, detail="未找到生成任务")
     if not since or wait <= 0:
-        return CopyrightJobResponse.model_validate(job, from_attributes=True)
+        return await run_blocking(_serialize_job, db, job)
 
     try:
         since_time = datetime.fromisoformat(since)
     except Exception:
-        return CopyrightJobResponse.model_validate(job, from_attributes=True)
+        return await run_blocking(_serialize_job, db, job)
 
     wait_seconds = max(0, min(wait, 25))
     elapsed = 0
     while elapsed < wait_seconds:
         if job.updated_at and job.updated_at > since_time:
             break
-        if job.status in ("completed", "failed"):
+        if job.status in FINISHED_STATUSES:
             break
         await asyncio.sleep(1)
         elapsed += 1
-        job = _get_latest_job(db, project.id)
+        job = await run_blocking(_get_latest_job, db, project.id)
         if not job:
             break
 
-    return CopyrightJobResponse.model_validate(job, from_attributes=True)
+    return await run_blocking(_serialize_job, db, job)
+
+
+@router.post("/projects/{project_id}/jobs/{job_id}/cancel")
+async def cancel_project_job(
+    job_id: int,
+    project: CopyrightProject = Depends(get_copyright_project_for_user_async),
+    db: Session = Depends(get_db),
+):
+    """
+    取消排队中或执行中的生成任务
+
+    执行中的任务会取消进行中的模型调用，已完成阶段的检查点保留，修改需求后
+    可通过继续生成复用。
+    """
+    job = await run_blocking(_get_project_job, db, project.id, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="未找到生成任务")
+    if not await run_blocking(cancel_job, db, job.id):
+        raise HTTPException(status_code=400, detail="任务已结束，无法取消")
+    cancel_embedded_job(job.id)
+
+    await run_blocking(db.refresh, job)
+    return await run_blocking(_serialize_job, db, job)
 
 
 @router.get("/projects/{project_id}/download")
@@ -192,41 +243,61 @@ def download_zip(
 
 @router.post("/projects/{project_id}/generate")
 async def generate_project(
-    project: CopyrightProject = Depends(get_copyright_project_for_user),
-    user: User = Depends(get_current_user),
+    project: CopyrightProject = Depends(get_copyright_project_for_user_async),
+    user: User = Depends(get_current_user_async),
+    use_cache: bool = Query(True, description="是否使用生成缓存（重新生成时传 false）"),
+    priority: str = Query("interactive", description="优先级：interactive（等待结果）或 bulk（批量生成）"),
     db: Session = Depends(get_db),
 ):
-    job = CopyrightJob(
-        project_id=project.id,
-        status="queued",
-        stage="preparing",
-        message="已进入队列，等待开始生成...",
-        progress=0,
+    job = await run_blocking(
+        enqueue_copyright_job, db, project.id, use_cache=use_cache, priority=priority
     )
-    db.add(job)
-    db.commit()
-    db.refresh(job)
+    wake_embedded_worker()
 
-    asyncio.create_task(run_copyright_generation(job.id, project.id, user.id))
+    return await run_blocking(_serialize_job, db, job)
 
-    return CopyrightJobResponse.model_validate(job, from_attributes=True)
+
+@router.post("/projects/{project_id}/resume")
+async def resume_project(
+    project: CopyrightProject = Depends(get_copyright_project_for_user_async),
+    user: User = Depends(get_current_user_async),
+    use_cache: bool = Query(True, description="是否使用生成缓存（重新生成时传 false）"),
+    priority: str = Query("interactive", description="优先级：interactive（等待结果）或 bulk（批量生成）"),
+    db: Session = Depends(get_db),
+):
+    """
+    继续生成：新建任务并复用上次各阶段的检查点
+
+    只有输入发生变化的阶段（及其下游）会重新调用模型，适用于上次任务中途失败
+    或只修改了部分需求/说明的情况。
+    """
+    if not await run_blocking(CheckpointStore(project.id).has_any):
+        raise HTTPException(status_code=400, detail="没有可复用的生成记录，请直接生成")
+
+    job = await run_blocking(
+        enqueue_copyright_job,
+        db,
+        project.id,
+        use_cache=use_cache,
+        resume=True,
+        priority=priority,
+        message="已进入队列，将复用上次的生成结果...",
+    )
+    wake_embedded_worker()
+
+    return await run_blocking(_serialize_job, db, job)
 
 
 @router.get("/projects/{project_id}/generate/stream")
 async def generate_project_stream(
-    project: CopyrightProject = Depends(get_copyright_project_for_user),
-    user: User = Depends(get_current_user),
+    project: CopyrightProject = Depends(get_copyright_project_for_user_async),
+    user: User = Depends(get_current_user_async),
+    use_cache: bool = Query(True, description="是否使用生成缓存（重新生成时传 false）"),
+    priority: str = Query("interactive", description="优先级：interactive（等待结果）或 bulk（批量生成）"),
     db: Session = Depends(get_db),
 ):
-    job = CopyrightJob(
-        project_id=project.id,
-        status="queued",
-        stage="preparing",
-        message="已进入队列，等待开始生成...",
-        progress=0,
+    job = await run_blocking(
+        enqueue_copyright_job, db, project.id, use_cache=use_cache, priority=priority
     )
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-    asyncio.create_task(run_copyright_generation(job.id, project.id, user.id))
-    return CopyrightJobResponse.model_validate(job, from_attributes=True)
+    wake_embedded_worker()
+    return await run_blocking(_serialize_job, db, job)
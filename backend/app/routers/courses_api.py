@@ -2,10 +2,17 @@
 课程管理 API
 """
 from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..deps import get_course_for_user, get_current_user
+from ..database import get_async_db, get_db
+from ..deps import (
+    get_course_for_user,
+    get_course_for_user_async,
+    get_current_user,
+    get_current_user_async,
+)
 from ..models import (
     Course,
     CourseCreateRequest,
@@ -16,6 +23,7 @@ from ..models import (
     User,
     calculate_semester,
 )
+from ..offload import run_blocking
 from ..utils.documents import attach_file_exists
 
 
@@ -23,7 +31,7 @@ router = APIRouter(prefix="/api/courses", tags=["课程管理"])
 
 
 @router.post("", response_model=CourseResponse)
-async def create_course(
+def create_course(
     course_data: CourseCreateRequest,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -61,44 +69,42 @@ async def create_course(
 
 @router.get("", response_model=list[CourseResponse])
 async def get_courses(
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     获取当前用户的所有课程列表
 
     按创建时间倒序排列
     """
-    courses = (
-        db.query(Course)
-        .filter(Course.user_id == user.id)
+    courses = await db.scalars(
+        select(Course)
+        .where(Course.user_id == user.id)
         .order_by(Course.created_at.desc())
-        .all()
     )
 
-    return courses
+    return courses.all()
 
 
 @router.get("/{course_id}", response_model=CourseWithDocumentsResponse)
 async def get_course(
-    course: Course = Depends(get_course_for_user),
-    db: Session = Depends(get_db),
+    course: Course = Depends(get_course_for_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     获取单个课程详情，包含所有文档
     """
-    documents = (
-        db.query(CourseDocument)
-        .filter(CourseDocument.course_id == course.id)
+    documents = await db.scalars(
+        select(CourseDocument)
+        .where(CourseDocument.course_id == course.id)
         .order_by(CourseDocument.created_at.desc())
-        .all()
     )
 
-    return {"course": course, "documents": attach_file_exists(documents)}
+    return {"course": course, "documents": await run_blocking(attach_file_exists, documents.all())}
 
 
 @router.put("/{course_id}", response_model=CourseResponse)
-async def update_course(
+def update_course(
     course_data: CourseUpdateRequest,
     course: Course = Depends(get_course_for_user),
     db: Session = Depends(get_db),
@@ -119,7 +125,7 @@ async def update_course(
 
 
 @router.delete("/{course_id}")
-async def delete_course(
+def delete_course(
     course: Course = Depends(get_course_for_user),
     db: Session = Depends(get_db),
 ):
@@ -8,13 +8,22 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..deps import get_course_for_user, get_document_for_user
+from ..database import get_async_db, get_db
+from ..deps import (
+    get_course_for_user,
+    get_course_for_user_async,
+    get_document_for_user,
+    get_document_for_user_async,
+)
 from ..utils.paths import UPLOADS_DIR, course_documents_dir, ensure_dir
 from ..utils.documents import attach_file_exists, resolve_document_file_path
 from ..docx_service import render_docx_template, render_lesson_plan_docx
+from ..lesson_plan_prefetch import lesson_plan_prefetcher
+from ..offload import run_blocking
 from ..utils.plan_params import (
     parse_plan_params_json,
     build_plan_params_from_content,
@@ -33,7 +42,7 @@ router = APIRouter(prefix="/api", tags=["文档管理"])
 
 
 @router.post("/courses/{course_id}/documents", response_model=DocumentResponse)
-async def create_document(
+def create_document(
     document_data: DocumentCreateRequest,
     course: Course = Depends(get_course_for_user),
     db: Session = Depends(get_db),
@@ -57,11 +66,14 @@ async def create_document(
         db.rollback()
         raise HTTPException(status_code=400, detail=f"文档创建失败：{str(e)}")
 
+    if document.doc_type == "plan":
+        lesson_plan_prefetcher.cancel_course(course.id)
+
     return document
 
 
 @router.post("/courses/{course_id}/documents/upload")
-async def upload_document(
+def upload_document(
     file: UploadFile = File(...),
     doc_type: str = File(...),
     title: str = File(...),
@@ -202,57 +214,56 @@ async def upload_document(
             file_path.unlink()
         raise HTTPException(status_code=400, detail=f"文档创建失败：{str(e)}")
 
+    if doc_type == "plan":
+        lesson_plan_prefetcher.cancel_course(course.id)
+
     return {"message": "文件上传成功", "document": document}
 
 
 @router.get("/courses/{course_id}/documents", response_model=list[DocumentResponse])
 async def get_documents(
-    course: Course = Depends(get_course_for_user),
-    db: Session = Depends(get_db),
+    course: Course = Depends(get_course_for_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """获取课程的所有文档列表"""
-    documents = (
-        db.query(CourseDocument)
-        .filter(CourseDocument.course_id == course.id)
+    documents = await db.scalars(
+        select(CourseDocument)
+        .where(CourseDocument.course_id == course.id)
         .order_by(CourseDocument.doc_type, CourseDocument.lesson_number)
-        .all()
     )
 
-    return attach_file_exists(documents)
+    return await run_blocking(attach_file_exists, documents.all())
 
 
 @router.get("/courses/{course_id}/documents/type/{doc_type}", response_model=list[DocumentResponse])
 async def get_documents_by_type(
     doc_type: str,
-    course: Course = Depends(get_course_for_user),
-    db: Session = Depends(get_db),
+    course: Course = Depends(get_course_for_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """获取指定类型的文档列表"""
-    query = db.query(CourseDocument).filter(CourseDocument.course_id == course.id)
+    query = select(CourseDocument).where(CourseDocument.course_id == course.id)
     if doc_type == "lesson":
-        query = query.filter(CourseDocument.doc_type.in_(["lesson", "lesson_plan"]))
+        query = query.where(CourseDocument.doc_type.in_(["lesson", "lesson_plan"]))
     else:
-        query = query.filter(CourseDocument.doc_type == doc_type)
+        query = query.where(CourseDocument.doc_type == doc_type)
 
-    documents = (
-        query.order_by(CourseDocument.lesson_number)
-        .all()
-    )
+    documents = await db.scalars(query.order_by(CourseDocument.lesson_number))
 
-    return attach_file_exists(documents)
+    return await run_blocking(attach_file_exists, documents.all())
 
 
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
 async def get_document(
-    document: CourseDocument = Depends(get_document_for_user),
+    document: CourseDocument = Depends(get_document_for_user_async),
 ):
     """获取单个文档详情"""
-    attach_file_exists([document])
+    await run_blocking(attach_file_exists, [document])
     return document
 
 
 @router.get("/documents/{document_id}/download")
-async def download_document_by_id(
+def download_document_by_id(
     document: CourseDocument = Depends(get_document_for_user),
 ):
     """下载文档文件（带正确文件名）"""
@@ -274,7 +285,7 @@ async def download_document_by_id(
 
 
 @router.put("/documents/{document_id}", response_model=DocumentResponse)
-async def update_document(
+def update_document(
     document_data: DocumentUpdateRequest,
     document: CourseDocument = Depends(get_document_for_user),
     db: Session = Depends(get_db),
@@ -296,11 +307,14 @@ async def update_document(
     db.commit()
     db.refresh(document)
 
+    if document.doc_type == "plan":
+        lesson_plan_prefetcher.cancel_course(document.course_id)
+
     return document
 
 
 @router.post("/documents/{document_id}/render", response_model=DocumentResponse)
-async def render_document(
+def render_document(
     document: CourseDocument = Depends(get_document_for_user),
     db: Session = Depends(get_db),
 ):
@@ -341,7 +355,7 @@ async def render_document(
 
 
 @router.delete("/documents/{document_id}")
-async def delete_document(
+def delete_document(
     document: CourseDocument = Depends(get_document_for_user),
     db: Session = Depends(get_db),
 ):
@@ -354,6 +368,9 @@ async def delete_document(
         except Exception as e:
             print(f"删除文件失败：{e}")
 
+    if document.doc_type == "plan":
+        lesson_plan_prefetcher.cancel_course(document.course_id)
+
     db.delete(document)
     db.commit()
 
@@ -361,7 +378,7 @@ async def delete_document(
 
 
 @router.get("/documents/files/{course_id}/{filename}")
-async def download_document(
+def download_document(
     filename: str,
     course: Course = Depends(get_course_for_user),
 ):
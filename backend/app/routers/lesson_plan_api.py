@@ -3,15 +3,22 @@
 """
 import asyncio
 import json
+import logging
+from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
-from ..database import get_db
-from ..deps import get_course_for_user, get_current_user
+from ..config import LESSON_PLAN_BATCH_CONCURRENCY, LESSON_PLAN_BATCH_MAX_CONCURRENCY
+from ..database import AsyncSessionLocal, get_async_db, get_db
+from ..deps import get_course_for_user, get_course_for_user_async, get_current_user_async
 from ..docx_service import render_lesson_plan_docx
-from ..knowledge_service import retrieve_course_context, build_ai_context_prompt
+from ..knowledge_service import retrieve_course_context_async, build_ai_context_prompt
+from ..lesson_plan_prefetch import build_draft_fingerprint, lesson_plan_prefetcher
 from ..models import Course, CourseDocument, User
+from ..offload import run_blocking
 from ..utils.documents import attach_file_exists, resolve_document_file_path
 from ..utils.plan_params import (
     parse_plan_params_json,
@@ -23,10 +30,14 @@ from ..utils.sse import sse_event, sse_response
 from ..ai_service import (
     generate_lesson_plan_content,
     regenerate_time_allocation,
+    solve_time_allocation,
+    stream_lesson_plan_content,
     validate_time_allocation,
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/courses", tags=["教案生成"])
 
 
@@ -57,12 +68,363 @@ def _apply_list_newlines(data: dict) -> None:
             data[key] = _normalize_list_text(data[key])
 
 
+def _apply_time_allocation(data: Dict[str, Any], allocation: Dict[str, Any]) -> None:
+    if isinstance(allocation.get("review_time"), int):
+        data["review_time"] = allocation.get("review_time")
+    if isinstance(allocation.get("new_lessons"), list) and isinstance(data.get("new_lessons"), list):
+        for idx, item in enumerate(data["new_lessons"]):
+            if idx < len(allocation["new_lessons"]) and isinstance(item, dict):
+                time_value = allocation["new_lessons"][idx].get("time")
+                if isinstance(time_value, int):
+                    item["time"] = time_value
+
+
+async def _get_latest_plan_doc(db: AsyncSession, course_id: int) -> Optional[CourseDocument]:
+    return await db.scalar(
+        select(CourseDocument)
+        .where(CourseDocument.course_id == course_id, CourseDocument.doc_type == "plan")
+        .order_by(CourseDocument.created_at.desc())
+        .limit(1)
+    )
+
+
+def _check_lesson_plan_prerequisites(course: Course, user: User) -> None:
+    if not user.ai_api_key or not user.ai_base_url:
+        raise HTTPException(status_code=400, detail="请先配置 AI API")
+    if course.course_type == "C":
+        raise HTTPException(status_code=400, detail="C类课程教案暂未开发，请自行上传教案")
+
+
+async def _resolve_plan_params(db: AsyncSession, plan_doc: CourseDocument) -> Dict[str, Any]:
+    if not plan_doc.content:
+        raise ValueError("当前授课计划为上传文档，无法用于教案生成，请使用系统生成授课计划")
+    if plan_doc.plan_params:
+        parsed = parse_plan_params_json(plan_doc.plan_params)
+        if parsed and parsed.get("schedule"):
+            return parsed
+
+    try:
+        content_data = json.loads(plan_doc.content)
+    except Exception:
+        content_data = None
+    if isinstance(content_data, dict):
+        params = build_plan_params_from_content(content_data)
+        if params and params.get("schedule"):
+            plan_doc.plan_params = json.dumps(params, ensure_ascii=False)
+            await db.commit()
+            return params
+    raise ValueError("授课计划内容格式不完整，请重新生成授课计划")
+
+
+def _build_lesson_inputs(
+    plan_params: Dict[str, Any],
+    sequence: int,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """根据授课计划参数计算系统字段与授课计划条目"""
+    schedule = plan_params.get("schedule") if isinstance(plan_params, dict) else None
+    if not isinstance(schedule, list) or not schedule:
+        raise ValueError("授课计划参数缺失，请重新生成授课计划")
+
+    plan_item = get_plan_item(schedule, sequence)
+    if not plan_item:
+        raise ValueError("授课顺序不在授课计划范围内")
+
+    hour_per_class = plan_params.get("hour_per_class")
+    if not isinstance(hour_per_class, int) or hour_per_class <= 0:
+        hour_per_class = plan_item.get("hour") if isinstance(plan_item.get("hour"), int) else None
+
+    if not isinstance(hour_per_class, int) or hour_per_class <= 0:
+        raise ValueError("授课计划缺少单次学时信息")
+
+    hours = plan_item.get("hour") if isinstance(plan_item.get("hour"), int) else hour_per_class
+    week_number = plan_item.get("week") if isinstance(plan_item.get("week"), int) else sequence
+    cumulative_hours = compute_cumulative_hours(schedule, sequence, default_hour=hour_per_class)
+
+    system_fields = {
+        "project_name": plan_item.get("title") or plan_item.get("project_name") or f"第{sequence}次课",
+        "week": week_number,
+        "sequence": sequence,
+        "hours": hours,
+        "total_hours": cumulative_hours,
+    }
+
+    plan_item_payload = {
+        "week": week_number,
+        "order": sequence,
+        "title": plan_item.get("title") or "",
+        "tasks": plan_item.get("tasks") or "",
+        "hour": hours,
+    }
+    return system_fields, plan_item_payload
+
+
+async def _load_course_context(db: AsyncSession, course_id: int) -> Dict[str, Any]:
+    context = await retrieve_course_context_async(db, course_id)
+    if context.get("documents"):
+        context["documents"] = [
+            doc for doc in context["documents"] if doc.get("type") != "plan"
+        ]
+    return context
+
+
+def _build_lesson_context_prompt(context: Dict[str, Any], system_fields: Dict[str, Any]) -> str:
+    """按目标课次的相关度在 token 预算内组装课程上下文"""
+    return build_ai_context_prompt(
+        context,
+        target_lesson=system_fields["sequence"],
+        target_title=system_fields["project_name"],
+    )
+
+
+async def _generate_lesson_plan_data(
+    *,
+    sequence: int,
+    system_fields: Dict[str, Any],
+    plan_item_payload: Dict[str, Any],
+    plan_text: str,
+    context_prompt: str,
+    api_key: str,
+    base_url: str,
+    model: str,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """调用 AI 生成教案数据，覆盖系统字段并校正时间分配"""
+    lesson_plan_data = await generate_lesson_plan_content(
+        sequence=sequence,
+        plan_item=plan_item_payload,
+        system_fields=system_fields,
+        document_full_text=plan_text,
+        course_context=context_prompt,
+        api_key=api_key,
+        base_url=base_url,
+        model=model,
+        strict_mode=True,
+        use_cache=use_cache,
+    )
+    return await _finalize_lesson_plan_data(
+        lesson_plan_data,
+        system_fields,
+        api_key=api_key,
+        base_url=base_url,
+        model=model,
+        use_cache=use_cache,
+    )
+
+
+async def _finalize_lesson_plan_data(
+    lesson_plan_data: Dict[str, Any],
+    system_fields: Dict[str, Any],
+    *,
+    api_key: str,
+    base_url: str,
+    model: str,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """覆盖系统字段、统一列表换行并校正时间分配"""
+    # 覆盖系统字段
+    lesson_plan_data["project_name"] = system_fields["project_name"]
+    lesson_plan_data["week"] = system_fields["week"]
+    lesson_plan_data["sequence"] = system_fields["sequence"]
+    lesson_plan_data["hours"] = system_fields["hours"]
+    lesson_plan_data["total_hours"] = system_fields["total_hours"]
+
+    # 列表字段统一换行
+    _apply_list_newlines(lesson_plan_data)
+
+    # 时间分配校验：先用本地求解器修正，仍不通过时再请求 AI 重新分配
+    ok, reason = validate_time_allocation(lesson_plan_data, system_fields["hours"])
+    if not ok:
+        allocation = solve_time_allocation(lesson_plan_data, system_fields["hours"])
+        if allocation:
+            _apply_time_allocation(lesson_plan_data, allocation)
+            ok, reason = validate_time_allocation(lesson_plan_data, system_fields["hours"])
+    if not ok:
+        for attempt in range(2):
+            allocation = await regenerate_time_allocation(
+                lesson_plan_data=lesson_plan_data,
+                hours=system_fields["hours"],
+                api_key=api_key,
+                base_url=base_url,
+                model=model,
+                use_cache=use_cache and attempt == 0,
+            )
+            if isinstance(allocation, dict):
+                _apply_time_allocation(lesson_plan_data, allocation)
+            ok, reason = validate_time_allocation(lesson_plan_data, system_fields["hours"])
+            if ok:
+                break
+    if not ok:
+        raise ValueError(f"时间分配校验失败：{reason}")
+    return lesson_plan_data
+
+
+def _lesson_draft_fingerprint(
+    system_fields: Dict[str, Any],
+    plan_item_payload: Dict[str, Any],
+    plan_text: str,
+    context_prompt: str,
+    base_url: str,
+    model: str,
+) -> str:
+    return build_draft_fingerprint(
+        system_fields=system_fields,
+        plan_item=plan_item_payload,
+        plan_text=plan_text,
+        context=context_prompt,
+        base_url=base_url,
+        model=model,
+    )
+
+
+def _next_sequence(plan_params: Dict[str, Any], sequence: int) -> Optional[int]:
+    schedule = plan_params.get("schedule") or []
+    later = [
+        item.get("order")
+        for item in schedule
+        if isinstance(item, dict) and isinstance(item.get("order"), int) and item.get("order") > sequence
+    ]
+    return min(later) if later else None
+
+
+async def _lesson_exists(db: AsyncSession, course_id: int, sequence: int) -> bool:
+    lesson_id = await db.scalar(
+        select(CourseDocument.id)
+        .where(
+            CourseDocument.course_id == course_id,
+            CourseDocument.doc_type.in_(["lesson", "lesson_plan"]),
+            CourseDocument.lesson_number == sequence,
+        )
+        .limit(1)
+    )
+    return lesson_id is not None
+
+
+async def _schedule_next_lesson_prefetch(
+    db: AsyncSession,
+    *,
+    user_id: int,
+    course_id: int,
+    sequence: int,
+    plan_params: Dict[str, Any],
+    plan_text: str,
+    api_key: str,
+    base_url: str,
+    model: str,
+) -> Optional[int]:
+    """
+    在后台预生成下一次课的教案草稿
+
+    下一次课已有教案时不预生成。须在本次教案保存之后调用：课程上下文在此
+    重新读取，包含刚保存的本次课教案，与下一次请求读取到的上下文一致，
+    草稿指纹才能命中。草稿只保存在内存中，由下一次请求取用后再渲染与入库，
+    因此后台任务不需要数据库会话。
+
+    Returns:
+        预生成（或已在预生成）的课次，无需预生成时返回 None
+    """
+    next_sequence = _next_sequence(plan_params, sequence)
+    if next_sequence is None:
+        return None
+    if await _lesson_exists(db, course_id, next_sequence):
+        return None
+
+    system_fields, plan_item_payload = _build_lesson_inputs(plan_params, next_sequence)
+    context = await _load_course_context(db, course_id)
+    context_prompt = _build_lesson_context_prompt(context, system_fields)
+    fingerprint = _lesson_draft_fingerprint(
+        system_fields, plan_item_payload, plan_text, context_prompt, base_url, model
+    )
+    lesson_plan_prefetcher.schedule(
+        user_id,
+        course_id,
+        next_sequence,
+        fingerprint,
+        lambda: _generate_lesson_plan_data(
+            sequence=next_sequence,
+            system_fields=system_fields,
+            plan_item_payload=plan_item_payload,
+            plan_text=plan_text,
+            context_prompt=context_prompt,
+            api_key=api_key,
+            base_url=base_url,
+            model=model,
+        ),
+    )
+    return next_sequence
+
+
+async def _existing_lesson_numbers(db: AsyncSession, course_id: int) -> set:
+    numbers = await db.scalars(
+        select(CourseDocument.lesson_number).where(
+            CourseDocument.course_id == course_id,
+            CourseDocument.doc_type.in_(["lesson", "lesson_plan"]),
+        )
+    )
+    return set(numbers.all())
+
+
+def _remove_replaced_file(document: CourseDocument, file_path: str) -> None:
+    """覆盖教案时删除旧的 Word 文件（文件名与新文件相同时保留）"""
+    old_file_path = resolve_document_file_path(document)
+    if old_file_path and old_file_path.exists() and old_file_path.name != Path(file_path).name:
+        old_file_path.unlink()
+
+
+async def _save_lesson_plan_document(
+    db: AsyncSession,
+    course_id: int,
+    sequence: int,
+    week: int,
+    lesson_plan_data: Dict[str, Any],
+    file_path: str,
+) -> CourseDocument:
+    """保存教案文档（同课次存在则覆盖）"""
+    title = f"{sequence + 1}广东碧桂园职业学院教案（主页）-第{week}周教案"
+
+    existing_doc = await db.scalar(
+        select(CourseDocument)
+        .where(
+            CourseDocument.course_id == course_id,
+            CourseDocument.doc_type.in_(["lesson", "lesson_plan"]),
+            CourseDocument.lesson_number == sequence,
+        )
+        .limit(1)
+    )
+
+    if existing_doc:
+        await run_blocking(_remove_replaced_file, existing_doc, file_path)
+
+        existing_doc.doc_type = "lesson"
+        existing_doc.title = title
+        existing_doc.content = json.dumps(lesson_plan_data, ensure_ascii=False)
+        existing_doc.file_url = f"/uploads/{file_path}"
+        existing_doc.lesson_number = sequence
+        await db.commit()
+        await db.refresh(existing_doc)
+        return existing_doc
+
+    document = CourseDocument(
+        course_id=course_id,
+        doc_type="lesson",
+        title=title,
+        content=json.dumps(lesson_plan_data, ensure_ascii=False),
+        file_url=f"/uploads/{file_path}",
+        lesson_number=sequence,
+    )
+    db.add(document)
+    await db.commit()
+    await db.refresh(document)
+    return document
+
+
 @router.api_route("/{course_id}/generate-lesson-plan/stream", methods=["GET", "POST"])
 async def generate_lesson_plan_stream(
     sequence: int = Query(..., description="授课顺序"),
-    course: Course = Depends(get_course_for_user),
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    use_cache: bool = Query(True, description="是否使用生成缓存（重新生成时传 false）"),
+    prefetch_next: bool = Query(False, description="生成成功后在后台预生成下一次课的草稿"),
+    course: Course = Depends(get_course_for_user_async),
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     生成教案（带进度推送）
@@ -70,49 +432,30 @@ async def generate_lesson_plan_stream(
     使用 SSE 推送 4 个阶段的进度：
     1. 解析需求 (10%)
     2. 检索知识 (30%)
-    3. AI 生成 (70%)
+    3. AI 生成 (70%，模型每输出完一个顶层字段推送一次 field 事件)
     4. 填充模板 (90%)
     5. 完成 (100%)
+
+    存在输入一致的预生成草稿时（use_cache=true）直接使用草稿，跳过 AI 生成。
+    prefetch_next=true 时，完成后在后台预生成下一次课的草稿。
     """
     # 检查 AI 配置
-    if not user.ai_api_key or not user.ai_base_url:
-        raise HTTPException(status_code=400, detail="请先配置 AI API")
-    if course.course_type == "C":
-        raise HTTPException(status_code=400, detail="C类课程教案暂未开发，请自行上传教案")
+    _check_lesson_plan_prerequisites(course, user)
 
     # 获取授课计划文档（教案生成所需的核心输入）
-    plan_docs = (
-        db.query(CourseDocument)
-        .filter(CourseDocument.course_id == course.id, CourseDocument.doc_type == "plan")
-        .order_by(CourseDocument.created_at.desc())
-        .all()
-    )
-
-    if not plan_docs:
+    plan_doc = await _get_latest_plan_doc(db, course.id)
+    if not plan_doc:
         raise HTTPException(status_code=400, detail="请先创建授课计划")
-
-    plan_doc = plan_docs[0]
-
-    async def resolve_plan_params() -> dict:
-        if not plan_doc.content:
-            raise ValueError("当前授课计划为上传文档，无法用于教案生成，请使用系统生成授课计划")
-        if plan_doc.plan_params:
-            parsed = parse_plan_params_json(plan_doc.plan_params)
-            if parsed and parsed.get("schedule"):
-                return parsed
-
-        if plan_doc.content:
-            try:
-                content_data = json.loads(plan_doc.content)
-            except Exception:
-                content_data = None
-            if isinstance(content_data, dict):
-                params = build_plan_params_from_content(content_data)
-                if params and params.get("schedule"):
-                    plan_doc.plan_params = json.dumps(params, ensure_ascii=False)
-                    db.commit()
-                    return params
-        raise ValueError("授课计划内容格式不完整，请重新生成授课计划")
+    # 结束只读事务归还连接（提交后对象不过期），生成器中需要时再取连接
+    await db.commit()
+
+    # 生成过程中只使用提前取出的字段，不再访问 ORM 对象
+    plan_text = plan_doc.content or ""
+    user_id = user.id
+    course_id = course.id
+    api_key = user.ai_api_key
+    base_url = user.ai_base_url
+    model = user.ai_model_name or "gpt-4"
     
     async def event_generator() -> AsyncGenerator[str, None]:
         try:
@@ -135,45 +478,8 @@ async def generate_lesson_plan_stream(
                 }
             )
 
-            use_generated_plan = True
-            plan_item_payload = None
-            system_fields = None
-
-            plan_params = await resolve_plan_params()
-            schedule = plan_params.get("schedule") if isinstance(plan_params, dict) else None
-            if not isinstance(schedule, list) or not schedule:
-                raise ValueError("授课计划参数缺失，请重新生成授课计划")
-
-            plan_item = get_plan_item(schedule, sequence)
-            if not plan_item:
-                raise ValueError("授课顺序不在授课计划范围内")
-
-            hour_per_class = plan_params.get("hour_per_class")
-            if not isinstance(hour_per_class, int) or hour_per_class <= 0:
-                hour_per_class = plan_item.get("hour") if isinstance(plan_item.get("hour"), int) else None
-
-            if not isinstance(hour_per_class, int) or hour_per_class <= 0:
-                raise ValueError("授课计划缺少单次学时信息")
-
-            hours = plan_item.get("hour") if isinstance(plan_item.get("hour"), int) else hour_per_class
-            week_number = plan_item.get("week") if isinstance(plan_item.get("week"), int) else sequence
-            cumulative_hours = compute_cumulative_hours(schedule, sequence, default_hour=hour_per_class)
-
-            system_fields = {
-                "project_name": plan_item.get("title") or plan_item.get("project_name") or f"第{sequence}次课",
-                "week": week_number,
-                "sequence": sequence,
-                "hours": hours,
-                "total_hours": cumulative_hours,
-            }
-
-            plan_item_payload = {
-                "week": week_number,
-                "order": sequence,
-                "title": plan_item.get("title") or "",
-                "tasks": plan_item.get("tasks") or "",
-                "hour": hours,
-            }
+            plan_params = await _resolve_plan_params(db, plan_doc)
+            system_fields, plan_item_payload = _build_lesson_inputs(plan_params, sequence)
 
             # 阶段 3: 检索知识库
             yield sse_event(
@@ -184,80 +490,118 @@ async def generate_lesson_plan_stream(
                 }
             )
             
-            context = retrieve_course_context(db, course.id)
-            if context.get("documents"):
-                context["documents"] = [
-                    doc for doc in context["documents"] if doc.get("type") != "plan"
-                ]
-            context_prompt = build_ai_context_prompt(context)
-            await asyncio.sleep(0.5)
-            
-            # 阶段 4: AI 生成内容
-            yield sse_event(
-                {
-                    "stage": "generating",
-                    "progress": 50,
-                    "message": "正在调用 AI 生成教案内容...",
-                }
-            )
-            
-            lesson_plan_data = await generate_lesson_plan_content(
-                sequence=sequence,
-                plan_item=plan_item_payload,
-                system_fields=system_fields,
-                document_full_text=plan_doc.content or "",
-                course_context=context_prompt,
-                api_key=user.ai_api_key,
-                base_url=user.ai_base_url,
-                model=user.ai_model_name or "gpt-4",
-                strict_mode=use_generated_plan,
-            )
+            context = await _load_course_context(db, course_id)
+            context_prompt = _build_lesson_context_prompt(context, system_fields)
 
-            # 覆盖系统字段
-            lesson_plan_data["project_name"] = system_fields["project_name"]
-            lesson_plan_data["week"] = system_fields["week"]
-            lesson_plan_data["sequence"] = system_fields["sequence"]
-            lesson_plan_data["hours"] = system_fields["hours"]
-            lesson_plan_data["total_hours"] = system_fields["total_hours"]
+            # 所需数据已读取完毕，关闭请求会话归还连接，AI 生成期间不占用连接池
+            await db.close()
+
+            # 输入指纹一致的预生成草稿可直接使用（重新生成时不使用）
+            lesson_plan_data: Optional[Dict[str, Any]] = None
+            if use_cache:
+                fingerprint = _lesson_draft_fingerprint(
+                    system_fields, plan_item_payload, plan_text, context_prompt, base_url, model
+                )
+                draft_status = lesson_plan_prefetcher.lookup(user_id, course_id, sequence, fingerprint)
+                if draft_status == "pending":
+                    yield sse_event(
+                        {
+                            "stage": "generating",
+                            "progress": 50,
+                            "message": "正在等待预生成草稿完成...",
+                        }
+                    )
+                if draft_status is not None:
+                    lesson_plan_data = await lesson_plan_prefetcher.take(
+                        user_id, course_id, sequence, fingerprint
+                    )
 
-            # 列表字段统一换行
-            _apply_list_newlines(lesson_plan_data)
+            if lesson_plan_data is not None:
+                yield sse_event(
+                    {
+                        "stage": "generating",
+                        "progress": 70,
+                        "message": "已使用预生成草稿，正在处理数据...",
+                        "prefetched": True,
+                    }
+                )
+            else:
+                await asyncio.sleep(0.5)
+
+                # 阶段 4: AI 生成内容
+                yield sse_event(
+                    {
+                        "stage": "generating",
+                        "progress": 50,
+                        "message": "正在调用 AI 生成教案内容...",
+                    }
+                )
 
-            # 时间分配校验
-            ok, reason = validate_time_allocation(lesson_plan_data, system_fields["hours"])
-            if not ok:
-                for _ in range(2):
-                    allocation = await regenerate_time_allocation(
-                        lesson_plan_data=lesson_plan_data,
-                        hours=system_fields["hours"],
-                        api_key=user.ai_api_key,
-                        base_url=user.ai_base_url,
-                        model=user.ai_model_name or "gpt-4",
+                # 流式接收模型输出，每完成一个顶层字段推送一次进度
+                partial_data: Dict[str, Any] = {}
+                allocation_checked = False
+                async for event in stream_lesson_plan_content(
+                    sequence=sequence,
+                    plan_item=plan_item_payload,
+                    system_fields=system_fields,
+                    document_full_text=plan_text,
+                    course_context=context_prompt,
+                    api_key=api_key,
+                    base_url=base_url,
+                    model=model,
+                    strict_mode=True,
+                    use_cache=use_cache,
+                ):
+                    if event["type"] == "done":
+                        lesson_plan_data = event["data"]
+                        continue
+                    key = event["key"]
+                    partial_data[key] = event["value"]
+                    yield sse_event(
+                        {
+                            "stage": "generating",
+                            "progress": min(68, 50 + len(partial_data)),
+                            "message": f"已生成字段：{key}",
+                            "field": key,
+                            "value": event["value"],
+                        }
                     )
-                    if isinstance(allocation, dict):
-                        if isinstance(allocation.get("review_time"), int):
-                            lesson_plan_data["review_time"] = allocation.get("review_time")
-                        if isinstance(allocation.get("new_lessons"), list) and isinstance(
-                            lesson_plan_data.get("new_lessons"), list
-                        ):
-                            for idx, item in enumerate(lesson_plan_data["new_lessons"]):
-                                if idx < len(allocation["new_lessons"]):
-                                    time_value = allocation["new_lessons"][idx].get("time")
-                                    if isinstance(time_value, int):
-                                        item["time"] = time_value
-                    ok, reason = validate_time_allocation(lesson_plan_data, system_fields["hours"])
-                    if ok:
-                        break
-            if not ok:
-                raise ValueError(f"时间分配校验失败：{reason}")
-            
-            yield sse_event(
-                {
-                    "stage": "generating",
-                    "progress": 70,
-                    "message": "AI 生成完成，正在处理数据...",
-                }
-            )
+                    # 时间分配字段齐全后立即校验，不必等待模型输出结束
+                    if (
+                        not allocation_checked
+                        and "review_time" in partial_data
+                        and "new_lessons" in partial_data
+                    ):
+                        allocation_checked = True
+                        ok, reason = validate_time_allocation(partial_data, system_fields["hours"])
+                        yield sse_event(
+                            {
+                                "stage": "validating",
+                                "progress": min(68, 50 + len(partial_data)),
+                                "message": "时间分配校验通过" if ok else f"时间分配需要校正：{reason}",
+                                "time_allocation_ok": ok,
+                            }
+                        )
+
+                if lesson_plan_data is None:
+                    raise ValueError("AI 未返回完整的教案内容")
+
+                lesson_plan_data = await _finalize_lesson_plan_data(
+                    lesson_plan_data,
+                    system_fields,
+                    api_key=api_key,
+                    base_url=base_url,
+                    model=model,
+                    use_cache=use_cache,
+                )
+
+                yield sse_event(
+                    {
+                        "stage": "generating",
+                        "progress": 70,
+                        "message": "AI 生成完成，正在处理数据...",
+                    }
+                )
             
             # 阶段 5: 填充模板
             yield sse_event(
@@ -269,47 +613,36 @@ async def generate_lesson_plan_stream(
             )
             
             # 渲染 Word 文档
-            file_path = render_lesson_plan_docx(lesson_plan_data, course.id)
-            
-            title = f"{sequence + 1}广东碧桂园职业学院教案（主页）-第{system_fields['week']}周教案"
-
-            # 保存到数据库（同课次存在则覆盖）
-            existing_doc = (
-                db.query(CourseDocument)
-                .filter(
-                    CourseDocument.course_id == course.id,
-                    CourseDocument.doc_type.in_(["lesson", "lesson_plan"]),
-                    CourseDocument.lesson_number == sequence,
-                )
-                .first()
-            )
-
-            if existing_doc:
-                old_file_path = resolve_document_file_path(existing_doc)
-                if old_file_path and old_file_path.exists():
-                    old_file_path.unlink()
-
-                existing_doc.doc_type = "lesson"
-                existing_doc.title = title
-                existing_doc.content = json.dumps(lesson_plan_data, ensure_ascii=False)
-                existing_doc.file_url = f"/uploads/{file_path}"
-                existing_doc.lesson_number = sequence
-                db.commit()
-                db.refresh(existing_doc)
-                document = existing_doc
-            else:
-                document = CourseDocument(
-                    course_id=course.id,
-                    doc_type="lesson",
-                    title=title,
-                    content=json.dumps(lesson_plan_data, ensure_ascii=False),
-                    file_url=f"/uploads/{file_path}",
-                    lesson_number=sequence,
+            file_path = await run_blocking(render_lesson_plan_docx, lesson_plan_data, course_id)
+
+            # 保存到数据库（同课次存在则覆盖），使用短时会话，保存完即归还连接
+            prefetch_sequence: Optional[int] = None
+            async with AsyncSessionLocal() as session:
+                document = await _save_lesson_plan_document(
+                    session,
+                    course_id,
+                    sequence,
+                    system_fields["week"],
+                    lesson_plan_data,
+                    file_path,
                 )
 
-                db.add(document)
-                db.commit()
-                db.refresh(document)
+                if prefetch_next:
+                    try:
+                        prefetch_sequence = await _schedule_next_lesson_prefetch(
+                            session,
+                            user_id=user_id,
+                            course_id=course_id,
+                            sequence=sequence,
+                            plan_params=plan_params,
+                            plan_text=plan_text,
+                            api_key=api_key,
+                            base_url=base_url,
+                            model=model,
+                        )
+                    except Exception as exc:
+                        # 预生成只是优化，失败不影响本次结果
+                        logger.warning("预生成下一次课教案失败: %s", exc)
             
             # 完成
             yield sse_event(
@@ -319,6 +652,7 @@ async def generate_lesson_plan_stream(
                     "message": "教案生成完成！",
                     "document_id": document.id,
                     "data": lesson_plan_data,
+                    "prefetch_sequence": prefetch_sequence,
                 }
             )
             
@@ -330,8 +664,176 @@ async def generate_lesson_plan_stream(
     return sse_response(event_generator())
 
 
+@router.api_route("/{course_id}/generate-lesson-plans/stream", methods=["GET", "POST"])
+async def generate_all_lesson_plans_stream(
+    concurrency: Optional[int] = Query(None, description="同时生成的教案数量"),
+    skip_existing: bool = Query(False, description="跳过已有教案的课次"),
+    use_cache: bool = Query(True, description="是否使用生成缓存（重新生成时传 false）"),
+    course: Course = Depends(get_course_for_user_async),
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    批量生成课程全部教案（带进度推送）
+
+    按授课计划中的每个课次并发生成教案，通过一个 SSE 连接推送每个课次的
+    状态（lesson_status: running/completed/failed）与整体进度。
+    """
+    _check_lesson_plan_prerequisites(course, user)
+
+    plan_doc = await _get_latest_plan_doc(db, course.id)
+    if not plan_doc:
+        raise HTTPException(status_code=400, detail="请先创建授课计划")
+    # 结束只读事务归还连接（提交后对象不过期），生成器中需要时再取连接
+    await db.commit()
+
+    limit = concurrency or LESSON_PLAN_BATCH_CONCURRENCY
+    limit = max(1, min(limit, LESSON_PLAN_BATCH_MAX_CONCURRENCY))
+
+    plan_text = plan_doc.content or ""
+    api_key = user.ai_api_key
+    base_url = user.ai_base_url
+    model = user.ai_model_name or "gpt-4"
+    course_id = course.id
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        tasks: List[asyncio.Task] = []
+        try:
+            yield sse_event(
+                {
+                    "stage": "parsing",
+                    "progress": 5,
+                    "message": "正在解析授课计划参数...",
+                }
+            )
+            plan_params = await _resolve_plan_params(db, plan_doc)
+            schedule = plan_params.get("schedule") or []
+            sequences = sorted(
+                {item.get("order") for item in schedule if isinstance(item.get("order"), int)}
+            )
+            if skip_existing:
+                existing = await _existing_lesson_numbers(db, course_id)
+                sequences = [seq for seq in sequences if seq not in existing]
+            if not sequences:
+                yield sse_event(
+                    {
+                        "stage": "completed",
+                        "progress": 100,
+                        "message": "没有需要生成的课次",
+                        "total": 0,
+                        "succeeded": [],
+                        "failed": [],
+                    }
+                )
+                return
+
+            yield sse_event(
+                {
+                    "stage": "retrieving",
+                    "progress": 8,
+                    "message": "正在检索课程信息...",
+                }
+            )
+            course_context = await _load_course_context(db, course_id)
+
+            # 关闭请求会话归还连接，批量生成期间只在保存每份教案时短暂占用连接
+            await db.close()
+
+            total = len(sequences)
+            queue: asyncio.Queue = asyncio.Queue()
+            semaphore = asyncio.Semaphore(limit)
+
+            async def generate_one(seq: int) -> None:
+                async with semaphore:
+                    await queue.put(("running", seq, None))
+                    try:
+                        system_fields, plan_item_payload = _build_lesson_inputs(plan_params, seq)
+                        data = await _generate_lesson_plan_data(
+                            sequence=seq,
+                            system_fields=system_fields,
+                            plan_item_payload=plan_item_payload,
+                            plan_text=plan_text,
+                            context_prompt=_build_lesson_context_prompt(
+                                course_context, system_fields
+                            ),
+                            api_key=api_key,
+                            base_url=base_url,
+                            model=model,
+                            use_cache=use_cache,
+                        )
+                        file_path = await run_blocking(render_lesson_plan_docx, data, course_id)
+                        await queue.put(("generated", seq, (system_fields["week"], data, file_path)))
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as exc:
+                        await queue.put(("failed", seq, str(exc)))
+
+            tasks = [asyncio.create_task(generate_one(seq)) for seq in sequences]
+
+            yield sse_event(
+                {
+                    "stage": "generating",
+                    "progress": 10,
+                    "message": f"开始生成 {total} 份教案（并发 {limit}）...",
+                    "total": total,
+                }
+            )
+
+            finished = 0
+            succeeded: List[Dict[str, int]] = []
+            failed: List[Dict[str, Any]] = []
+            while finished < total:
+                status, seq, payload = await queue.get()
+                event: Dict[str, Any] = {"stage": "generating", "sequence": seq, "total": total}
+                if status == "running":
+                    event["lesson_status"] = "running"
+                    event["message"] = f"正在生成第 {seq} 次课教案..."
+                elif status == "generated":
+                    week, data, file_path = payload
+                    # 数据库写入统一在此处串行完成，每份教案使用一个短时会话
+                    async with AsyncSessionLocal() as session:
+                        document = await _save_lesson_plan_document(
+                            session, course_id, seq, week, data, file_path
+                        )
+                    finished += 1
+                    succeeded.append({"sequence": seq, "document_id": document.id})
+                    event["lesson_status"] = "completed"
+                    event["document_id"] = document.id
+                    event["message"] = f"第 {seq} 次课教案生成完成（{finished}/{total}）"
+                else:
+                    finished += 1
+                    failed.append({"sequence": seq, "error": payload})
+                    event["lesson_status"] = "failed"
+                    event["error"] = payload
+                    event["message"] = f"第 {seq} 次课教案生成失败：{payload}"
+                event["completed"] = finished
+                event["progress"] = 10 + int(88 * finished / total)
+                yield sse_event(event)
+
+            yield sse_event(
+                {
+                    "stage": "completed",
+                    "progress": 100,
+                    "message": f"批量生成完成：成功 {len(succeeded)} 份，失败 {len(failed)} 份",
+                    "total": total,
+                    "succeeded": succeeded,
+                    "failed": failed,
+                }
+            )
+        except Exception as e:
+            yield sse_event(
+                {"stage": "error", "progress": 0, "message": f"生成失败：{str(e)}"}
+            )
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    return sse_response(event_generator())
+
+
 @router.get("/{course_id}/lesson-plans")
-async def get_lesson_plans(
+def get_lesson_plans(
     course: Course = Depends(get_course_for_user),
     db: Session = Depends(get_db),
 ):
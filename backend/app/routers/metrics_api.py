@@ -0,0 +1,70 @@
+"""
+运行指标 API
+"""
+from fastapi import APIRouter, Depends
+
+from ..ai_cache import get_cache_stats
+from ..ai_client import get_client_registry_stats
+from ..ai_limiter import get_limiter_stats
+from ..ai_metrics import get_ai_metrics
+from ..ai_retry import get_retry_stats
+from ..ai_structured import get_structured_stats
+from ..chat_context import get_chat_context_stats
+from ..database import get_db_pool_stats
+from ..deps import get_current_user
+from ..knowledge_service import get_context_packing_stats
+from ..lesson_plan_prefetch import get_prefetch_stats
+from ..loop_monitor import get_loop_monitor_stats
+from ..models import User
+from ..offload import get_offload_stats
+from ..utils.json_repair import get_json_repair_stats
+from ..utils.stream_coalesce import get_coalesce_stats
+from ..worker import get_worker_stats
+
+
+router = APIRouter(prefix="/api/metrics", tags=["运行指标"])
+
+
+@router.get("/ai")
+async def get_ai_call_metrics(user: User = Depends(get_current_user)):
+    """
+    AI 调用指标
+
+    按调用场景 / 模型汇总耗时、首字延迟、token 用量与结果分布，
+    并附带生成缓存、限流器、重试、上下文裁剪、教案预生成、对话上下文与 JSON 解析路径的统计。
+    只返回汇总数据，不包含各用户配置的服务商地址。
+    """
+    return {
+        "calls": get_ai_metrics(),
+        "cache": get_cache_stats(),
+        "limiter": get_limiter_stats(),
+        "retry": get_retry_stats(),
+        "context_packing": get_context_packing_stats(),
+        "clients": get_client_registry_stats(),
+        "lesson_plan_prefetch": get_prefetch_stats(),
+        "chat_context": get_chat_context_stats(),
+        "stream_coalesce": get_coalesce_stats(),
+        "json_output": {
+            **get_structured_stats(),
+            "parse_paths": get_json_repair_stats(),
+        },
+    }
+
+
+@router.get("/jobs")
+def get_job_metrics(user: User = Depends(get_current_user)):
+    """生成任务队列指标：排队/执行中的任务数与本进程内置 worker 的统计"""
+    return get_worker_stats()
+
+
+@router.get("/runtime")
+async def get_runtime_metrics(user: User = Depends(get_current_user)):
+    """
+    运行时指标：阻塞操作线程池、数据库连接池与事件循环阻塞检测
+    （最近的阻塞事件及当时进行中的请求）
+    """
+    return {
+        "offload": get_offload_stats(),
+        "database": get_db_pool_stats(),
+        "event_loop": get_loop_monitor_stats(),
+    }
@@ -4,13 +4,17 @@
 import asyncio
 import json
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from ..database import get_db
-from ..deps import get_course_for_user, get_current_user
+from ..database import AsyncSessionLocal, get_async_db, get_db
+from ..deps import get_course_for_user, get_course_for_user_async, get_current_user_async
 from ..docx_service import render_docx_template
+from ..lesson_plan_prefetch import lesson_plan_prefetcher
 from ..models import Course, CourseDocument, User
+from ..offload import run_blocking
 from ..teaching_plan_service import generate_teaching_plan_schedule
 from ..utils.documents import attach_file_exists, resolve_document_file_path
 from ..utils.plan_params import build_plan_params_from_schedule
@@ -20,10 +24,58 @@ from ..utils.sse import sse_event, sse_response
 router = APIRouter(prefix="/api/courses", tags=["授课计划生成"])
 
 
+def _remove_document_file(document: CourseDocument) -> None:
+    old_file_path = resolve_document_file_path(document)
+    if old_file_path and old_file_path.exists():
+        old_file_path.unlink()
+
+
+async def _save_teaching_plan_document(
+    db: AsyncSession,
+    course_id: int,
+    title: str,
+    content: str,
+    plan_params_json: str,
+    file_path: str,
+) -> CourseDocument:
+    """保存授课计划（已有则覆盖并删除旧文件）"""
+    existing_doc = await db.scalar(
+        select(CourseDocument)
+        .where(CourseDocument.course_id == course_id, CourseDocument.doc_type == "plan")
+        .limit(1)
+    )
+
+    if existing_doc:
+        await run_blocking(_remove_document_file, existing_doc)
+
+        # 更新记录
+        existing_doc.title = title
+        existing_doc.content = content
+        existing_doc.plan_params = plan_params_json
+        existing_doc.file_url = f"/uploads/{file_path}"
+        await db.commit()
+        await db.refresh(existing_doc)
+        return existing_doc
+
+    # 创建新记录
+    document = CourseDocument(
+        course_id=course_id,
+        doc_type="plan",
+        title=title,
+        content=content,
+        plan_params=plan_params_json,
+        file_url=f"/uploads/{file_path}",
+    )
+    db.add(document)
+    await db.commit()
+    await db.refresh(document)
+    return document
+
+
 @router.get("/{course_id}/generate-teaching-plan/stream")
 async def generate_teaching_plan_stream(
-    course: Course = Depends(get_course_for_user),
-    user: User = Depends(get_current_user),
+    course: Course = Depends(get_course_for_user_async),
+    user: User = Depends(get_current_user_async),
     teacher_name: str = Query(..., description="授课教师"),
     total_weeks: int = Query(18, description="总周数"),
     hour_per_class: int = Query(4, description="单次学时"),
@@ -31,8 +83,9 @@ async def generate_teaching_plan_stream(
     final_review: bool = Query(True, description="最后一次课为复习考核"),
     first_week_classes: int = Query(1, description="第一周上课次数"),
     skip_slots: Optional[str] = Query(None, description="不上课的周次与课次 JSON 数组"),
+    use_cache: bool = Query(True, description="是否使用生成缓存（重新生成时传 false）"),
     token: str = Query(None, description="认证 Token（用于 SSE）"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     生成授课计划（带进度推送）
@@ -46,6 +99,19 @@ async def generate_teaching_plan_stream(
     # 检查 AI 配置
     if not user.ai_api_key or not user.ai_base_url:
         raise HTTPException(status_code=400, detail="请先配置 AI API")
+
+    # 先取出生成所需的字段，再关闭请求会话归还连接，AI 生成期间不占用连接池
+    course_id = course.id
+    course_name = course.name
+    course_catalog = course.course_catalog
+    semester = course.semester
+    class_name = course.class_name
+    total_hours = course.total_hours
+    practice_hours = course.practice_hours
+    api_key = user.ai_api_key
+    base_url = user.ai_base_url
+    model = user.ai_model_name or "gpt-4"
+    await db.close()
     
     async def event_generator():
         try:
@@ -59,7 +125,7 @@ async def generate_teaching_plan_stream(
             )
             
             # 检查课程目录
-            if not course.course_catalog:
+            if not course_catalog:
                 yield sse_event(
                     {
                         "stage": "error",
@@ -81,7 +147,7 @@ async def generate_teaching_plan_stream(
             )
             
             # 计算学时
-            theory_hours = course.total_hours - course.practice_hours
+            theory_hours = total_hours - practice_hours
             
             skip_slots_payload = []
             if skip_slots:
@@ -102,20 +168,21 @@ async def generate_teaching_plan_stream(
                     return
 
             schedule = await generate_teaching_plan_schedule(
-                course_catalog=course.course_catalog,
-                course_name=course.name,
-                total_hours=course.total_hours,
+                course_catalog=course_catalog,
+                course_name=course_name,
+                total_hours=total_hours,
                 theory_hours=theory_hours,
-                practice_hours=course.practice_hours,
+                practice_hours=practice_hours,
                 hour_per_class=hour_per_class,
                 total_weeks=total_weeks,
                 classes_per_week=classes_per_week,
                 final_review=final_review,
-                api_key=user.ai_api_key,
-                base_url=user.ai_base_url,
-                model=user.ai_model_name or "gpt-4",
+                api_key=api_key,
+                base_url=base_url,
+                model=model,
                 first_week_classes=first_week_classes,
-                skip_slots=skip_slots_payload
+                skip_slots=skip_slots_payload,
+                use_cache=use_cache,
             )
             
             yield sse_event(
@@ -137,21 +204,22 @@ async def generate_teaching_plan_stream(
             
             # 组装模板数据
             template_data = {
-                "academic_year": course.semester,  # 学年
-                "course_name": course.name,
-                "target_classes": course.class_name,
+                "academic_year": semester,  # 学年
+                "course_name": course_name,
+                "target_classes": class_name,
                 "teacher_name": teacher_name,
-                "total_hours": course.total_hours,
+                "total_hours": total_hours,
                 "theory_hours": theory_hours,
-                "practice_hours": course.practice_hours,
+                "practice_hours": practice_hours,
                 "schedule": schedule,
             }
             
             # 渲染 Word 文档
-            file_path = render_docx_template(
+            file_path = await run_blocking(
+                render_docx_template,
                 template_name="授课计划模板.docx",
                 data=template_data,
-                course_id=course.id
+                course_id=course_id,
             )
             
             # 阶段 4: 保存到数据库
@@ -164,45 +232,25 @@ async def generate_teaching_plan_stream(
             )
             
             # 检查是否已有授课计划，如有则覆盖
-            existing_doc = db.query(CourseDocument).filter(
-                CourseDocument.course_id == course.id,
-                CourseDocument.doc_type == "plan"
-            ).first()
-            
-            plan_title = f"《{course.name}》授课计划"
+            plan_title = f"《{course_name}》授课计划"
             plan_params = build_plan_params_from_schedule(
                 schedule,
                 hour_per_class=hour_per_class,
             )
-            plan_params_json = json.dumps(plan_params, ensure_ascii=False)
-
-            if existing_doc:
-                old_file_path = resolve_document_file_path(existing_doc)
-                if old_file_path and old_file_path.exists():
-                    old_file_path.unlink()
-                
-                # 更新记录
-                existing_doc.title = plan_title
-                existing_doc.content = json.dumps(template_data, ensure_ascii=False)
-                existing_doc.plan_params = plan_params_json
-                existing_doc.file_url = f"/uploads/{file_path}"
-                db.commit()
-                db.refresh(existing_doc)
-                document = existing_doc
-            else:
-                # 创建新记录
-                document = CourseDocument(
-                    course_id=course.id,
-                    doc_type="plan",
-                    title=plan_title,
-                    content=json.dumps(template_data, ensure_ascii=False),
-                    plan_params=plan_params_json,
-                    file_url=f"/uploads/{file_path}",
+            # 使用短时会话保存，保存完即归还连接
+            async with AsyncSessionLocal() as session:
+                document = await _save_teaching_plan_document(
+                    session,
+                    course_id,
+                    plan_title,
+                    json.dumps(template_data, ensure_ascii=False),
+                    json.dumps(plan_params, ensure_ascii=False),
+                    file_path,
                 )
-                db.add(document)
-                db.commit()
-                db.refresh(document)
             
+            # 授课计划已变化，之前预生成的教案草稿作废
+            lesson_plan_prefetcher.cancel_course(course_id)
+
             # 完成
             yield sse_event(
                 {
@@ -227,7 +275,7 @@ async def generate_teaching_plan_stream(
 
 
 @router.get("/{course_id}/teaching-plans")
-async def get_teaching_plans(
+def get_teaching_plans(
     course: Course = Depends(get_course_for_user),
     db: Session = Depends(get_db),
 ):
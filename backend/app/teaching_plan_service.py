@@ -1,9 +1,19 @@
 """
 授课计划生成服务 - 系统排课 + AI 生成内容
 """
+import asyncio
 import json
+import logging
+import math
+import re
 from typing import Dict, Any, List, Optional
-import openai
+
+from .ai_client import complete_chat, get_async_client
+from .config import TEACHING_PLAN_CHUNK_SIZE, TEACHING_PLAN_CHUNK_THRESHOLD
+from .utils.allocation import largest_remainder
+from .utils.json_repair import parse_json_lenient
+
+logger = logging.getLogger(__name__)
 
 
 def _get_week_class_limit(week: int, first_week_classes: int, classes_per_week: int) -> int:
@@ -91,6 +101,327 @@ def count_available_slots(
     return available_slots
 
 
+TEACHING_PLAN_SECTION_PATTERN = re.compile(
+    r"^\s*(?:#+\s*)?(?:"
+    r"(?:实训|实践)?项目\s*[0-9一二三四五六七八九十百]+"
+    r"|模块\s*[0-9一二三四五六七八九十百]+"
+    r"|单元\s*[0-9一二三四五六七八九十百]+"
+    r"|第\s*[0-9一二三四五六七八九十百]+\s*[章篇部分单元]"
+    r")"
+)
+
+
+def split_catalog_sections(course_catalog: str) -> List[Dict[str, str]]:
+    """
+    按项目 / 模块 / 单元 / 章标题拆分课程目录
+
+    标题之前的说明文字并入第一节。
+
+    Returns:
+        [{"heading": "项目一：...", "text": "该节完整文本"}, ...]，识别不到标题时为单节
+    """
+    sections: List[Dict[str, str]] = []
+    preamble: List[str] = []
+    for line in (course_catalog or "").splitlines():
+        if TEACHING_PLAN_SECTION_PATTERN.match(line):
+            sections.append({"heading": line.strip().lstrip("#").strip(), "lines": [line]})
+        elif sections:
+            sections[-1]["lines"].append(line)
+        else:
+            preamble.append(line)
+
+    if not sections:
+        return [{"heading": "", "text": (course_catalog or "").strip()}]
+    if preamble:
+        sections[0]["lines"] = preamble + sections[0]["lines"]
+    return [
+        {"heading": section["heading"], "text": "\n".join(section["lines"]).strip()}
+        for section in sections
+    ]
+
+
+def _group_sections(sections: List[Dict[str, str]], chunk_count: int) -> List[List[Dict[str, str]]]:
+    """把连续的目录小节按文本长度均衡地合并为 chunk_count 组"""
+    weights = [max(len(section["text"]), 1) for section in sections]
+    target = sum(weights) / chunk_count
+    groups: List[List[Dict[str, str]]] = []
+    current: List[Dict[str, str]] = []
+    current_weight = 0
+    for index, (section, weight) in enumerate(zip(sections, weights)):
+        current.append(section)
+        current_weight += weight
+        remaining_sections = len(sections) - index - 1
+        remaining_groups = chunk_count - len(groups) - 1
+        if remaining_groups <= 0:
+            continue
+        # 加入下一节会越过目标的一半以上时在此断开
+        next_weight = weights[index + 1] if remaining_sections else 0
+        if current_weight + next_weight / 2 >= target or remaining_sections <= remaining_groups:
+            groups.append(current)
+            current, current_weight = [], 0
+    if current:
+        groups.append(current)
+    return groups
+
+
+# 授课计划的固定角色、规则与输出格式作为系统提示词，所有请求字节一致，
+# 课程信息、课表框架与目录等变量只出现在用户消息中，便于服务商命中提示词缓存。
+TEACHING_PLAN_SYSTEM_PROMPT = """# Role
+你是广东碧桂园职业学院的资深教学管理人员，负责填充教学计划内容。
+
+# Task
+根据用户消息中已定的周次安排（Schedule Frame）和课程目录，填充教学内容。
+
+# Rules
+1. **严格遵守已定课表**：你必须严格按照 Input Data 中的 `week` 和 `order` 填充内容。不要修改周次。
+2. **学时分配**：
+   - 确保理论课、实训课的次数与 Input Data 中给出的次数大致一致。
+   - **标题格式重要规则**：
+     - 正确示例：`项目一：计算机基础` 或 `实训项目一：Word应用`
+     - 错误示例：`[理论] 项目一：...` 或 `项目一：... [实训]`
+     - **必须保留** `项目X：` 或 `实训项目X：` 前缀，以区分理论与实训。
+     - **必须移除** 任何中括号标签（如 `[理论]`、`[实训]`）。
+3. **内容生成**：
+   - 根据 order 顺序和课程目录进度安排教学。
+   - **Task 格式**：必须使用 "1. ", "2. ", "3. " 序号列表（不用 "任务1" 或 "1-1"）。
+   - 每个项目内序号从 1 开始。
+   - 多个任务点用 \n 分隔。
+   - `hour` 填写 Input Data 中的单次学时。
+4. **禁止事项**：
+   - ❌ 绝对不要生成 Input Data 中标注的"复习考核"课次内容！这部分由系统单独处理。
+   - 用户消息包含"分段说明"时，只生成该段的课次，输出数组长度必须与本段课表框架一致。
+
+# Output Format
+JSON 数组，结构如下：
+[
+  {
+    "week": 1,
+    "order": 1,
+    "title": "项目1：计算机基础（无需标签）",
+    "tasks": "1. 计算机组成原理\n2. 操作系统安装",
+    "hour": 4
+  },
+  ...
+]
+"""
+
+
+def _build_schedule_prompt(
+    course_name: str,
+    theory_hours: int,
+    practice_hours: int,
+    theory_classes_count: int,
+    practice_classes_count: int,
+    content_frame: List[Dict[str, int]],
+    course_catalog: str,
+    actual_classes: int,
+    hour_per_class: int,
+    final_review: bool,
+    chunk_note: str = "",
+) -> str:
+    # 只有最后一次课作为复习考核由系统追加时才提示模型跳过该课次
+    review_line = f"- 复习考核：第 {actual_classes} 次课由系统单独生成，不要输出\n" if final_review else ""
+    return f"""# Input Data
+- 课程名称：{course_name}
+- 理论学时：{theory_hours}（约 {theory_classes_count} 次课）
+- 实训学时：{practice_hours}（约 {practice_classes_count} 次课）
+- 单次学时：{hour_per_class}
+{review_line}- **已定课表框架**：{json.dumps(content_frame, ensure_ascii=False)}
+
+# 课程目录
+{course_catalog}
+{chunk_note}"""
+
+
+def _parse_schedule_json(content: str, frame: List[Dict[str, int]]) -> List[Dict[str, Any]]:
+    # 提取并修复 JSON 数组（无法解析时抛出 JSONRepairError，即 ValueError）；
+    # 输出被截断时只有课次数量与字段齐全才接受补全括号后的结果
+    def _is_complete(items: List[Any]) -> bool:
+        return len(items) == len(frame) and all(
+            isinstance(item, dict) and item.get("title") and item.get("tasks") for item in items
+        )
+
+    return parse_json_lenient(content, list, _is_complete)[0]
+
+
+def _align_chunk_to_frame(
+    items: Any,
+    frame: List[Dict[str, int]],
+    hour_per_class: int,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    按课表框架校正分段结果
+
+    课次数量与框架不一致时返回 None；数量一致时以框架的 week/order 为准。
+    """
+    if not isinstance(items, list) or len(items) != len(frame):
+        return None
+    aligned: List[Dict[str, Any]] = []
+    for item, slot in zip(items, frame):
+        if not isinstance(item, dict):
+            return None
+        if item.get("week") != slot["week"] or item.get("order") != slot["order"]:
+            logger.info(
+                "授课计划分段结果周次已按框架校正: order=%s week=%s -> order=%s week=%s",
+                item.get("order"),
+                item.get("week"),
+                slot["order"],
+                slot["week"],
+            )
+        aligned.append(
+            {
+                **item,
+                "week": slot["week"],
+                "order": slot["order"],
+                "hour": item.get("hour") or hour_per_class,
+            }
+        )
+    return aligned
+
+
+async def _generate_frame_schedule(
+    client: Any,
+    *,
+    frame: List[Dict[str, int]],
+    prompt: str,
+    hour_per_class: int,
+    model: str,
+    use_cache: bool,
+    label: str = "授课计划",
+) -> List[Dict[str, Any]]:
+    """
+    生成课表框架对应的授课计划内容并按框架校验
+
+    课次数量与框架不一致（含输出被截断）时跳过缓存重新生成一次，仍不一致时抛出 ValueError。
+    """
+    def _align(content: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return _align_chunk_to_frame(_parse_schedule_json(content, frame), frame, hour_per_class)
+        except ValueError:
+            return None
+
+    for attempt in range(2):
+        content = await complete_chat(
+            client,
+            model=model,
+            messages=[
+                {"role": "system", "content": TEACHING_PLAN_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            use_cache=use_cache and attempt == 0,
+            call_site="teaching_plan",
+            # 与课表框架不一致的结果不写入缓存
+            cache_validator=lambda text: _align(text) is not None,
+        )
+        aligned = _align(content)
+        if aligned is not None:
+            return aligned
+        logger.warning("%s课次数量与课表框架不符，重新生成", label)
+    raise ValueError(
+        f"{label}生成结果与课表框架不一致"
+        f"（第 {frame[0]['order']}-{frame[-1]['order']} 次课），请重试。"
+    )
+
+
+async def _generate_schedule_in_chunks(
+    client: Any,
+    *,
+    sections: List[Dict[str, str]],
+    chunk_count: int,
+    content_frame: List[Dict[str, int]],
+    course_name: str,
+    theory_hours: int,
+    practice_hours: int,
+    theory_classes_count: int,
+    actual_classes: int,
+    hour_per_class: int,
+    final_review: bool,
+    model: str,
+    use_cache: bool,
+) -> List[Dict[str, Any]]:
+    """
+    按课程目录分段并发生成授课计划内容
+
+    目录按项目拆分并合并为 chunk_count 段，课次按各段目录篇幅分配；
+    每段附带上一段末尾与下一段开头的项目标题作为衔接提示。
+    """
+    groups = _group_sections(sections, chunk_count)
+    weights = [sum(len(section["text"]) for section in group) for group in groups]
+    slot_counts = largest_remainder(len(content_frame), weights)
+    total_theory = max(0, min(theory_classes_count, len(content_frame)))
+    theory_counts = largest_remainder(total_theory, slot_counts, minimum=0)
+    outline = "\n".join(
+        f"- {section['heading']}" for section in sections if section["heading"]
+    )
+
+    chunks = []
+    start = 0
+    for index, (group, slot_count, theory_count) in enumerate(zip(groups, slot_counts, theory_counts)):
+        frame = content_frame[start:start + slot_count]
+        start += slot_count
+        theory_count = min(theory_count, len(frame))
+        practice_count = len(frame) - theory_count
+
+        hints = [
+            f"本次只生成第 {index + 1}/{len(groups)} 段：第 {frame[0]['order']}-{frame[-1]['order']} 次课，"
+            f"共 {len(frame)} 次，输出数组长度必须为 {len(frame)}。",
+            "项目编号与标题沿用课程目录原有编号，不要从“项目一”重新编号。",
+        ]
+        if index > 0:
+            hints.append(f"上一段最后一个项目为：{groups[index - 1][-1]['heading']}，本段从其后的内容开始。")
+        if index < len(groups) - 1:
+            hints.append(f"下一段从 {groups[index + 1][0]['heading']} 开始，本段不要提前安排其内容。")
+        chunk_note = (
+            "\n# 分段说明\n"
+            + "\n".join(f"- {hint}" for hint in hints)
+            + "\n\n# 完整目录概览（仅供衔接参考）\n"
+            + outline
+            + "\n"
+        )
+        prompt = _build_schedule_prompt(
+            course_name=course_name,
+            theory_hours=theory_count * hour_per_class if theory_hours else 0,
+            practice_hours=practice_count * hour_per_class if practice_hours else 0,
+            theory_classes_count=theory_count,
+            practice_classes_count=practice_count,
+            content_frame=frame,
+            course_catalog="\n\n".join(section["text"] for section in group),
+            actual_classes=actual_classes,
+            hour_per_class=hour_per_class,
+            final_review=final_review,
+            chunk_note=chunk_note,
+        )
+        chunks.append((frame, prompt))
+
+    logger.info(
+        "授课计划分段生成: %d 次课 -> %d 段 %s",
+        len(content_frame),
+        len(chunks),
+        [len(frame) for frame, _ in chunks],
+    )
+    results = await asyncio.gather(
+        *(
+            _generate_frame_schedule(
+                client,
+                frame=frame,
+                prompt=prompt,
+                hour_per_class=hour_per_class,
+                model=model,
+                use_cache=use_cache,
+                label=f"授课计划第 {index + 1} 段",
+            )
+            for index, (frame, prompt) in enumerate(chunks)
+        )
+    )
+    schedule = [item for chunk in results for item in chunk]
+
+    expected = [(slot["week"], slot["order"]) for slot in content_frame]
+    if [(item["week"], item["order"]) for item in schedule] != expected:
+        raise ValueError("授课计划分段合并结果与课表框架不一致，请重试。")
+    return schedule
+
+
 async def generate_teaching_plan_schedule(
     course_catalog: str,
     course_name: str,
@@ -106,6 +437,7 @@ async def generate_teaching_plan_schedule(
     model: str = "gpt-4",
     first_week_classes: int = 1,
     skip_slots: Optional[List[Dict[str, Any]]] = None,
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     生成授课计划表
@@ -125,6 +457,7 @@ async def generate_teaching_plan_schedule(
         model: 模型名称
         first_week_classes: 第一周上课次数
         skip_slots: 不上课的周次与次序列表
+        use_cache: 是否允许使用生成缓存
 
     Returns:
         授课计划表（列表）
@@ -183,74 +516,49 @@ async def generate_teaching_plan_schedule(
     # 截取需要生成内容的 frame
     content_frame = schedule_frame[:classes_to_gen_content]
 
-    # 构建 AI 提示词
-    prompt = f"""# Role
-你是广东碧桂园职业学院的资深教学管理人员。
-
-# Task
-根据已定的周次安排（Schedule Frame）和课程目录，填充教学内容。
-
-# Input Data
-- 课程名称：{course_name}
-- 理论学时：{theory_hours}（约 {theory_classes_count} 次课）
-- 实训学时：{practice_hours}（约 {practice_classes_count} 次课）
-- **已定课表框架**：{json.dumps(content_frame, ensure_ascii=False)}
-
-# 课程目录
-{course_catalog}
-
-# Rules
-1. **严格遵守已定课表**：你必须严格按照 Input Data 中的 `week` 和 `order` 填充内容。不要修改周次。
-2. **学时分配**：
-   - 确保理论课约 {theory_classes_count} 次，实训课约 {practice_classes_count} 次。
-   - **标题格式重要规则**：
-     - 正确示例：`项目一：计算机基础` 或 `实训项目一：Word应用`
-     - 错误示例：`[理论] 项目一：...` 或 `项目一：... [实训]`
-     - **必须保留** `项目X：` 或 `实训项目X：` 前缀，以区分理论与实训。
-     - **必须移除** 任何中括号标签（如 `[理论]`、`[实训]`）。
-3. **内容生成**：
-   - 根据 order 顺序和课程目录进度安排教学。
-   - **Task 格式**：必须使用 "1. ", "2. ", "3. " 序号列表（不用 "任务1" 或 "1-1"）。
-   - 每个项目内序号从 1 开始。
-   - 多个任务点用 \n 分隔。
-4. **禁止事项**：
-   - ❌ 绝对不要生成第 {actual_classes} 次课的"复习考核"内容！这部分由系统单独处理。
-
-# Output Format
-JSON 数组，结构如下：
-[
-  {{
-    "week": 1,
-    "order": 1,
-    "title": "项目1：计算机基础（无需标签）",
-    "tasks": "1. 计算机组成原理\n2. 操作系统安装",
-    "hour": {hour_per_class}
-  }},
-  ...
-]
-"""
-
-    client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
-
-    response = await client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": "你负责填充教学计划内容。"},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.7
-    )
-
-    content = response.choices[0].message.content.strip()
-
-    # 提取 JSON
-    if content.startswith("```"):
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
-        content = content.strip()
-
-    schedule = json.loads(content)
+    client = get_async_client(api_key, base_url)
+
+    sections = split_catalog_sections(course_catalog)
+    chunk_count = min(len(sections), math.ceil(len(content_frame) / TEACHING_PLAN_CHUNK_SIZE))
+    if len(content_frame) >= TEACHING_PLAN_CHUNK_THRESHOLD and chunk_count >= 2:
+        schedule = await _generate_schedule_in_chunks(
+            client,
+            sections=sections,
+            chunk_count=chunk_count,
+            content_frame=content_frame,
+            course_name=course_name,
+            theory_hours=theory_hours,
+            practice_hours=practice_hours,
+            theory_classes_count=theory_classes_count,
+            actual_classes=actual_classes,
+            hour_per_class=hour_per_class,
+            final_review=final_review,
+            model=model,
+            use_cache=use_cache,
+        )
+    elif content_frame:
+        prompt = _build_schedule_prompt(
+            course_name=course_name,
+            theory_hours=theory_hours,
+            practice_hours=practice_hours,
+            theory_classes_count=theory_classes_count,
+            practice_classes_count=practice_classes_count,
+            content_frame=content_frame,
+            course_catalog=course_catalog,
+            actual_classes=actual_classes,
+            hour_per_class=hour_per_class,
+            final_review=final_review,
+        )
+        schedule = await _generate_frame_schedule(
+            client,
+            frame=content_frame,
+            prompt=prompt,
+            hour_per_class=hour_per_class,
+            model=model,
+            use_cache=use_cache,
+        )
+    else:
+        schedule = []
 
     # 如果需要，添加最后一次课（复习考核）
     if final_review:
@@ -0,0 +1,37 @@
+"""
+整数分配工具
+"""
+from __future__ import annotations
+
+from typing import List
+
+
+def largest_remainder(total: int, weights: List[float], minimum: int = 1) -> List[int]:
+    """按权重把 total 拆分为整数，每项不少于 minimum，且总和严格等于 total"""
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        weights = [1.0] * len(weights)
+        weight_sum = float(len(weights))
+    ideal = [total * weight / weight_sum for weight in weights]
+    result = [max(minimum, int(value)) for value in ideal]
+    diff = total - sum(result)
+    # 余数大的优先加 1，余数小的优先减 1
+    by_remainder = sorted(range(len(ideal)), key=lambda idx: ideal[idx] - int(ideal[idx]), reverse=True)
+    while diff > 0:
+        for idx in by_remainder:
+            if diff == 0:
+                break
+            result[idx] += 1
+            diff -= 1
+    while diff < 0:
+        changed = False
+        for idx in reversed(by_remainder):
+            if diff == 0:
+                break
+            if result[idx] > minimum:
+                result[idx] -= 1
+                diff += 1
+                changed = True
+        if not changed:
+            break
+    return result
@@ -0,0 +1,273 @@
+"""
+宽松 JSON 解析工具 - 从模型输出中提取并修复 JSON
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)(?:```|$)", re.DOTALL)
+_DANGLING_KEY_PATTERN = re.compile(r'([{,])\s*"(?:[^"\\]|\\.)*"\s*$')
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+_repair_stats: Dict[str, int] = {
+    "direct": 0,
+    "code_block": 0,
+    "extracted": 0,
+    "repaired": 0,
+    "unescaped": 0,
+    "unwrapped": 0,
+    "truncated": 0,
+    "truncated_rejected": 0,
+    "failed": 0,
+}
+
+# 修复时的截断状态：只补全了末尾括号 / 截断在值中间（字符串、键或冒号处）
+_TRUNCATED_CLOSED = "closed"
+_TRUNCATED_CUT = "cut"
+
+
+class JSONRepairError(ValueError):
+    """模型输出无法解析或修复为期望的 JSON"""
+
+
+def strip_code_fence(text: str) -> str:
+    """去掉 Markdown 代码块标记（只取第一个代码块）"""
+    text = text.strip()
+    if "```" not in text:
+        return text
+    match = _FENCE_PATTERN.search(text)
+    return match.group(1).strip() if match else text
+
+
+def _match_closer(text: str, start: int) -> int:
+    """返回 start 处括号对应的闭合括号之后的位置，未闭合（输出被截断）时返回 -1"""
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    for index in range(start, len(text)):
+        ch = text[index]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        elif stack and ch == stack[-1]:
+            stack.pop()
+            if not stack:
+                return index + 1
+    return -1
+
+
+def extract_balanced(text: str, openers: str = "{[") -> Optional[str]:
+    """
+    提取第一个以 openers 中括号开头的顶层 JSON 对象或数组
+
+    只在顶层查找：以其他括号开头的值整体跳过，不会返回其内部嵌套的对象或数组
+    （如期望数组时不会从对象回复中取出某个字段的数组）。
+    未找到闭合括号（输出被截断）时返回从起始括号到结尾的内容。
+    """
+    index = 0
+    while True:
+        start = next((i for i in range(index, len(text)) if text[i] in _CLOSERS), -1)
+        if start < 0:
+            return None
+        end = _match_closer(text, start)
+        if text[start] in openers:
+            return text[start:end] if end >= 0 else text[start:]
+        if end < 0:
+            return None
+        index = end
+
+
+def _next_significant(text: str, index: int) -> str:
+    while index < len(text) and text[index].isspace():
+        index += 1
+    return text[index] if index < len(text) else ""
+
+
+def repair_json_text(text: str) -> str:
+    """
+    修复常见的 JSON 格式问题
+
+    - 字符串内未转义的双引号、换行与制表符
+    - 对象/数组末尾多余的逗号
+    - 截断导致的未闭合字符串、悬空的键与未闭合括号
+    """
+    return _repair(text)[0]
+
+
+def _repair(text: str) -> Tuple[str, Optional[str]]:
+    """修复 JSON 文本，同时返回截断状态（None 表示没有截断）"""
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    for index, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+                out.append(ch)
+            elif ch == "\\":
+                escape = True
+                out.append(ch)
+            elif ch == '"':
+                # 后面紧跟结构字符才视为字符串结束，否则是内容中的引号
+                if _next_significant(text, index + 1) in {",", ":", "}", "]", ""}:
+                    in_string = False
+                    out.append(ch)
+                else:
+                    out.append('\\"')
+            elif ch == "\n":
+                out.append("\\n")
+            elif ch == "\r":
+                out.append("\\r")
+            elif ch == "\t":
+                out.append("\\t")
+            else:
+                out.append(ch)
+            continue
+        if ch == '"':
+            in_string = True
+            out.append(ch)
+        elif ch == ",":
+            if _next_significant(text, index + 1) not in {"}", "]", ""}:
+                out.append(ch)
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+            out.append(ch)
+        elif ch in "}]":
+            if stack and stack[-1] == ch:
+                stack.pop()
+                out.append(ch)
+        else:
+            out.append(ch)
+
+    truncated: Optional[str] = None
+    if escape:
+        out.pop()
+    if in_string:
+        out.append('"')
+        truncated = _TRUNCATED_CUT
+    repaired = "".join(out).rstrip()
+    if stack:
+        truncated = truncated or _TRUNCATED_CLOSED
+        repaired = repaired.rstrip(",").rstrip()
+        if repaired.endswith(":"):
+            repaired += " null"
+            truncated = _TRUNCATED_CUT
+        elif stack[-1] == "}":
+            # 对象内被截断在键名处：去掉没有值的键
+            trimmed = _DANGLING_KEY_PATTERN.sub(
+                lambda match: "{" if match.group(1) == "{" else "", repaired
+            ).rstrip()
+            if trimmed != repaired:
+                truncated = _TRUNCATED_CUT
+            repaired = trimmed
+        repaired += "".join(reversed(stack))
+    return repaired, truncated
+
+
+def _loads(text: Optional[str]) -> Tuple[bool, Any]:
+    if not text:
+        return False, None
+    try:
+        return True, json.loads(text)
+    except ValueError:
+        return False, None
+
+
+def _coerce(value: Any, expect: Optional[type]) -> Tuple[bool, Any, Optional[str]]:
+    """
+    按期望类型校正：双重编码的字符串再解析一次，期望数组时展开只有一个数组字段的
+    包装对象（如 {"schedule": [...]}）；对象还有其他字段时不展开，避免丢弃内容
+    """
+    if isinstance(value, str) and value.strip()[:1] in {"{", "["}:
+        ok, inner = _loads(value.strip())
+        if ok:
+            ok, inner, _ = _coerce(inner, expect)
+            return ok, inner, "unescaped"
+    if expect is None or isinstance(value, expect):
+        return True, value, None
+    if expect is list and isinstance(value, dict) and len(value) == 1:
+        (inner,) = value.values()
+        if isinstance(inner, list):
+            return True, inner, "unwrapped"
+    return False, value, None
+
+
+def parse_json_lenient(
+    content: str,
+    expect: Optional[type] = None,
+    is_complete: Optional[Callable[[Any], bool]] = None,
+) -> Tuple[Any, str]:
+    """
+    解析模型输出的 JSON，按需提取与修复
+
+    依次尝试：直接解析 -> 去掉代码块 -> 提取第一个完整对象/数组 -> 修复后解析。
+
+    输出被截断时修复结果不一定完整：截断在字符串、键名等值中间时一律视为失败；
+    只缺少末尾括号时，结果须通过 is_complete 校验（必需字段与数量齐全）才算成功，
+    未提供 is_complete 时同样视为失败。
+
+    Args:
+        expect: 期望的顶层类型（dict 或 list），None 表示不限
+        is_complete: 截断结果的完整性校验，参数为解析并校正类型后的结果
+
+    Returns:
+        (解析结果, 使用的路径)，路径为 direct / code_block / extracted / repaired，
+        结果经过再次解码或展开时追加 +unescaped / +unwrapped，截断后补全括号时追加 +truncated
+
+    Raises:
+        JSONRepairError: 所有路径都无法得到期望类型的完整 JSON
+    """
+    text = (content or "").strip()
+    stripped = strip_code_fence(text)
+    openers = {dict: "{", list: "["}.get(expect, "{[")
+    extracted = extract_balanced(stripped, openers)
+    if extracted is None and expect is not None:
+        # 期望数组但回复是对象时取整个对象，由 _coerce 决定能否展开
+        extracted = extract_balanced(stripped)
+    repaired, truncated = _repair(extracted) if extracted else (None, None)
+
+    candidates = [
+        ("direct", text),
+        ("code_block", stripped if stripped != text else None),
+        ("extracted", extracted if extracted not in {text, stripped} else None),
+        ("repaired", repaired),
+    ]
+    for path, candidate in candidates:
+        ok, value = _loads(candidate)
+        if not ok:
+            continue
+        ok, value, extra = _coerce(value, expect)
+        if not ok:
+            continue
+        _repair_stats[path] += 1
+        if path == "repaired" and truncated:
+            if truncated == _TRUNCATED_CUT or is_complete is None or not is_complete(value):
+                _repair_stats["truncated_rejected"] += 1
+                break
+            _repair_stats["truncated"] += 1
+            path = f"{path}+truncated"
+        if extra:
+            _repair_stats[extra] += 1
+            path = f"{path}+{extra}"
+        return value, path
+
+    _repair_stats["failed"] += 1
+    preview = text[:80].replace("\n", " ")
+    raise JSONRepairError(f"AI 返回内容无法解析为 JSON：{preview}")
+
+
+def get_json_repair_stats() -> Dict[str, int]:
+    return dict(_repair_stats)
@@ -0,0 +1,104 @@
+"""
+流式 JSON 解析工具 - 在模型输出过程中逐个提取顶层字段
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class IncrementalJSONObjectParser:
+    """
+    增量解析顶层 JSON 对象
+
+    每次 feed 一段文本，返回本次新完成的顶层 (key, value)。对象之前的
+    Markdown 代码块标记等前缀会被忽略；单个字段解析失败时跳过，不影响后续字段。
+    """
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self.fields: dict = {}
+        self.finished = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._phase = "key"
+        self._key_start = 0
+        self._value_start = 0
+        self._current_key: Optional[str] = None
+
+    def _emit(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        raw = self.buffer[self._value_start:end].strip()
+        key = self._current_key
+        self._current_key = None
+        if key is None or not raw:
+            return
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+        self.fields[key] = value
+        completed.append((key, value))
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        completed: List[Tuple[str, Any]] = []
+        if self.finished or not text:
+            return completed
+        self.buffer += text
+        buffer = self.buffer
+
+        while self._pos < len(buffer):
+            i = self._pos
+            ch = buffer[i]
+            self._pos += 1
+
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                    self._phase = "key"
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._phase == "in_key":
+                        try:
+                            self._current_key = json.loads(buffer[self._key_start:i + 1])
+                        except ValueError:
+                            self._current_key = None
+                        self._phase = "colon"
+                continue
+
+            if self._depth == 1 and self._phase == "value_start" and not ch.isspace():
+                self._value_start = i
+                self._phase = "value"
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._phase == "key":
+                    self._key_start = i
+                    self._phase = "in_key"
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    if self._phase == "value":
+                        self._emit(i, completed)
+                    self.finished = True
+                    break
+            elif self._depth == 1:
+                if ch == ":" and self._phase == "colon":
+                    self._phase = "value_start"
+                elif ch == "," and self._phase == "value":
+                    self._emit(i, completed)
+                    self._phase = "key"
+
+        return completed
@@ -14,6 +14,8 @@ TEMPLATES_DIR = BACKEND_DIR / "templates"
 COPYRIGHT_DIR = DATA_DIR / "copyright"
 COPYRIGHT_PROJECTS_DIR = COPYRIGHT_DIR / "projects"
 COPYRIGHT_ZIPS_DIR = COPYRIGHT_DIR / "zips"
+COPYRIGHT_CHECKPOINTS_DIR = COPYRIGHT_DIR / "checkpoints"
+CACHE_DIR = DATA_DIR / "cache"
 FRONTEND_DIST_DIR = PROJECT_DIR / "frontend" / "dist"
 
 
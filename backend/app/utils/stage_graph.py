@@ -0,0 +1,122 @@
+"""
+阶段依赖图执行器 - 按依赖关系并发执行异步阶段
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+StageResults = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    流水线中的一个阶段
+
+    Attributes:
+        name: 阶段标识（图内唯一）
+        run: 阶段函数，参数为已完成阶段的结果（按名称索引），返回值作为本阶段结果
+        deps: 依赖的阶段名称，全部完成后才开始执行
+        label: 展示给用户的阶段名称
+        weight: 进度权重（耗时越长权重越大）
+    """
+
+    name: str
+    run: Callable[[StageResults], Awaitable[Any]]
+    deps: Tuple[str, ...] = ()
+    label: str = ""
+    weight: float = 1.0
+
+
+class StageGraphError(ValueError):
+    """阶段图定义错误（重名、依赖不存在或存在环）"""
+
+
+def topological_order(stages: Sequence[Stage]) -> List[str]:
+    """校验阶段图并返回一个拓扑序（同层按定义顺序）"""
+    by_name: Dict[str, Stage] = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise StageGraphError(f"阶段重复定义：{stage.name}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        missing = [dep for dep in stage.deps if dep not in by_name]
+        if missing:
+            raise StageGraphError(f"阶段 {stage.name} 依赖不存在的阶段：{', '.join(missing)}")
+
+    order: List[str] = []
+    done: Set[str] = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [stage for stage in remaining if all(dep in done for dep in stage.deps)]
+        if not ready:
+            names = ", ".join(stage.name for stage in remaining)
+            raise StageGraphError(f"阶段依赖存在环：{names}")
+        for stage in ready:
+            order.append(stage.name)
+            done.add(stage.name)
+        remaining = [stage for stage in remaining if stage.name not in done]
+    return order
+
+
+async def run_stage_graph(
+    stages: Sequence[Stage],
+    *,
+    max_concurrency: Optional[int] = None,
+    on_start: Optional[Callable[[Stage], None]] = None,
+    on_finish: Optional[Callable[[Stage], None]] = None,
+) -> StageResults:
+    """
+    按依赖关系执行阶段图
+
+    依赖全部完成的阶段立即并发启动（max_concurrency 为同时执行的上限，None 不限；
+    模型调用另受服务商限流器约束）。任一阶段失败时取消其余进行中的阶段并抛出
+    该阶段的异常。on_start 在阶段取得执行名额、即将运行时调用，on_finish 在阶段
+    完成后调用，均在事件循环线程中同步调用。
+
+    Returns:
+        各阶段结果（按名称索引）
+    """
+    topological_order(stages)
+    pending: Dict[str, Stage] = {stage.name: stage for stage in stages}
+    results: StageResults = {}
+    running: Dict["asyncio.Task[Any]", Stage] = {}
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def _start(stage: Stage) -> Any:
+        if on_start is not None:
+            on_start(stage)
+        return await stage.run(results)
+
+    async def _execute(stage: Stage) -> Any:
+        # 取得执行名额后才算开始，排队等待 max_concurrency 的阶段仍为待执行
+        if semaphore is None:
+            return await _start(stage)
+        async with semaphore:
+            return await _start(stage)
+
+    def _launch_ready() -> None:
+        for name in list(pending):
+            stage = pending[name]
+            if all(dep in results for dep in stage.deps):
+                del pending[name]
+                running[asyncio.create_task(_execute(stage))] = stage
+
+    try:
+        _launch_ready()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                stage = running.pop(task)
+                results[stage.name] = task.result()
+                if on_finish is not None:
+                    on_finish(stage)
+            _launch_ready()
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    return results
@@ -0,0 +1,86 @@
+"""
+流式输出合并工具 - 把模型的细碎增量合并为较大的块再写出
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+_coalesce_stats: Dict[str, int] = {
+    "deltas_in": 0,
+    "chunks_out": 0,
+    "size_flushes": 0,
+    "time_flushes": 0,
+}
+
+
+async def coalesce_stream(
+    source: AsyncIterator[str],
+    max_bytes: int = 64,
+    max_delay: float = 0.03,
+) -> AsyncIterator[str]:
+    """
+    合并流式文本增量
+
+    缓冲区达到 max_bytes（UTF-8 字节）时立即写出；否则自缓冲首段内容起最多
+    等待 max_delay 秒，即使上游暂时没有新内容也会按时写出，首字延迟最多增加
+    max_delay。上游结束时写出剩余内容。
+    """
+    iterator = source.__aiter__()
+    buffer: List[str] = []
+    buffered_bytes = 0
+    deadline: Optional[float] = None
+    pending: Optional["asyncio.Future[str]"] = None
+    loop = asyncio.get_running_loop()
+
+    def drain() -> str:
+        nonlocal buffered_bytes, deadline
+        text = "".join(buffer)
+        buffer.clear()
+        buffered_bytes = 0
+        deadline = None
+        _coalesce_stats["chunks_out"] += 1
+        return text
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                # 上游暂时没有新内容，按时间阈值写出（等待中的读取保留到下一轮）
+                _coalesce_stats["time_flushes"] += 1
+                yield drain()
+                continue
+            future, pending = pending, None
+            try:
+                delta = future.result()
+            except StopAsyncIteration:
+                break
+            if not delta:
+                continue
+            _coalesce_stats["deltas_in"] += 1
+            buffer.append(delta)
+            buffered_bytes += len(delta.encode("utf-8"))
+            if deadline is None:
+                deadline = loop.time() + max_delay
+            if buffered_bytes >= max_bytes:
+                _coalesce_stats["size_flushes"] += 1
+                yield drain()
+        if buffer:
+            yield drain()
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, StopAsyncIteration, Exception):
+                pass
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def get_coalesce_stats() -> Dict[str, int]:
+    return dict(_coalesce_stats)
@@ -0,0 +1,333 @@
+"""
+生成任务 worker - 从任务队列领取并执行软著生成任务
+
+独立运行：
+    python -m app.worker [--concurrency N]
+
+JOB_WORKER_MODE=embedded（默认）时 Web 进程启动时也会运行一个内置 worker，
+单进程部署无需额外启动；多进程/多机部署建议设置为 external 并单独运行本模块。
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from .ai_client import close_all_clients
+from .config import (
+    JOB_BULK_MAX_RUNNING,
+    JOB_HEARTBEAT_INTERVAL,
+    JOB_POLL_INTERVAL,
+    JOB_STALE_AFTER,
+    JOB_WORKER_CONCURRENCY,
+    JOB_WORKER_MODE,
+    LOG_LEVEL,
+)
+from .copyright_service import run_copyright_generation
+from .database import SessionLocal
+from .job_queue import (
+    PRIORITY_CLASSES,
+    claim_next_job,
+    finish_job,
+    get_queue_counts,
+    heartbeat,
+    is_job_cancelled,
+    release_job,
+    requeue_stalled_jobs,
+)
+from .offload import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def _with_session(func: Callable[..., Any], *args: Any) -> Any:
+    """在独立会话中执行任务队列操作（由 run_blocking 在线程池中调用）"""
+    db = SessionLocal()
+    try:
+        return func(db, *args)
+    finally:
+        db.close()
+
+
+def _claim_job(worker_id: str, priorities: tuple) -> Optional[tuple]:
+    db = SessionLocal()
+    try:
+        job = claim_next_job(db, worker_id, priorities)
+        if job is None:
+            return None
+        return job.id, job.priority, job.project.user_id, job.project_id, job.use_cache, job.resume
+    finally:
+        db.close()
+
+
+class JobWorker:
+    """
+    任务 worker：最多同时执行 concurrency 个任务
+
+    - 空闲时每 poll_interval 秒检查一次队列（同进程入队后可调用 wake() 立即检查）
+    - 执行中的任务每 heartbeat_interval 秒写入心跳；任务已不归本 worker
+      （被取消、重新排队或由其他 worker 领取）时取消本地执行
+    - bulk 任务最多同时执行 bulk_limit 个，其余名额留给 interactive 任务
+    - 定期把心跳超过 stale_after 秒的任务重新排队
+    - 停止时取消进行中的任务并放回队列，下次以续跑方式执行
+    - 队列操作均在阻塞操作线程池中执行，内置 worker 不阻塞 Web 进程的事件循环
+    """
+
+    def __init__(
+        self,
+        concurrency: int = JOB_WORKER_CONCURRENCY,
+        *,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        heartbeat_interval: float = JOB_HEARTBEAT_INTERVAL,
+        stale_after: float = JOB_STALE_AFTER,
+        worker_id: Optional[str] = None,
+        bulk_limit: int = JOB_BULK_MAX_RUNNING,
+    ):
+        self.concurrency = max(concurrency, 1)
+        self.bulk_limit = bulk_limit if bulk_limit > 0 else max(self.concurrency - 1, 1)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.worker_id = worker_id or _default_worker_id()
+        self._running: Dict[int, "asyncio.Task[None]"] = {}
+        # 执行中任务的优先级与生成协程（取消任务时直接取消生成协程）
+        self._priorities: Dict[int, str] = {}
+        self._generations: Dict[int, "asyncio.Task[None]"] = {}
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self.stats: Dict[str, int] = {
+            "claimed": 0,
+            "finished": 0,
+            "cancelled": 0,
+            "lost": 0,
+            "released": 0,
+            "requeued_stalled": 0,
+        }
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def cancel(self, job_id: int) -> bool:
+        """取消本 worker 上正在执行的任务（数据库状态由调用方先改为 cancelled）"""
+        task = self._generations.get(job_id)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    def _claimable_priorities(self) -> tuple:
+        running_bulk = sum(1 for priority in self._priorities.values() if priority == "bulk")
+        if running_bulk >= self.bulk_limit:
+            return tuple(priority for priority in PRIORITY_CLASSES if priority != "bulk")
+        return PRIORITY_CLASSES
+
+    async def _claim(self) -> Optional[tuple]:
+        claimed = await run_blocking(_claim_job, self.worker_id, self._claimable_priorities())
+        if claimed is None:
+            return None
+        job_id, priority, *rest = claimed
+        self._priorities[job_id] = priority
+        return (job_id, *rest)
+
+    async def _requeue_stalled(self) -> None:
+        self.stats["requeued_stalled"] += await run_blocking(
+            _with_session, requeue_stalled_jobs, self.stale_after
+        )
+
+    async def _execute(
+        self, job_id: int, user_id: int, project_id: int, use_cache: bool, resume: bool
+    ) -> None:
+        task = asyncio.create_task(
+            run_copyright_generation(job_id, project_id, user_id, use_cache=use_cache, resume=resume)
+        )
+        self._generations[job_id] = task
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.heartbeat_interval)
+                if done:
+                    break
+                owned = await run_blocking(_with_session, heartbeat, job_id, self.worker_id)
+                if not owned:
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    cancelled = await run_blocking(_with_session, is_job_cancelled, job_id)
+                    if cancelled:
+                        logger.info("任务已取消: job=%s", job_id)
+                        self.stats["cancelled"] += 1
+                    else:
+                        logger.warning("任务已不归本 worker 执行，停止: job=%s", job_id)
+                        self.stats["lost"] += 1
+                    return
+            await run_blocking(_with_session, finish_job, job_id, self.worker_id)
+            if task.cancelled():
+                logger.info("任务已取消: job=%s", job_id)
+                self.stats["cancelled"] += 1
+            else:
+                self.stats["finished"] += 1
+        except asyncio.CancelledError:
+            # worker 停止：取消执行并把任务放回队列
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await run_blocking(
+                _with_session, release_job, job_id, self.worker_id, "服务重启，任务已重新排队..."
+            )
+            self.stats["released"] += 1
+            raise
+        finally:
+            self._generations.pop(job_id, None)
+
+    async def run(self) -> None:
+        logger.info("任务 worker 启动: id=%s concurrency=%d", self.worker_id, self.concurrency)
+        last_stale_check = 0.0
+        loop = asyncio.get_running_loop()
+        try:
+            while not self._stopping:
+                if loop.time() - last_stale_check >= self.heartbeat_interval:
+                    last_stale_check = loop.time()
+                    try:
+                        await self._requeue_stalled()
+                    except Exception:
+                        logger.exception("检查中断任务失败")
+
+                claimed_any = False
+                while len(self._running) < self.concurrency and not self._stopping:
+                    try:
+                        claimed = await self._claim()
+                    except Exception:
+                        logger.exception("领取任务失败")
+                        claimed = None
+                    if claimed is None:
+                        break
+                    claimed_any = True
+                    job_id = claimed[0]
+                    self.stats["claimed"] += 1
+                    logger.info("领取任务: job=%s worker=%s", job_id, self.worker_id)
+                    task = asyncio.create_task(self._execute(*claimed))
+                    self._running[job_id] = task
+                    task.add_done_callback(lambda _t, jid=job_id: self._on_task_done(jid))
+
+                if claimed_any:
+                    continue
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self._shutdown()
+
+    def _on_task_done(self, job_id: int) -> None:
+        self._running.pop(job_id, None)
+        self._priorities.pop(job_id, None)
+        # 有空闲名额后立即尝试领取下一个任务
+        self._wake.set()
+
+    async def _shutdown(self) -> None:
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("任务 worker 已停止: id=%s", self.worker_id)
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            **self.stats,
+            "worker_id": self.worker_id,
+            "concurrency": self.concurrency,
+            "bulk_limit": self.bulk_limit,
+            "running": len(self._running),
+        }
+
+
+# Web 进程内置的 worker（JOB_WORKER_MODE=embedded 时启动）
+_embedded_worker: Optional[JobWorker] = None
+_embedded_task: Optional["asyncio.Task[None]"] = None
+
+
+def start_embedded_worker() -> None:
+    global _embedded_worker, _embedded_task
+    if JOB_WORKER_MODE != "embedded" or _embedded_task is not None:
+        return
+    _embedded_worker = JobWorker()
+    _embedded_task = asyncio.create_task(_embedded_worker.run())
+
+
+async def stop_embedded_worker() -> None:
+    global _embedded_worker, _embedded_task
+    if _embedded_worker is None or _embedded_task is None:
+        return
+    _embedded_worker.stop()
+    await asyncio.gather(_embedded_task, return_exceptions=True)
+    _embedded_worker = None
+    _embedded_task = None
+
+
+def wake_embedded_worker() -> None:
+    """入队后唤醒同进程的内置 worker（独立 worker 模式下无操作，由轮询领取）"""
+    if _embedded_worker is not None:
+        _embedded_worker.wake()
+
+
+def cancel_embedded_job(job_id: int) -> bool:
+    """立即取消同进程内置 worker 上执行中的任务（其他进程中的任务由心跳或状态写入发现）"""
+    if _embedded_worker is None:
+        return False
+    return _embedded_worker.cancel(job_id)
+
+
+def get_worker_stats() -> Dict[str, object]:
+    db = SessionLocal()
+    try:
+        queue = get_queue_counts(db)
+    finally:
+        db.close()
+    return {
+        "mode": JOB_WORKER_MODE,
+        "queue": queue,
+        "embedded_worker": _embedded_worker.get_stats() if _embedded_worker else None,
+    }
+
+
+async def _main(concurrency: int) -> None:
+    worker = JobWorker(concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass
+    try:
+        await worker.run()
+    finally:
+        await close_all_clients()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="软著生成任务 worker")
+    parser.add_argument(
+        "--concurrency", type=int, default=JOB_WORKER_CONCURRENCY, help="同时执行的任务数"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(_main(args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
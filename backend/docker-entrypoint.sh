@@ -1,6 +1,12 @@
 #!/usr/bin/env sh
 set -e
 
+# 独立的生成任务 worker：数据库迁移由 Web 容器负责
+if [ "$1" = "worker" ]; then
+  shift
+  exec python -m app.worker "$@"
+fi
+
 if [ -n "$DATABASE_URL" ]; then
   python - <<'PY'
 import os
@@ -0,0 +1,174 @@
+"""
+教案预生成命中检查 - 生成第 N 次课后，第 N+1 次课应直接使用预生成草稿
+
+在进程内调用教案流式接口：先以 prefetch_next=true 生成第 1 次课，等待后台草稿
+完成，再生成第 2 次课。第 2 次课的请求必须命中草稿（草稿指纹与请求时重新读取的
+输入一致，且没有再次调用模型）。未命中时以退出码 1 结束，可用于提交前或 CI 中检查。
+
+模型调用替换为 tools.mock_openai_server 的模拟教案数据并统计调用次数，不需要 AI 服务。
+
+用法（在 backend 目录下）：
+    uv run python -m tools.check_lesson_prefetch
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List
+
+from tools.check_loop_blocking import (
+    _TEST_PASSWORD,
+    _TEST_USERNAME,
+    _configure_ai,
+    _prepare_database,
+    call_asgi,
+)
+from tools.mock_openai_server import _mock_lesson_plan, _mock_plan_params
+
+
+def _mock_lesson_data(system_fields: Dict[str, Any]) -> Dict[str, Any]:
+    prompt = f"System Fields)**: {json.dumps(system_fields, ensure_ascii=False)}\n"
+    return _mock_lesson_plan(prompt)
+
+
+def _install_mock_generation(calls: List[int]) -> None:
+    """替换教案接口使用的模型调用，记录每次调用的课次"""
+    from app.routers import lesson_plan_api
+
+    async def generate_lesson_plan_content(**kwargs: Any) -> Dict[str, Any]:
+        calls.append(kwargs["sequence"])
+        return _mock_lesson_data(kwargs["system_fields"])
+
+    async def stream_lesson_plan_content(**kwargs: Any) -> AsyncGenerator[Dict[str, Any], None]:
+        calls.append(kwargs["sequence"])
+        yield {"type": "done", "data": _mock_lesson_data(kwargs["system_fields"])}
+
+    lesson_plan_api.generate_lesson_plan_content = generate_lesson_plan_content
+    lesson_plan_api.stream_lesson_plan_content = stream_lesson_plan_content
+
+
+def _create_plan_document(course_id: int) -> None:
+    from app.database import SessionLocal
+    from app.models import CourseDocument
+
+    db = SessionLocal()
+    try:
+        db.add(
+            CourseDocument(
+                course_id=course_id,
+                doc_type="plan",
+                title="授课计划",
+                content="{}",
+                plan_params=json.dumps(_mock_plan_params(), ensure_ascii=False),
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _use_temp_data_dir(data_dir: Path) -> None:
+    """生成的教案文档与 AI 缓存写入临时目录，检查不在仓库 data 目录中留下文件"""
+    from app.utils import paths
+
+    paths.DATA_DIR = data_dir
+    paths.UPLOADS_DIR = data_dir / "uploads"
+    paths.GENERATED_DIR = paths.UPLOADS_DIR / "generated"
+    paths.CACHE_DIR = data_dir / "cache"
+
+    from app import ai_cache, docx_service
+
+    docx_service.OUTPUT_DIR = paths.GENERATED_DIR
+    ai_cache.completion_cache.directory = paths.CACHE_DIR / "completions"
+
+
+def _completed_event(body: bytes) -> Dict[str, Any]:
+    events = [
+        json.loads(line[len(b"data: "):])
+        for line in body.splitlines()
+        if line.startswith(b"data: ")
+    ]
+    if not events or events[-1].get("stage") != "completed":
+        raise RuntimeError(f"教案生成未完成：{events[-1] if events else body[:200]!r}")
+    return events[-1]
+
+
+async def run_check(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.lesson_plan_prefetch import lesson_plan_prefetcher
+    from app.main import app
+
+    user_id, course_id = await asyncio.to_thread(_prepare_database)
+    await asyncio.to_thread(_configure_ai, user_id, "http://127.0.0.1:9/v1", "mock-model")
+    await asyncio.to_thread(_create_plan_document, course_id)
+
+    calls: List[int] = []
+    _install_mock_generation(calls)
+
+    status, body = await call_asgi(
+        app,
+        "POST",
+        "/api/auth/login",
+        json_body={"username": _TEST_USERNAME, "password": _TEST_PASSWORD},
+    )
+    if status != 200:
+        raise RuntimeError(f"登录失败：{status} {body[:200]!r}")
+    auth = {"authorization": f"Bearer {json.loads(body)['access_token']}"}
+    path = f"/api/courses/{course_id}/generate-lesson-plan/stream"
+
+    status, body = await call_asgi(
+        app, "GET", path, headers=auth, query={"sequence": args.sequence, "prefetch_next": "true"}
+    )
+    next_sequence = _completed_event(body).get("prefetch_sequence")
+    if next_sequence is None:
+        raise RuntimeError("第一次请求没有安排下一次课的预生成")
+
+    # 等待后台草稿生成完成（模拟教师查看上一份教案后再生成下一份）
+    for _ in range(100):
+        if next_sequence in calls:
+            break
+        await asyncio.sleep(0.05)
+    calls_before = len(calls)
+    stats_before = dict(lesson_plan_prefetcher.stats)
+
+    status, body = await call_asgi(app, "GET", path, headers=auth, query={"sequence": next_sequence})
+    _completed_event(body)
+    stats = lesson_plan_prefetcher.stats
+    return {
+        "sequence": next_sequence,
+        "hits": stats["hits"] - stats_before["hits"],
+        "stale": stats["stale"] - stats_before["stale"],
+        "misses": stats["misses"] - stats_before["misses"],
+        "model_calls": len(calls) - calls_before,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="检查第 N+1 次课教案是否命中预生成草稿")
+    parser.add_argument("--sequence", type=int, default=1, help="第一次生成的课次")
+    args = parser.parse_args()
+
+    # 必须在导入 app 之前设置数据库地址
+    work_dir = tempfile.mkdtemp(prefix="prefetch_check_")
+    db_path = os.path.join(work_dir, "prefetch_check.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOOP_MONITOR_INTERVAL", "0")
+    _use_temp_data_dir(Path(work_dir) / "data")
+
+    result = asyncio.run(run_check(args))
+    print(
+        f"第 {result['sequence']} 次课：hits={result['hits']} stale={result['stale']} "
+        f"misses={result['misses']} model_calls={result['model_calls']}"
+    )
+    if result["hits"] != 1 or result["model_calls"] != 0:
+        print("\n下一次课没有命中预生成草稿")
+        sys.exit(1)
+    print("\n下一次课命中预生成草稿")
+
+
+if __name__ == "__main__":
+    main()
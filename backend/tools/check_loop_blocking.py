@@ -0,0 +1,288 @@
+"""
+事件循环阻塞检查 - 逐个调用 API，发现阻塞事件循环超过阈值的接口
+
+在进程内直接调用 ASGI 应用（不经过网络），调用期间以很短的间隔测量事件循环
+调度延迟；某个请求期间的最大延迟超过阈值即判定该接口仍在事件循环上执行阻塞操作
+（同步数据库查询、文件读写、bcrypt、docx 渲染等）。存在超标接口时以退出码 1 结束，
+可用于提交前或 CI 中检查。
+
+用法（在 backend 目录下）：
+    uv run python -m tools.check_loop_blocking --threshold-ms 50
+
+默认使用临时 SQLite 数据库并自动建表、创建测试用户与课程；--database-url 可指定
+已迁移的数据库。指定 --ai-base-url（如 tools.mock_openai_server 的地址）时同时检查
+对话与授课计划等流式接口。
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+_TEST_USERNAME = "loop_check"
+_TEST_PASSWORD = "loop_check_password"
+
+
+@dataclass
+class CheckResult:
+    method: str
+    path: str
+    status: int
+    elapsed_ms: float
+    max_lag_ms: float
+    failed: bool = False
+    body: bytes = field(default=b"", repr=False)
+
+
+class LagProbe:
+    """以固定间隔 sleep，记录实际唤醒比预期晚的最大值"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_lag_ms = 0.0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.max_lag_ms = max(self.max_lag_ms, (loop.time() - expected) * 1000)
+
+    async def __aenter__(self) -> "LagProbe":
+        self._task = asyncio.create_task(self._run())
+        # 让探测任务先运行一次，开始计时
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+async def call_asgi(
+    app: Any,
+    method: str,
+    path: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    json_body: Any = None,
+    query: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, bytes]:
+    """直接调用 ASGI 应用并读取完整响应（包括流式响应）"""
+    body = json.dumps(json_body).encode("utf-8") if json_body is not None else b""
+    raw_headers = [(b"host", b"testserver")]
+    if json_body is not None:
+        raw_headers.append((b"content-type", b"application/json"))
+    for key, value in (headers or {}).items():
+        raw_headers.append((key.lower().encode("latin-1"), value.encode("latin-1")))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": urlencode(query or {}).encode("utf-8"),
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+    status = 0
+    chunks: List[bytes] = []
+    finished = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    finished.set()
+    return status, b"".join(chunks)
+
+
+def _prepare_database() -> Tuple[int, int]:
+    """建表并创建测试用户与课程，返回 (user_id, course_id)"""
+    from app.auth import get_password_hash
+    from app.database import SessionLocal, engine
+    from app.models import Base, Course, User
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == _TEST_USERNAME).first()
+        if user is None:
+            user = User(username=_TEST_USERNAME, hashed_password=get_password_hash(_TEST_PASSWORD))
+            db.add(user)
+            db.commit()
+        course = db.query(Course).filter(Course.user_id == user.id).first()
+        if course is None:
+            course = Course(
+                user_id=user.id,
+                name="事件循环检查课程",
+                class_name="测试班",
+                total_hours=16,
+                practice_hours=8,
+                course_type="A",
+                textbook_isbn="0000000000",
+                textbook_name="测试教材",
+                textbook_image="",
+                course_catalog="第一章 概述\n第二章 基础\n第三章 应用\n第四章 综合",
+            )
+            db.add(course)
+            db.commit()
+        return user.id, course.id
+    finally:
+        db.close()
+
+
+def _configure_ai(user_id: int, base_url: str, model: str) -> None:
+    from app.database import SessionLocal
+    from app.models import User
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        user.ai_api_key = "loop-check"
+        user.ai_base_url = base_url
+        user.ai_model_name = model
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_checks(args: argparse.Namespace) -> List[CheckResult]:
+    from app.main import app
+
+    # 导入应用产生的大量对象会在之后某次请求中触发一次完整的垃圾回收（数十毫秒），
+    # 先回收并冻结这些对象，避免误判到恰好触发回收的接口上
+    gc.collect()
+    gc.freeze()
+
+    user_id, course_id = await asyncio.to_thread(_prepare_database)
+    if args.ai_base_url:
+        await asyncio.to_thread(_configure_ai, user_id, args.ai_base_url, args.ai_model)
+
+    results: List[CheckResult] = []
+
+    async def check(method: str, path: str, **kwargs: Any) -> CheckResult:
+        # 首次调用包含模块懒加载、SQL 编译缓存等一次性开销，不计入结果
+        if args.warmup:
+            await call_asgi(app, method, path, **kwargs)
+        result: Optional[CheckResult] = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            async with LagProbe() as probe:
+                status, body = await call_asgi(app, method, path, **kwargs)
+            current = CheckResult(
+                method=method,
+                path=path,
+                status=status,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                max_lag_ms=probe.max_lag_ms,
+                body=body,
+            )
+            if result is None or current.max_lag_ms > result.max_lag_ms:
+                result = current
+        assert result is not None
+        result.failed = result.max_lag_ms > args.threshold_ms
+        results.append(result)
+        return result
+
+    login = await check(
+        "POST",
+        "/api/auth/login",
+        json_body={"username": _TEST_USERNAME, "password": _TEST_PASSWORD},
+    )
+    if login.status != 200:
+        raise RuntimeError(f"登录失败：{login.status} {login.body[:200]!r}")
+    token = json.loads(login.body)["access_token"]
+    auth = {"authorization": f"Bearer {token}"}
+
+    await check("GET", "/api/auth/me", headers=auth)
+    await check("GET", "/api/courses", headers=auth)
+    await check("GET", f"/api/courses/{course_id}", headers=auth)
+    await check("GET", f"/api/courses/{course_id}/documents", headers=auth)
+    await check("GET", f"/api/courses/{course_id}/teaching-plans", headers=auth)
+    await check("GET", f"/api/courses/{course_id}/lesson-plans", headers=auth)
+    await check("GET", "/api/chat/history", headers=auth)
+    await check("GET", "/api/copyright/projects", headers=auth)
+    await check("GET", "/api/metrics/jobs", headers=auth)
+
+    if args.ai_base_url:
+        await check("POST", "/api/chat/send", headers=auth, json_body={"content": "你好"})
+        await check(
+            "GET",
+            f"/api/courses/{course_id}/generate-teaching-plan/stream",
+            headers=auth,
+            query={"teacher_name": "测试", "total_weeks": 4, "hour_per_class": 4},
+        )
+        await check(
+            "GET",
+            f"/api/courses/{course_id}/generate-lesson-plan/stream",
+            headers=auth,
+            query={"sequence": 1},
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="检查 API 请求是否阻塞事件循环")
+    parser.add_argument("--threshold-ms", type=float, default=50, help="允许的最大事件循环延迟（毫秒）")
+    parser.add_argument("--repeat", type=int, default=3, help="每个接口调用次数（取最大延迟）")
+    parser.add_argument(
+        "--no-warmup", dest="warmup", action="store_false", help="不预先调用一次（计入首次调用开销）"
+    )
+    parser.add_argument("--database-url", default=None, help="数据库地址（默认临时 SQLite）")
+    parser.add_argument("--ai-base-url", default=None, help="AI 服务地址，指定时检查流式生成接口")
+    parser.add_argument("--ai-model", default="mock-model", help="AI 模型名称")
+    args = parser.parse_args()
+
+    # 必须在导入 app 之前设置数据库地址
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="loop_check_"), "loop_check.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOOP_MONITOR_INTERVAL", "0")
+
+    results = asyncio.run(run_checks(args))
+    failed = [result for result in results if result.failed]
+    for result in results:
+        flag = "FAIL" if result.failed else "ok"
+        print(
+            f"[{flag:>4}] {result.method:<6} {result.path:<60} status={result.status} "
+            f"elapsed={result.elapsed_ms:7.1f}ms max_lag={result.max_lag_ms:6.1f}ms"
+        )
+    if failed:
+        print(f"\n{len(failed)} 个接口阻塞事件循环超过 {args.threshold_ms:.0f} ms")
+        sys.exit(1)
+    print(f"\n全部 {len(results)} 个接口均未阻塞事件循环超过 {args.threshold_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
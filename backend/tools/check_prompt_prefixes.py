@@ -0,0 +1,200 @@
+"""
+提示词前缀检查 - 不同项目、课程与请求的系统提示词必须字节一致
+
+兼容的服务商按前缀复用提示词缓存，系统提示词中一旦混入课程名称、课次、项目名称等
+随请求变化的内容，所有请求的前缀都会不同，缓存无法命中。本工具分别为两组不同的
+输入渲染各生成场景实际发送的系统提示词并逐字节比较：
+
+- 教案：严格 / 推断两种模式，两门课程的不同课次
+- 授课计划：两门课程（截获 complete_chat 收到的消息，不调用模型）
+- 软著：两个项目的全部阶段（含前端逐页生成），功能模块与创新点也不相同
+
+任一场景不一致时输出第一个不同的位置并以退出码 1 结束，可用于提交前或 CI 中检查。
+
+用法（在 backend 目录下）：
+    uv run python -m tools.check_prompt_prefixes
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# 两组互不相同的课程与请求输入
+_LESSON_REQUESTS = [
+    {
+        "sequence": 1,
+        "plan_item": {"week": 1, "order": 1, "title": "项目一：网络基础", "tasks": "1. 网络模型\n2. IP 地址"},
+        "system_fields": {"project_name": "项目一：网络基础", "week": 1, "sequence": 1, "hours": 4, "total_hours": 64},
+        "document_full_text": "计算机网络授课计划全文",
+        "course_context": "课程名称：计算机网络",
+    },
+    {
+        "sequence": 7,
+        "plan_item": {"week": 4, "order": 7, "title": "项目三：数据库设计", "tasks": "1. 范式\n2. 建表"},
+        "system_fields": {"project_name": "项目三：数据库设计", "week": 4, "sequence": 7, "hours": 2, "total_hours": 32},
+        "document_full_text": "数据库应用授课计划全文",
+        "course_context": "课程名称：数据库应用",
+    },
+]
+
+_TEACHING_PLAN_REQUESTS = [
+    {
+        "course_catalog": "项目一 网络基础\n项目二 路由与交换",
+        "course_name": "计算机网络",
+        "total_hours": 16,
+        "theory_hours": 8,
+        "practice_hours": 8,
+        "hour_per_class": 4,
+        "total_weeks": 4,
+        "classes_per_week": 1,
+        "final_review": True,
+    },
+    {
+        "course_catalog": "项目一 数据库概述\n项目二 SQL 查询\n项目三 数据库设计",
+        "course_name": "数据库应用",
+        "total_hours": 24,
+        "theory_hours": 12,
+        "practice_hours": 12,
+        "hour_per_class": 2,
+        "total_weeks": 7,
+        "classes_per_week": 2,
+        "final_review": False,
+    },
+]
+
+_COPYRIGHT_PROJECTS = [
+    {
+        "system_name": "智慧校园管理系统",
+        "software_abbr": "智慧校园",
+        "module_list": "- 学生管理\n- 课程管理",
+        "innovation_points": "- 智能排课",
+    },
+    {
+        "system_name": "农产品溯源平台",
+        "software_abbr": "溯源平台",
+        "module_list": "- 批次登记\n- 扫码查询\n- 数据看板",
+        "innovation_points": "- 区块链存证\n- 产地画像",
+    },
+]
+
+
+def _lesson_plan_prompts() -> Dict[str, List[str]]:
+    from app.ai_service import _build_lesson_plan_messages
+
+    prompts: Dict[str, List[str]] = {}
+    for strict_mode in (True, False):
+        name = f"lesson_plan[{'strict' if strict_mode else 'infer'}]"
+        prompts[name] = [
+            _build_lesson_plan_messages(strict_mode=strict_mode, **request)[0]["content"]
+            for request in _LESSON_REQUESTS
+        ]
+    return prompts
+
+
+class _Captured(Exception):
+    def __init__(self, messages: List[Dict[str, Any]]):
+        super().__init__("captured")
+        self.messages = messages
+
+
+async def _teaching_plan_prompts() -> Dict[str, List[str]]:
+    from app import teaching_plan_service
+
+    async def capture(client: Any, *, messages: List[Dict[str, Any]], **kwargs: Any) -> str:
+        raise _Captured(messages)
+
+    original = teaching_plan_service.complete_chat
+    teaching_plan_service.complete_chat = capture
+    prompts: List[str] = []
+    try:
+        for request in _TEACHING_PLAN_REQUESTS:
+            try:
+                await teaching_plan_service.generate_teaching_plan_schedule(
+                    api_key="check", base_url="http://127.0.0.1:9/v1", model="check-model", **request
+                )
+            except _Captured as captured:
+                prompts.append(captured.messages[0]["content"])
+            else:
+                raise RuntimeError("授课计划生成没有调用模型")
+    finally:
+        teaching_plan_service.complete_chat = original
+    return {"teaching_plan": prompts}
+
+
+def _copyright_prompts() -> Dict[str, List[str]]:
+    from app.copyright_service import (
+        PROMPT_FILES,
+        build_project_config,
+        build_prompt_variables,
+        render_stage_system_prompt,
+    )
+
+    stages = [stage for stage in PROMPT_FILES if stage != "frontend"] + ["frontend_page"]
+    prompts: Dict[str, List[str]] = {f"copyright.{stage}": [] for stage in stages}
+    for project in _COPYRIGHT_PROJECTS:
+        project_dir = Path(tempfile.mkdtemp(prefix="prompt_check_"))
+        config = build_project_config(
+            project_dir=project_dir,
+            system_name=project["system_name"],
+            software_abbr=project["software_abbr"],
+            generation_mode="fast",
+            include_ui_desc=False,
+            include_tech_desc=False,
+        )
+        variables = {
+            **build_prompt_variables(config),
+            "module_list": project["module_list"],
+            "innovation_points": project["innovation_points"],
+        }
+        for stage in stages:
+            prompts[f"copyright.{stage}"].append(render_stage_system_prompt(stage, variables))
+    return prompts
+
+
+def _first_difference(first: str, second: str) -> int:
+    for index, (a, b) in enumerate(zip(first.encode("utf-8"), second.encode("utf-8"))):
+        if a != b:
+            return index
+    return min(len(first.encode("utf-8")), len(second.encode("utf-8")))
+
+
+def _compare(prompts: Dict[str, List[str]]) -> List[Tuple[str, int, int]]:
+    """返回 (场景, 提示词字节数, 第一个不同的字节位置)，一致时位置为 -1"""
+    rows = []
+    for name, (first, second) in prompts.items():
+        if first == second:
+            rows.append((name, len(first.encode("utf-8")), -1))
+        else:
+            rows.append((name, len(first.encode("utf-8")), _first_difference(first, second)))
+    return rows
+
+
+def main() -> None:
+    # 必须在导入 app 之前设置数据库地址（只用于导入，不会连接）
+    db_path = os.path.join(tempfile.mkdtemp(prefix="prompt_check_"), "prompt_check.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    prompts: Dict[str, List[str]] = {}
+    prompts.update(_lesson_plan_prompts())
+    prompts.update(asyncio.run(_teaching_plan_prompts()))
+    prompts.update(_copyright_prompts())
+
+    failed = False
+    for name, size, offset in _compare(prompts):
+        if offset < 0:
+            print(f"{name:<32} {size:>7} 字节  一致")
+        else:
+            failed = True
+            print(f"{name:<32} {size:>7} 字节  第 {offset} 字节起不同")
+    if failed:
+        print("\n存在随请求变化的系统提示词，服务商无法复用前缀缓存")
+        sys.exit(1)
+    print("\n所有场景的系统提示词字节一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+授课计划课次检查 - 生成结果必须与课表框架逐次对应
+
+分别以是否安排复习考核、是否分段生成的四种组合调用授课计划生成，模型调用替换为
+tools.mock_openai_server 的模拟课表（与遵守提示词的模型一样，不输出提示词中标注为
+复习考核的课次）。每种组合的结果必须恰好包含全部课次且 order 依次递增，复习考核
+只在 final_review=true 时出现在最后一次课；任一组合失败时以退出码 1 结束。
+
+用法（在 backend 目录下）：
+    uv run python -m tools.check_teaching_plan_schedule
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from tools.mock_openai_server import _mock_schedule
+
+_SHORT_REQUEST = {
+    "course_catalog": "项目一 网络基础\n项目二 路由与交换",
+    "course_name": "计算机网络",
+    "total_hours": 16,
+    "theory_hours": 8,
+    "practice_hours": 8,
+    "hour_per_class": 4,
+    "total_weeks": 4,
+    "classes_per_week": 1,
+}
+
+# 课次达到分段阈值且目录可拆分为多个项目，走分段并发生成
+_LONG_REQUEST = {
+    "course_catalog": "\n".join(
+        f"项目{index} 数据库专题 {index}\n1. 概念讲解\n2. 上机练习" for index in range(1, 7)
+    ),
+    "course_name": "数据库应用",
+    "total_hours": 64,
+    "theory_hours": 32,
+    "practice_hours": 32,
+    "hour_per_class": 2,
+    "total_weeks": 17,
+    "classes_per_week": 2,
+}
+
+
+async def _mock_complete_chat(client: Any, *, messages: List[Dict[str, Any]], **kwargs: Any) -> str:
+    return json.dumps(_mock_schedule(messages[-1]["content"]), ensure_ascii=False)
+
+
+def _problem(schedule: List[Dict[str, Any]], request: Dict[str, Any], final_review: bool) -> Optional[str]:
+    actual_classes = request["total_hours"] // request["hour_per_class"]
+    orders = [item.get("order") for item in schedule]
+    if orders != list(range(1, actual_classes + 1)):
+        return f"课次为 {orders}，应为 1-{actual_classes}"
+    reviews = [item["order"] for item in schedule if item.get("title") == "课程复习与考核"]
+    expected = [actual_classes] if final_review else []
+    if reviews != expected:
+        return f"复习考核课次为 {reviews}，应为 {expected}"
+    return None
+
+
+async def run_check() -> List[Dict[str, Any]]:
+    from app import teaching_plan_service
+
+    teaching_plan_service.complete_chat = _mock_complete_chat
+    rows = []
+    for label, request in (("单次生成", _SHORT_REQUEST), ("分段生成", _LONG_REQUEST)):
+        for final_review in (True, False):
+            try:
+                schedule = await teaching_plan_service.generate_teaching_plan_schedule(
+                    api_key="check",
+                    base_url="http://127.0.0.1:9/v1",
+                    model="check-model",
+                    final_review=final_review,
+                    use_cache=False,
+                    **request,
+                )
+                problem = _problem(schedule, request, final_review)
+            except ValueError as exc:
+                problem = str(exc)
+            rows.append({"case": f"{label} final_review={str(final_review).lower()}", "problem": problem})
+    return rows
+
+
+def main() -> None:
+    # 必须在导入 app 之前设置数据库地址（只用于导入，不会连接）
+    db_path = os.path.join(tempfile.mkdtemp(prefix="schedule_check_"), "schedule_check.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    failed = False
+    for row in asyncio.run(run_check()):
+        if row["problem"] is None:
+            print(f"{row['case']:<32} 通过")
+        else:
+            failed = True
+            print(f"{row['case']:<32} 失败：{row['problem']}")
+    if failed:
+        sys.exit(1)
+    print("\n所有组合的授课计划课次与课表框架一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""
+本地 OpenAI 兼容模拟服务 - 用于离线压测教案、授课计划、软著生成链路
+
+根据提示词特征返回结构合法的模拟数据，支持流式 / 非流式补全、/v1/models，
+并可配置首字延迟、输出速率、错误与 429 注入。
+
+用法（在 backend 目录下）：
+    uv run python -m tools.mock_openai_server --port 9000 --latency-ms 300 --tokens-per-sec 80
+
+然后在个人中心把 Base URL 设为 http://127.0.0.1:9000/v1，API Key 任意填写。
+运行中可通过 POST /mock/config 调整参数，GET /mock/stats 查看请求统计。
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class MockSettings:
+    latency_ms: float = 200  # 首个 token 前的延迟
+    latency_jitter_ms: float = 50
+    tokens_per_sec: float = 100  # 输出速率，<= 0 表示不限速
+    chars_per_token: int = 2  # 流式输出时每个 chunk 的字符数
+    error_rate: float = 0.0  # 返回 500 的概率
+    rate_limit_rate: float = 0.0  # 返回 429 的概率
+    retry_after: float = 1.0  # 429 响应的 Retry-After 秒数
+    max_concurrency: int = 0  # 超过该并发时直接返回 429，0 表示不限
+
+
+settings = MockSettings()
+stats: Dict[str, Any] = {
+    "requests": 0,
+    "streams": 0,
+    "errors_injected": 0,
+    "rate_limited": 0,
+    "in_flight": 0,
+    "peak_in_flight": 0,
+    "completion_tokens": 0,
+    "by_kind": {},
+}
+
+app = FastAPI(title="Mock OpenAI Server")
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 2)
+
+
+# ---------------------------------------------------------------------------
+# 模拟数据
+# ---------------------------------------------------------------------------
+
+
+def _lines(prefix: str, count: int, body: str) -> str:
+    return "".join(f"({index}){prefix}{body}\n" for index in range(1, count + 1))
+
+
+def _mock_lesson_plan(prompt: str) -> Dict[str, Any]:
+    sequence_match = re.search(r"授课顺序 \(Sequence\)\*\*: (\d+)", prompt)
+    sequence = int(sequence_match.group(1)) if sequence_match else 1
+    system_fields: Dict[str, Any] = {}
+    fields_match = re.search(r"System Fields\)\*\*: (\{.*?\})\n", prompt)
+    if fields_match:
+        try:
+            system_fields = json.loads(fields_match.group(1))
+        except ValueError:
+            system_fields = {}
+    hours = system_fields.get("hours") or 4
+    try:
+        hours = int(hours)
+    except (TypeError, ValueError):
+        hours = 4
+
+    review_time = 10
+    available = hours * 40 - 15 - review_time
+    count = 4
+    times = [available // count] * count
+    times[-1] += available - sum(times)
+    goal_body = "能够结合模拟项目说明本次课涉及的核心概念与操作流程，并完成练习。"
+    return {
+        "project_name": system_fields.get("project_name", f"项目{sequence}：模拟教学内容"),
+        "week": system_fields.get("week", sequence),
+        "sequence": system_fields.get("sequence", sequence),
+        "hours": hours,
+        "total_hours": system_fields.get("total_hours", hours * sequence),
+        "knowledge_goals": _lines("理解", 3, goal_body),
+        "ability_goals": _lines("掌握", 3, goal_body),
+        "quality_goals": _lines("培养", 3, goal_body),
+        "teaching_content": (
+            "本次课围绕模拟项目展开，首先讲解相关概念与基本原理，帮助学生建立整体认识，"
+            "并通过案例说明知识点之间的联系与应用场景。\n"
+            "随后组织学生分组完成实践任务，教师巡视指导，针对常见问题进行集中讲评，"
+            "使学生在动手过程中巩固所学内容并形成规范的操作习惯。\n"
+        ),
+        "teaching_focus": _lines("重点：", 2, "模拟项目的核心流程与关键操作步骤及注意事项。"),
+        "teaching_difficulty": _lines("难点：", 2, "在真实场景中灵活运用所学方法并排查常见错误。"),
+        "review_content": (
+            "1. 我们上节课学习了模拟项目的基础知识，明确了各组成部分的作用与相互关系。\n"
+            "2. 在此基础上，我们本节课将进入新的任务环节，按照项目需要逐步展开实践。\n"
+            "3. 本节课的目标是掌握核心操作流程，能够独立完成任务并总结关键要点。\n"
+        ),
+        "review_time": review_time,
+        "new_lessons": [
+            {
+                "content": f"任务{index + 1}：模拟任务名称\n教师活动：讲解演示并组织学生练习，巡视指导。",
+                "time": minutes,
+            }
+            for index, minutes in enumerate(times)
+        ],
+        "assessment_content": "通过课堂提问与随堂练习检测学生对本次课知识点的掌握情况。\n",
+        "summary_content": (
+            "1. 总结本课程重难点，如核心概念、关键操作步骤等，帮助我们形成完整的知识结构。\n"
+            "2. 强调相关注意事项，如操作规范、常见易错点等，避免在后续任务中重复出现问题。\n"
+            "3. 通过提问与练习检测目标达成情况，发现的问题将在下次课复习环节集中讲解修正。\n"
+        ),
+        "homework_content": "1. 完成课后练习一份，整理本次课操作步骤。\n",
+    }
+
+
+def _mock_time_allocation(prompt: str) -> Dict[str, Any]:
+    total_match = re.search(r"总时长\(分钟\): (\d+)", prompt)
+    total_minutes = int(total_match.group(1)) if total_match else 160
+    lessons_match = re.search(r"新课教学内容列表: (\[.*?\])\n", prompt)
+    lessons: List[Dict[str, Any]] = []
+    if lessons_match:
+        try:
+            lessons = json.loads(lessons_match.group(1))
+        except ValueError:
+            lessons = []
+    if not lessons:
+        lessons = [{"content": "任务"}] * 4
+    review_time = 10
+    available = total_minutes - 15 - review_time
+    times = [available // len(lessons)] * len(lessons)
+    times[-1] += available - sum(times)
+    return {
+        "review_time": review_time,
+        "new_lessons": [
+            {"content": item.get("content", ""), "time": minutes}
+            for item, minutes in zip(lessons, times)
+        ],
+    }
+
+
+def _mock_schedule(prompt: str) -> List[Dict[str, Any]]:
+    frame: List[Dict[str, Any]] = []
+    frame_match = re.search(r"已定课表框架\*\*：(\[.*?\])\n", prompt)
+    if frame_match:
+        try:
+            frame = json.loads(frame_match.group(1))
+        except ValueError:
+            frame = []
+    hour_match = re.search(r"单次学时：(\d+)", prompt) or re.search(r'"hour": (\d+)', prompt)
+    hour = int(hour_match.group(1)) if hour_match else 4
+    # 与遵守提示词的模型一致：不输出标注为复习考核的课次
+    review_match = re.search(r"复习考核：第 (\d+) 次课", prompt)
+    review_order = int(review_match.group(1)) if review_match else None
+    return [
+        {
+            "week": slot.get("week"),
+            "order": slot.get("order"),
+            "title": f"项目{(slot.get('order', 1) + 1) // 2}：模拟教学内容",
+            "tasks": "1. 模拟任务一\n2. 模拟任务二",
+            "hour": hour,
+        }
+        for slot in frame
+        if slot.get("order") != review_order
+    ]
+
+
+def _mock_plan_params() -> Dict[str, Any]:
+    return {
+        "schedule": [
+            {
+                "week": order,
+                "order": order,
+                "title": f"项目{(order + 1) // 2}：模拟教学内容",
+                "tasks": "1. 模拟任务一\n2. 模拟任务二",
+                "hour": 4,
+            }
+            for order in range(1, 17)
+        ],
+        "hour_per_class": 4,
+    }
+
+
+def _mock_file_blocks(prompt: str) -> str:
+    match = re.search(r"### FILE: (output_sourcecode/[a-z]+)/", prompt)
+    directory = match.group(1) if match else "output_sourcecode/backend"
+    if directory.endswith("/front"):
+        files = {
+            "dashboard.html": "<html><body><h1>仪表盘</h1></body></html>",
+            "settings.html": "<html><body><h1>系统设置</h1></body></html>",
+        }
+    elif directory.endswith("/db"):
+        files = {"schema.sql": "CREATE TABLE mock_item (id INTEGER PRIMARY KEY, name VARCHAR(64));"}
+    else:
+        files = {"main.py": "def health_check():\n    return {\"status\": \"ok\"}\n"}
+    return "\n".join(f"### FILE: {directory}/{name}\n{content}\n" for name, content in files.items())
+
+
+def build_mock_reply(messages: List[Dict[str, Any]]) -> tuple[str, str]:
+    """
+    根据提示词特征生成模拟回复
+
+    Returns:
+        (kind, content)
+    """
+    prompt = "\n".join(
+        message.get("content", "") if isinstance(message.get("content"), str) else ""
+        for message in messages
+    )
+    if "仅重新生成时间分配" in prompt:
+        return "time_allocation", json.dumps(_mock_time_allocation(prompt), ensure_ascii=False)
+    if "new_lessons" in prompt and "knowledge_goals" in prompt:
+        return "lesson_plan", json.dumps(_mock_lesson_plan(prompt), ensure_ascii=False)
+    if "已定课表框架" in prompt:
+        return "teaching_plan_schedule", json.dumps(_mock_schedule(prompt), ensure_ascii=False)
+    if "提取课次参数" in prompt:
+        return "plan_params", json.dumps(_mock_plan_params(), ensure_ascii=False)
+    if "module_list" in prompt and "innovation_points" in prompt:
+        return "copyright_insights", json.dumps(
+            {
+                "module_list": ["用户管理", "数据管理", "统计分析"],
+                "innovation_points": ["模块化架构", "可视化分析"],
+            },
+            ensure_ascii=False,
+        )
+    if "提取页面清单" in prompt:
+        return "copyright_pages", json.dumps(
+            [
+                {"name": "仪表盘", "path": "/dashboard", "file": "dashboard.html", "description": "系统总览"},
+                {"name": "系统设置", "path": "/settings", "file": "settings.html", "description": "系统配置"},
+            ],
+            ensure_ascii=False,
+        )
+    if "本次只生成以下单个页面" in prompt:
+        match = re.search(r"目标文件：output_sourcecode/front/(\S+)", prompt)
+        title = match.group(1) if match else "index.html"
+        return "copyright_page", (
+            f"<!DOCTYPE html>\n<html lang=\"zh-CN\"><body><h1>{title}</h1></body></html>"
+        )
+    if "### FILE:" in prompt:
+        return "copyright_files", _mock_file_blocks(prompt)
+    if len(messages) > 1 and messages[0].get("role") == "system":
+        body = "\n\n".join(f"## 第 {index} 节\n这是用于压测的模拟文档内容。" * 3 for index in range(1, 6))
+        return "document", f"# 模拟文档\n\n{body}"
+    return "chat", "这是模拟服务的回复，用于离线测试对话流式输出。"
+
+
+# ---------------------------------------------------------------------------
+# 接口
+# ---------------------------------------------------------------------------
+
+
+def _error_response(status_code: int, message: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": "mock_error", "code": status_code}},
+        headers=headers,
+    )
+
+
+def _inject_failure() -> Optional[JSONResponse]:
+    if settings.max_concurrency and stats["in_flight"] >= settings.max_concurrency:
+        stats["rate_limited"] += 1
+        return _error_response(
+            429, "Too many concurrent requests", {"retry-after": str(settings.retry_after)}
+        )
+    roll = random.random()
+    if roll < settings.rate_limit_rate:
+        stats["rate_limited"] += 1
+        return _error_response(429, "Rate limit reached", {"retry-after": str(settings.retry_after)})
+    if roll < settings.rate_limit_rate + settings.error_rate:
+        stats["errors_injected"] += 1
+        return _error_response(500, "Injected server error")
+    return None
+
+
+async def _first_token_delay() -> None:
+    jitter = random.uniform(-settings.latency_jitter_ms, settings.latency_jitter_ms)
+    delay = max(0.0, settings.latency_ms + jitter) / 1000
+    if delay:
+        await asyncio.sleep(delay)
+
+
+def _token_interval() -> float:
+    return 1 / settings.tokens_per_sec if settings.tokens_per_sec > 0 else 0.0
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {
+        "object": "list",
+        "data": [
+            {"id": model_id, "object": "model", "created": 1700000000, "owned_by": "mock"}
+            for model_id in ("mock-gpt", "gpt-4", "gpt-4o-mini")
+        ],
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    payload = await request.json()
+    stats["requests"] += 1
+    failure = _inject_failure()
+    if failure is not None:
+        return failure
+
+    messages = payload.get("messages") or []
+    model = payload.get("model") or "mock-gpt"
+    kind, content = build_mock_reply(messages)
+    stats["by_kind"][kind] = stats["by_kind"].get(kind, 0) + 1
+    prompt_tokens = sum(estimate_tokens(str(message.get("content", ""))) for message in messages)
+    completion_tokens = estimate_tokens(content)
+    stats["completion_tokens"] += completion_tokens
+    completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+    created = int(time.time())
+    usage = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+    if not payload.get("stream"):
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        try:
+            await _first_token_delay()
+            await asyncio.sleep(completion_tokens * _token_interval())
+        finally:
+            stats["in_flight"] -= 1
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    stats["streams"] += 1
+    include_usage = bool((payload.get("stream_options") or {}).get("include_usage"))
+
+    def _chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+        data = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        try:
+            await _first_token_delay()
+            yield _chunk({"role": "assistant", "content": ""})
+            step = max(1, settings.chars_per_token)
+            interval = _token_interval()
+            for start in range(0, len(content), step):
+                yield _chunk({"content": content[start:start + step]})
+                if interval:
+                    await asyncio.sleep(interval)
+            yield _chunk({}, finish_reason="stop")
+            if include_usage:
+                usage_chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(usage_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+        finally:
+            stats["in_flight"] -= 1
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.get("/mock/stats")
+async def get_stats():
+    return {"settings": asdict(settings), "stats": stats}
+
+
+@app.post("/mock/config")
+async def update_config(changes: Dict[str, Any]):
+    """运行中调整模拟参数，例如 {"rate_limit_rate": 0.2}"""
+    for key, value in changes.items():
+        if hasattr(settings, key):
+            current = getattr(settings, key)
+            setattr(settings, key, type(current)(value))
+    return asdict(settings)
+
+
+@app.post("/mock/reset")
+async def reset_stats():
+    in_flight = stats["in_flight"]
+    stats.update(
+        requests=0,
+        streams=0,
+        errors_injected=0,
+        rate_limited=0,
+        peak_in_flight=in_flight,
+        completion_tokens=0,
+        by_kind={},
+    )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="本地 OpenAI 兼容模拟服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=settings.latency_ms)
+    parser.add_argument("--latency-jitter-ms", type=float, default=settings.latency_jitter_ms)
+    parser.add_argument("--tokens-per-sec", type=float, default=settings.tokens_per_sec)
+    parser.add_argument("--chars-per-token", type=int, default=settings.chars_per_token)
+    parser.add_argument("--error-rate", type=float, default=settings.error_rate)
+    parser.add_argument("--rate-limit-rate", type=float, default=settings.rate_limit_rate)
+    parser.add_argument("--retry-after", type=float, default=settings.retry_after)
+    parser.add_argument("--max-concurrency", type=int, default=settings.max_concurrency)
+    args = parser.parse_args()
+
+    for key in asdict(settings):
+        setattr(settings, key, getattr(args, key))
+
+    import uvicorn
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
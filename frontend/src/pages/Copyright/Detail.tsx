@@ -18,14 +18,19 @@ import { useParams, useNavigate, useModel } from '@umijs/max';
 import GenerationProgressDisplay, { GenerationProgress } from '@/components/GenerationProgress';
 import { isRateLimitError } from '@/utils/errors';
 import {
+    cancelCopyrightJob,
+    CopyrightJob,
     CopyrightProject,
     downloadCopyrightZip,
     getCopyrightProjectDetail,
     pollLatestCopyrightJob,
+    resumeCopyrightGeneration,
     startCopyrightGeneration,
     updateCopyrightProject,
 } from '@/services/copyright';
 
+const ACTIVE_JOB_STATUSES: CopyrightJob['status'][] = ['queued', 'running'];
+
 const CopyrightDetail: React.FC = () => {
     const { id } = useParams<{ id: string }>();
     const navigate = useNavigate();
@@ -41,6 +46,8 @@ const CopyrightDetail: React.FC = () => {
     const [progress, setProgress] = useState<GenerationProgress | null>(null);
     const [progressOpen, setProgressOpen] = useState(false);
     const [guideOpen, setGuideOpen] = useState(false);
+    const [activeJob, setActiveJob] = useState<CopyrightJob | null>(null);
+    const [cancelling, setCancelling] = useState(false);
     const pollingRef = useRef(false);
     const rateLimitShownRef = useRef(false);
 
@@ -50,6 +57,7 @@ const CopyrightDetail: React.FC = () => {
         try {
             const data = await getCopyrightProjectDetail(Number(id));
             setProject(data);
+            setActiveJob(data.latest_job || null);
             form.setFieldsValue({
                 name: data.name,
                 domain: data.domain,
@@ -89,10 +97,11 @@ const CopyrightDetail: React.FC = () => {
             completed: 'completed',
             failed: 'error',
         };
+        // 已取消任务的 stage 为 cancelled，按出错展示
         const stage =
-            (job?.stage as GenerationProgress['stage']) ||
-            stageMap[job?.status] ||
-            'preparing';
+            job?.status === 'cancelled'
+                ? 'error'
+                : (job?.stage as GenerationProgress['stage']) || stageMap[job?.status] || 'preparing';
         const progress =
             typeof job?.progress === 'number'
                 ? job.progress
@@ -113,8 +122,9 @@ const CopyrightDetail: React.FC = () => {
                 return;
             }
             if (job) {
+                setActiveJob(job);
                 setProgress(mapJobToProgress(job));
-                if (job.status === 'completed' || job.status === 'failed') {
+                if (job.status === 'completed' || job.status === 'failed' || job.status === 'cancelled') {
                     pollingRef.current = false;
                     loadProject();
                     return;
@@ -163,7 +173,7 @@ const CopyrightDetail: React.FC = () => {
         }
     };
 
-    const handleGenerate = async () => {
+    const handleGenerate = async (mode: 'generate' | 'regenerate' | 'resume' = 'generate') => {
         if (!id || !project) return;
         if (!aiConfigured) {
             Modal.info({
@@ -191,7 +201,12 @@ const CopyrightDetail: React.FC = () => {
         setProgressOpen(true);
         rateLimitShownRef.current = false;
         try {
-            const job = await startCopyrightGeneration(Number(id));
+            // 继续生成复用上次各阶段的检查点，重新生成跳过生成缓存
+            const job =
+                mode === 'resume'
+                    ? await resumeCopyrightGeneration(Number(id))
+                    : await startCopyrightGeneration(Number(id), { useCache: mode !== 'regenerate' });
+            setActiveJob(job);
             setProgress(mapJobToProgress(job));
             pollingRef.current = true;
             pollJobStatus(Number(id), job.updated_at);
@@ -201,6 +216,27 @@ const CopyrightDetail: React.FC = () => {
         }
     };
 
+    const handleCancel = async () => {
+        if (!id || !activeJob) return;
+        setCancelling(true);
+        try {
+            const job = await cancelCopyrightJob(Number(id), activeJob.id);
+            setActiveJob(job);
+            setProgress(mapJobToProgress(job));
+            pollingRef.current = false;
+            message.success('已取消生成任务，已完成的阶段可通过“继续生成”复用');
+            loadProject();
+        } catch (error: any) {
+            message.error(error?.message || '取消失败');
+        } finally {
+            setCancelling(false);
+        }
+    };
+
+    const jobActive = Boolean(activeJob && ACTIVE_JOB_STATUSES.includes(activeJob.status));
+    const canResume =
+        project?.latest_job?.status === 'failed' || project?.latest_job?.status === 'cancelled';
+
     if (loading || !project) {
         return (
             <PageContainer title="软著项目详情">
@@ -308,7 +344,7 @@ const CopyrightDetail: React.FC = () => {
                             保存配置
                         </Button>
                         {!project.latest_job && (
-                            <Button type="primary" onClick={handleGenerate} disabled={!aiConfigured}>
+                            <Button type="primary" onClick={() => handleGenerate()} disabled={!aiConfigured}>
                                 一键生成
                             </Button>
                         )}
@@ -321,13 +357,23 @@ const CopyrightDetail: React.FC = () => {
                                             '当前任务可能已中断或已完成。重新生成会启动新的后台任务，旧任务进度将被忽略。',
                                         okText: '重新生成',
                                         cancelText: '取消',
-                                        onOk: handleGenerate,
+                                        onOk: () => handleGenerate('regenerate'),
                                     })
                                 }
                             >
                                 重新生成
                             </Button>
                         )}
+                        {canResume && (
+                            <Button onClick={() => handleGenerate('resume')} disabled={!aiConfigured}>
+                                继续生成
+                            </Button>
+                        )}
+                        {jobActive && (
+                            <Button danger loading={cancelling} onClick={handleCancel}>
+                                取消生成
+                            </Button>
+                        )}
                         <Button
                             onClick={() => downloadCopyrightZip(project.id)}
                             disabled={project.latest_job?.status !== 'completed'}
@@ -355,6 +401,13 @@ const CopyrightDetail: React.FC = () => {
                         style={{ marginBottom: 16 }}
                     />
                     <GenerationProgressDisplay progress={progress} />
+                    {jobActive && (
+                        <div style={{ marginTop: 16 }}>
+                            <Button danger loading={cancelling} onClick={handleCancel}>
+                                取消生成
+                            </Button>
+                        </div>
+                    )}
                     {progress?.stage === 'completed' && (
                         <div style={{ marginTop: 16 }}>
                             <Button type="primary" onClick={() => downloadCopyrightZip(project.id)}>
@@ -390,6 +443,9 @@ const CopyrightDetail: React.FC = () => {
                     <Typography.Paragraph>
                         4. 同一项目重复生成会覆盖更新最新 ZIP。
                     </Typography.Paragraph>
+                    <Typography.Paragraph>
+                        5. 生成中可点击“取消生成”；任务失败或取消后可点击“继续生成”，已完成且输入未变化的阶段会直接复用。
+                    </Typography.Paragraph>
                     <Typography.Paragraph>
                         生成模式区别：快速模式侧重核心页面与关键接口，生成速度更快；完整模式覆盖完整功能模块与更多页面接口，内容更丰富但耗时更长。
                     </Typography.Paragraph>
@@ -152,7 +152,7 @@ const CopyrightList: React.FC = () => {
         setCurrentProjectId(record.id);
         setProgress(mapJobToProgress(job));
         setProgressOpen(true);
-        if (job.status !== 'completed' && job.status !== 'failed') {
+        if (job.status !== 'completed' && job.status !== 'failed' && job.status !== 'cancelled') {
             pollingRef.current = true;
             pollJobStatus(record.id, job.updated_at);
         }
@@ -169,7 +169,7 @@ const CopyrightList: React.FC = () => {
             }
             if (job) {
                 setProgress(mapJobToProgress(job));
-                if (job.status === 'completed' || job.status === 'failed') {
+                if (job.status === 'completed' || job.status === 'failed' || job.status === 'cancelled') {
                     pollingRef.current = false;
                     loadProjects();
                     return;
@@ -203,7 +203,7 @@ const CopyrightList: React.FC = () => {
         }
     };
 
-    const handleGenerate = async (project: CopyrightProject) => {
+    const handleGenerate = async (project: CopyrightProject, regenerate = false) => {
         if (!aiConfigured) {
             Modal.info({
                 title: '请先配置 AI',
@@ -215,7 +215,7 @@ const CopyrightList: React.FC = () => {
         }
         rateLimitShownRef.current = false;
         try {
-            const job = await startCopyrightGeneration(project.id);
+            const job = await startCopyrightGeneration(project.id, { useCache: !regenerate });
             setCurrentProjectId(project.id);
             setProgress(mapJobToProgress(job));
             setProgressOpen(true);
@@ -233,7 +233,7 @@ const CopyrightList: React.FC = () => {
             content: '当前任务可能已中断。重新生成会启动新的后台任务，旧任务进度将被忽略。',
             okText: '重新生成',
             cancelText: '取消',
-            onOk: () => handleGenerate(project),
+            onOk: () => handleGenerate(project, true),
         });
     };
 
@@ -5,7 +5,7 @@ import { useParams, history, useSearchParams, useModel } from '@umijs/max';
 import GenerationProgressDisplay, {
     GenerationProgress,
 } from '@/components/GenerationProgress';
-import { generateLessonPlanStream } from '@/services/lesson-plan';
+import { generateAllLessonPlansStream, generateLessonPlanStream } from '@/services/lesson-plan';
 import { getDocumentsByType, downloadDocument } from '@/services/document';
 import { getCourseDetail } from '@/services/course';
 
@@ -24,6 +24,10 @@ const LessonPlanGenerate: React.FC = () => {
     const [teachingPlan, setTeachingPlan] = useState<any>(null);
     const [loadingCourse, setLoadingCourse] = useState(true);
     const [course, setCourse] = useState<any>(null);
+    const [batchResult, setBatchResult] = useState<{
+        succeeded: { sequence: number; document_id: number }[];
+        failed: { sequence: number; error: string }[];
+    } | null>(null);
     const aiConfigured =
         Boolean(initialState?.currentUser?.has_api_key) &&
         Boolean(initialState?.currentUser?.ai_base_url);
@@ -62,12 +66,18 @@ const LessonPlanGenerate: React.FC = () => {
         }
     };
 
-    const confirmOverwrite = async (sequence: number): Promise<boolean> => {
+    /**
+     * 同课次已有教案时确认覆盖
+     * 返回 'regenerate' 表示覆盖已有教案（跳过生成缓存），'cancel' 表示取消
+     */
+    const confirmOverwrite = async (
+        sequence: number,
+    ): Promise<'generate' | 'regenerate' | 'cancel'> => {
         try {
             const docs = await getDocumentsByType(Number(courseId), 'lesson');
             const existing = docs.find((doc) => doc.lesson_number === sequence);
             if (!existing) {
-                return true;
+                return 'generate';
             }
 
             return await new Promise((resolve) => {
@@ -79,13 +89,14 @@ const LessonPlanGenerate: React.FC = () => {
                         : '是否覆盖该教案？',
                     okText: '覆盖',
                     cancelText: '取消',
-                    onOk: () => resolve(true),
-                    onCancel: () => resolve(false),
+                    // 文件丢失时只是补回文件，仍可使用缓存
+                    onOk: () => resolve(missingFile ? 'generate' : 'regenerate'),
+                    onCancel: () => resolve('cancel'),
                 });
             });
         } catch (error) {
             message.error('检查已有教案失败');
-            return false;
+            return 'cancel';
         }
     };
 
@@ -102,10 +113,13 @@ const LessonPlanGenerate: React.FC = () => {
         }
     };
 
-    const handleGenerate = async () => {
+    /**
+     * 生成前检查课程类型、AI 配置与授课计划，不满足时提示并返回 false
+     */
+    const checkPrerequisites = () => {
         if (course?.course_type === 'C') {
             message.error('C类课程教案暂未开发，请自行上传教案');
-            return;
+            return false;
         }
         if (!aiConfigured) {
             Modal.info({
@@ -114,21 +128,28 @@ const LessonPlanGenerate: React.FC = () => {
                 okText: '前往配置',
                 onOk: () => history.push('/profile'),
             });
-            return;
+            return false;
         }
         if (teachingPlan && !teachingPlan.content) {
             message.error('当前授课计划为上传文档，无法生成教案，请使用系统生成授课计划');
-            return;
+            return false;
         }
         if (!teachingPlan) {
             message.error('请先创建授课计划');
+            return false;
+        }
+        return true;
+    };
+
+    const handleGenerate = async () => {
+        if (!checkPrerequisites()) {
             return;
         }
 
         try {
             const values = await form.validateFields();
-            const canProceed = await confirmOverwrite(values.sequence);
-            if (!canProceed) {
+            const decision = await confirmOverwrite(values.sequence);
+            if (decision === 'cancel') {
                 return;
             }
             setGenerating(true);
@@ -156,6 +177,7 @@ const LessonPlanGenerate: React.FC = () => {
                         );
                     }
                 },
+                { prefetchNext: true, useCache: decision !== 'regenerate' },
             );
         } catch (error) {
             message.error('生成失败：' + (error as Error).message);
@@ -163,6 +185,63 @@ const LessonPlanGenerate: React.FC = () => {
         }
     };
 
+    /**
+     * 按授课计划批量生成全部课次的教案，已有教案的课次跳过
+     */
+    const runBatchGenerate = async () => {
+        setGenerating(true);
+        setDocumentId(null);
+        setBatchResult(null);
+        setProgress({ stage: 'preparing', progress: 0, message: '正在建立连接...' });
+        try {
+            await generateAllLessonPlansStream(
+                Number(courseId),
+                (data: any) => {
+                    setProgress({
+                        stage: data.stage === 'parsing' ? 'analyzing' : data.stage,
+                        progress: data.progress,
+                        message: data.message,
+                    });
+                    if (data.lesson_status === 'completed') {
+                        window.dispatchEvent(
+                            new CustomEvent('bzyagent:documents-refresh', {
+                                detail: { courseId: Number(courseId), docType: 'lesson' },
+                            })
+                        );
+                    }
+                    if (data.stage === 'completed') {
+                        setBatchResult({ succeeded: data.succeeded || [], failed: data.failed || [] });
+                        if (data.failed?.length) {
+                            message.warning(data.message);
+                        } else {
+                            message.success(data.message);
+                        }
+                    }
+                },
+                { skipExisting: true },
+            );
+        } catch (error) {
+            message.error('批量生成失败：' + (error as Error).message);
+        } finally {
+            setGenerating(false);
+        }
+    };
+
+    const handleBatchGenerate = () => {
+        if (!checkPrerequisites()) {
+            return;
+        }
+        Modal.confirm({
+            title: '批量生成全部教案',
+            content: '将按授课计划为每次课生成教案，已有教案的课次会跳过。生成过程中请勿关闭页面，是否继续？',
+            okText: '开始生成',
+            cancelText: '取消',
+            onOk: () => {
+                runBatchGenerate();
+            },
+        });
+    };
+
     const handleViewDocument = () => {
         if (documentId) {
             // 跳转到预览页面（后续实现）
@@ -311,12 +390,39 @@ const LessonPlanGenerate: React.FC = () => {
                                 >
                                     {generating ? '生成中...' : '开始生成教案'}
                                 </Button>
+                                <Button
+                                    size="large"
+                                    onClick={handleBatchGenerate}
+                                    disabled={generating || !aiConfigured}
+                                    style={{ marginLeft: 12 }}
+                                >
+                                    批量生成全部教案
+                                </Button>
                             </Form.Item>
                         </Form>
                     </Card>
                 )}
                 {progress && <GenerationProgressDisplay progress={progress} />}
 
+                {/* 批量生成结果 */}
+                {batchResult && batchResult.failed.length > 0 && (
+                    <Alert
+                        message={`${batchResult.failed.length} 份教案生成失败`}
+                        description={batchResult.failed
+                            .map((item) => `第 ${item.sequence} 次课：${item.error}`)
+                            .join('；')}
+                        type="warning"
+                        showIcon
+                    />
+                )}
+                {batchResult && (
+                    <Card>
+                        <Button type="primary" onClick={() => history.push(`/courses/${courseId}`)}>
+                            返回课程查看教案（新生成 {batchResult.succeeded.length} 份）
+                        </Button>
+                    </Card>
+                )}
+
                 {/* 操作按钮 */}
                 {documentId && (
                     <Card>
@@ -227,6 +227,8 @@ const TeachingPlanGenerate: React.FC = () => {
                         });
                     }
                 },
+                // 已有授课计划时为重新生成，跳过缓存
+                { useCache: !existingDoc },
             );
         } catch (error) {
             message.error('生成失败：' + (error as Error).message);
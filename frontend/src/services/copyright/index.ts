@@ -7,12 +7,19 @@ import { request } from '@umijs/max';
 export interface CopyrightJob {
     id: number;
     project_id: number;
-    status: 'queued' | 'running' | 'completed' | 'failed';
+    status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled';
     stage?: string;
     message?: string;
     progress?: number;
     error?: string;
     output_zip_path?: string;
+    stage_states?: Record<
+        string,
+        'pending' | 'running' | 'completed' | 'reused' | 'failed' | 'cancelled'
+    >;
+    priority?: 'interactive' | 'bulk';
+    queue_position?: number | null;
+    eta_seconds?: number | null;
     created_at: string;
     updated_at: string;
 }
@@ -97,8 +104,21 @@ export async function getLatestCopyrightJob(projectId: number) {
     return get<CopyrightJob>(`/api/copyright/projects/${projectId}/jobs/latest`);
 }
 
-export async function startCopyrightGeneration(projectId: number) {
-    return post<CopyrightJob>(`/api/copyright/projects/${projectId}/generate`, {});
+export async function startCopyrightGeneration(
+    projectId: number,
+    options: { useCache?: boolean } = {},
+) {
+    // 重新生成时跳过生成缓存，否则会直接得到上一次的结果
+    const query = options.useCache === false ? '?use_cache=false' : '';
+    return post<CopyrightJob>(`/api/copyright/projects/${projectId}/generate${query}`, {});
+}
+
+export async function resumeCopyrightGeneration(projectId: number) {
+    return post<CopyrightJob>(`/api/copyright/projects/${projectId}/resume`, {});
+}
+
+export async function cancelCopyrightJob(projectId: number, jobId: number) {
+    return post<CopyrightJob>(`/api/copyright/projects/${projectId}/jobs/${jobId}/cancel`, {});
 }
 
 export async function pollLatestCopyrightJob(
@@ -19,11 +19,20 @@ export async function generateLessonPlanStream(
     courseId: number,
     sequence: number,
     onProgress: (data: any) => void,
+    options: { prefetchNext?: boolean; useCache?: boolean } = {},
 ): Promise<void> {
     const token = localStorage.getItem('token');
     const queryParams = new URLSearchParams({
         sequence: String(sequence),
     });
+    if (options.prefetchNext) {
+        // 完成后在后台预生成下一次课的草稿
+        queryParams.append('prefetch_next', 'true');
+    }
+    if (options.useCache === false) {
+        // 重新生成时跳过生成缓存与预生成草稿
+        queryParams.append('use_cache', 'false');
+    }
     if (token) {
         queryParams.append('token', token);
     }
@@ -65,6 +74,61 @@ export async function generateLessonPlanStream(
     });
 }
 
+/**
+ * 批量生成课程全部教案（流式，带每个课次的进度）
+ */
+export async function generateAllLessonPlansStream(
+    courseId: number,
+    onProgress: (data: any) => void,
+    options: { concurrency?: number; skipExisting?: boolean } = {},
+): Promise<void> {
+    const token = localStorage.getItem('token');
+    const queryParams = new URLSearchParams();
+    if (options.concurrency) {
+        queryParams.append('concurrency', String(options.concurrency));
+    }
+    if (options.skipExisting) {
+        queryParams.append('skip_existing', 'true');
+    }
+    if (token) {
+        queryParams.append('token', token);
+    }
+    const baseUrl = resolveSseBaseUrl();
+    const url = `${baseUrl}/api/courses/${courseId}/generate-lesson-plans/stream?${queryParams}`;
+
+    const eventSource = new EventSource(url, {
+        withCredentials: true,
+    });
+
+    return new Promise((resolve, reject) => {
+        eventSource.onmessage = (event) => {
+            try {
+                const data = JSON.parse(event.data);
+                onProgress(data);
+
+                if (data.stage === 'completed' || data.stage === 'error') {
+                    eventSource.close();
+                    if (data.stage === 'error') {
+                        reject(new Error(data.message));
+                    } else {
+                        resolve();
+                    }
+                }
+            } catch (error) {
+                console.error('解析 SSE 数据失败:', error);
+                eventSource.close();
+                reject(error);
+            }
+        };
+
+        eventSource.onerror = (error) => {
+            console.error('SSE 连接错误:', error);
+            eventSource.close();
+            reject(error);
+        };
+    });
+}
+
 /**
  * 获取课程的教案列表
  */
@@ -27,6 +27,7 @@ export async function generateTeachingPlanStream(
         skip_slots: Array<{ week: number; class: number }>;
     },
     onProgress: (data: any) => void,
+    options: { useCache?: boolean } = {},
 ): Promise<void> {
     const queryParams = new URLSearchParams({
         teacher_name: params.teacher_name,
@@ -39,6 +40,10 @@ export async function generateTeachingPlanStream(
     if (params.skip_slots && params.skip_slots.length > 0) {
         queryParams.append('skip_slots', JSON.stringify(params.skip_slots));
     }
+    if (options.useCache === false) {
+        // 重新生成时跳过生成缓存
+        queryParams.append('use_cache', 'false');
+    }
 
     // 添加 token 到 URL（EventSource 不支持自定义 headers）
     const token = localStorage.getItem('token');